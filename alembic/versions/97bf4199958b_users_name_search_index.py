@@ -0,0 +1,31 @@
+"""users name search index
+
+Revision ID: 97bf4199958b
+Revises: bd274e994d47
+Create Date: 2026-10-19 11:53:05.886995
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '97bf4199958b'
+down_revision: Union[str, Sequence[str], None] = 'bd274e994d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Indice de expresion: autogenerate no lo detecta en SQLite
+    op.create_index(
+        "ix_users_name_lower", "users", [sa.text("lower(name)")], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_name_lower", table_name="users")
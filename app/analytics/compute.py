@@ -0,0 +1,168 @@
+"""
+Calculos vectorizados sobre un OrderFrame.
+
+Todo se resuelve con operaciones de NumPy sobre columnas completas (mascaras,
+`bincount`, `percentile`); ningun calculo itera por orden.
+"""
+
+import numpy as np
+
+from app.analytics.frame import OrderFrame
+
+SECONDS_PER_DAY = 86_400
+# 1970-01-01 fue jueves: con este corrimiento lunes = 0
+EPOCH_WEEKDAY = 3
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+def _cents(value) -> float:
+    return round(float(value) / 100, 2)
+
+
+def _billable_lines(frame: OrderFrame) -> tuple[np.ndarray, np.ndarray]:
+    """(posicion de orden, posicion de item) de las lineas que cuentan como venta."""
+    item_index = frame.line_item_index()
+    keep = (item_index >= 0) & frame.billable()[frame.line_order]
+    return frame.line_order[keep], item_index[keep]
+
+
+def hourly_heatmap(frame: OrderFrame) -> dict:
+    """Ordenes y facturacion por dia de semana (lunes = 0) y hora (UTC)."""
+    billable = frame.billable()
+    created_at = frame.created_at[billable]
+    totals = frame.total_cents[billable]
+
+    hour = (created_at // 3600) % 24
+    weekday = (created_at // SECONDS_PER_DAY + EPOCH_WEEKDAY) % 7
+    cell = weekday * 24 + hour
+
+    orders = np.bincount(cell, minlength=7 * 24).reshape(7, 24)
+    revenue = np.bincount(cell, weights=totals, minlength=7 * 24).reshape(7, 24)
+
+    return {
+        "orders": orders.tolist(),
+        "revenue": (revenue / 100).round(2).tolist(),
+    }
+
+
+def co_occurrence(frame: OrderFrame) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Matriz simetrica item x item con la cantidad de ordenes que contienen ambos,
+    la cantidad de ordenes por item y el total de ordenes con lineas.
+
+    Las lineas se ordenan por (orden, item); comparando cada linea con la que
+    esta `offset` posiciones despues se obtienen todos los pares de una orden
+    con tantas pasadas como items tiene la orden mas grande.
+    """
+    orders, items = _billable_lines(frame)
+    size = len(frame.item_ids)
+
+    order = np.lexsort((items, orders))
+    orders, items = orders[order], items[order]
+
+    pairs = np.zeros(size * size, dtype=np.int64)
+    offset = 1
+    while offset < len(orders):
+        same = orders[offset:] == orders[:-offset]
+        if not same.any():
+            break
+        first = items[:-offset][same]
+        second = items[offset:][same]
+        pairs += np.bincount(first * size + second, minlength=size * size)
+        offset += 1
+
+    matrix = pairs.reshape(size, size)
+    matrix = matrix + matrix.T
+    item_counts = np.bincount(items, minlength=size)
+    baskets = len(np.unique(orders))
+    return matrix, item_counts, baskets
+
+
+def basket_affinity(frame: OrderFrame, top: int = 20, min_pairs: int = 1) -> list:
+    """Pares de items que mas se piden juntos, con soporte, confianza y lift."""
+    matrix, item_counts, baskets = co_occurrence(frame)
+    if not baskets:
+        return []
+
+    first, second = np.triu_indices(len(item_counts), k=1)
+    together = matrix[first, second]
+    candidates = np.flatnonzero(together >= max(min_pairs, 1))
+    if not len(candidates):
+        return []
+
+    best = candidates[np.argsort(together[candidates])[::-1][:top]]
+    result = []
+    for position in best:
+        a, b = first[position], second[position]
+        count = int(together[position])
+        result.append(
+            {
+                "item_a": int(frame.item_ids[a]),
+                "item_a_name": frame.item_names[a],
+                "item_b": int(frame.item_ids[b]),
+                "item_b_name": frame.item_names[b],
+                "orders": count,
+                "support": round(count / baskets, 6),
+                "confidence_a_to_b": round(count / item_counts[a], 6),
+                "confidence_b_to_a": round(count / item_counts[b], 6),
+                "lift": round(count * baskets / (item_counts[a] * item_counts[b]), 4),
+            }
+        )
+    return result
+
+
+def order_percentiles(
+    frame: OrderFrame, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES
+) -> dict:
+    """Percentiles del total por orden y de la cantidad de items por orden."""
+    billable = frame.billable()
+    totals = frame.total_cents[billable]
+    basket_sizes = np.bincount(frame.line_order, minlength=frame.orders)[billable]
+
+    if not len(totals):
+        empty = {f"p{pct:g}": 0.0 for pct in percentiles}
+        return {"orders": 0, "total": empty, "items": empty}
+
+    total_values = np.percentile(totals, percentiles)
+    size_values = np.percentile(basket_sizes, percentiles)
+    return {
+        "orders": int(len(totals)),
+        "total": {
+            f"p{pct:g}": _cents(value)
+            for pct, value in zip(percentiles, total_values, strict=True)
+        },
+        "items": {
+            f"p{pct:g}": round(float(value), 2)
+            for pct, value in zip(percentiles, size_values, strict=True)
+        },
+    }
+
+
+def category_share(frame: OrderFrame) -> list:
+    """
+    Items vendidos y facturacion por categoria con su participacion sobre el
+    total. No hay costo por item, asi que se reporta la participacion en la
+    facturacion en lugar de un margen.
+    """
+    _, items = _billable_lines(frame)
+    size = len(frame.item_ids)
+    item_counts = np.bincount(items, minlength=size)
+    item_revenue = item_counts * frame.item_price_cents
+
+    categories = [category or "sin_categoria" for category in frame.item_categories]
+    names, codes = np.unique(np.array(categories, dtype=object), return_inverse=True)
+    counts = np.bincount(codes, weights=item_counts, minlength=len(names))
+    revenue = np.bincount(codes, weights=item_revenue, minlength=len(names))
+    total = revenue.sum()
+
+    order = np.argsort(revenue)[::-1]
+    return [
+        {
+            "category": str(names[i]),
+            "items": int(counts[i]),
+            "revenue": _cents(revenue[i]),
+            "share": round(float(revenue[i] / total), 6) if total else 0.0,
+        }
+        for i in order
+    ]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class HeatmapDTO(BaseModel):
+    date_from: date
+    date_to: date
+    orders: list[list[int]]
+    revenue: list[list[float]]
+
+
+class AffinityPairDTO(BaseModel):
+    item_a: int
+    item_a_name: str
+    item_b: int
+    item_b_name: str
+    orders: int
+    support: float
+    confidence_a_to_b: float
+    confidence_b_to_a: float
+    lift: float
+
+
+class PercentilesDTO(BaseModel):
+    date_from: date
+    date_to: date
+    orders: int
+    total: dict[str, float]
+    items: dict[str, float]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "date_from": "2025-10-01",
+                "date_to": "2025-10-31",
+                "orders": 52000,
+                "total": {"p50": 31.5, "p90": 58.0, "p95": 66.5, "p99": 81.0},
+                "items": {"p50": 3.0, "p90": 5.0, "p95": 5.0, "p99": 5.0},
+            }
+        }
+
+
+class CategoryShareDTO(BaseModel):
+    category: str
+    items: int
+    revenue: float
+    share: float
@@ -0,0 +1,220 @@
+"""
+Carga columnar del historial de ordenes para analitica.
+
+Una ventana de fechas se lee con tres consultas (ordenes activas y archivadas,
+lineas y menu) y se guarda como arrays de NumPy: ids, timestamps en segundos
+epoch (UTC), importes en centavos (int64, sin errores de redondeo de float) e
+ids de item. Las lineas referencian a su orden por posicion (`line_order`),
+asi los calculos se hacen con indexado y `bincount` en vez de recorrer
+objetos ORM.
+
+Las ventanas se cachean por (desde, hasta) con TTL; una ventana de un año
+ocupa unas decenas de MB.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+
+import numpy as np
+from sqlalchemy import BigInteger, case, cast, func, select
+
+from app.config import ANALYTICS_CACHE_SECONDS, ANALYTICS_CACHE_WINDOWS
+from app.config.cnx import engine
+from app.config.sql_models import MenuItem
+from app.config.types import OrderStatus
+from app.orders.archive import line_history, order_history
+from app.reports.services import date_range
+
+logger = logging.getLogger(__name__)
+
+STATUS_CODES = {status: code for code, status in enumerate(OrderStatus)}
+
+
+@dataclass(frozen=True)
+class OrderFrame:
+    date_from: date
+    date_to: date
+
+    # Una posicion por orden
+    order_id: np.ndarray
+    created_at: np.ndarray
+    waiter_id: np.ndarray
+    table_id: np.ndarray
+    status: np.ndarray
+    total_cents: np.ndarray
+
+    # Una posicion por linea orden/item
+    line_order: np.ndarray
+    line_item: np.ndarray
+
+    # Menu: item_id -> posicion en los arrays de abajo
+    item_ids: np.ndarray
+    item_names: list[str]
+    item_categories: list[str | None]
+    item_price_cents: np.ndarray
+
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def orders(self) -> int:
+        return len(self.order_id)
+
+    @property
+    def lines(self) -> int:
+        return len(self.line_item)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            value.nbytes
+            for value in vars(self).values()
+            if isinstance(value, np.ndarray)
+        )
+
+    def billable(self) -> np.ndarray:
+        """Mascara de ordenes que cuentan como venta."""
+        return self.status != STATUS_CODES[OrderStatus.CANCELED]
+
+    def line_item_index(self) -> np.ndarray:
+        """Posicion en el menu de cada linea (-1 si el item ya no existe)."""
+        if not len(self.item_ids):
+            return np.full(self.lines, -1)
+        index = np.searchsorted(self.item_ids, self.line_item)
+        index = index.clip(max=len(self.item_ids) - 1)
+        return np.where(self.item_ids[index] == self.line_item, index, -1)
+
+
+def _epoch(column):
+    if engine.dialect.name == "sqlite":
+        return cast(func.strftime("%s", column), BigInteger)
+    return cast(func.extract("epoch", column), BigInteger)
+
+
+def _cents(column):
+    return cast(func.round(column * 100), BigInteger)
+
+
+def _status_code(column):
+    return case(
+        *((column == status, code) for status, code in STATUS_CODES.items()),
+        else_=-1,
+    )
+
+
+def _int_matrix(rows: list, width: int) -> np.ndarray:
+    # fromiter sobre los valores aplanados evita que NumPy inspeccione cada Row
+    values = itertools.chain.from_iterable(rows)
+    return np.fromiter(values, dtype=np.int64, count=len(rows) * width).reshape(
+        -1, width
+    )
+
+
+def load_window(date_from: date, date_to: date) -> OrderFrame:
+    """Lee ordenes, lineas y menu de la ventana [date_from, date_to]."""
+    start, end = date_range(date_from, date_to)
+    orders = order_history(start, end)
+    lines = line_history(start, end)
+
+    orders_stmt = select(
+        orders.c.id,
+        _epoch(orders.c.created_at),
+        orders.c.waiter_id,
+        orders.c.table_id,
+        _status_code(orders.c.status),
+        _cents(orders.c.total),
+    ).order_by(orders.c.id)
+    lines_stmt = select(lines.c.order_id, lines.c.menu_item_id)
+    menu_stmt = select(
+        MenuItem.id, MenuItem.name, MenuItem.category, _cents(MenuItem.price)
+    ).order_by(MenuItem.id)
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        order_rows = _int_matrix(conn.execute(orders_stmt).all(), 6)
+        line_rows = _int_matrix(conn.execute(lines_stmt).all(), 2)
+        menu = conn.execute(menu_stmt).all()
+
+    order_id = order_rows[:, 0]
+
+    frame = OrderFrame(
+        date_from=date_from,
+        date_to=date_to,
+        order_id=order_id,
+        created_at=order_rows[:, 1],
+        waiter_id=order_rows[:, 2].astype(np.int32),
+        table_id=order_rows[:, 3].astype(np.int32),
+        status=order_rows[:, 4].astype(np.int8),
+        total_cents=order_rows[:, 5],
+        line_order=np.searchsorted(order_id, line_rows[:, 0]),
+        line_item=line_rows[:, 1].astype(np.int32),
+        item_ids=np.array([row[0] for row in menu], dtype=np.int32),
+        item_names=[row[1] for row in menu],
+        item_categories=[row[2] for row in menu],
+        item_price_cents=np.array([row[3] or 0 for row in menu], dtype=np.int64),
+    )
+    logger.info(
+        "Loaded analytics window %s..%s: %s orders, %s lines, %.1f MB in %.2fs",
+        date_from,
+        date_to,
+        frame.orders,
+        frame.lines,
+        frame.nbytes / 1e6,
+        time.perf_counter() - started,
+    )
+    return frame
+
+
+class FrameCache:
+    """Cache LRU de ventanas con TTL."""
+
+    def __init__(self, ttl: float, max_windows: int):
+        self.ttl = ttl
+        self.max_windows = max_windows
+        self._frames: OrderedDict[tuple[date, date], OrderFrame] = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: dict[tuple[date, date], threading.Lock] = {}
+
+    def get(self, date_from: date, date_to: date) -> OrderFrame:
+        key = (date_from, date_to)
+        frame = self._fresh(key)
+        if frame is not None:
+            return frame
+
+        # Un solo hilo carga cada ventana, el resto espera el resultado
+        with self._lock:
+            loading = self._loading.setdefault(key, threading.Lock())
+        with loading:
+            frame = self._fresh(key)
+            if frame is None:
+                frame = load_window(date_from, date_to)
+                with self._lock:
+                    self._frames[key] = frame
+                    self._frames.move_to_end(key)
+                    while len(self._frames) > self.max_windows:
+                        self._frames.popitem(last=False)
+            with self._lock:
+                self._loading.pop(key, None)
+        return frame
+
+    def _fresh(self, key) -> OrderFrame | None:
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                return None
+            if time.monotonic() - frame.loaded_at > self.ttl:
+                del self._frames[key]
+                return None
+            self._frames.move_to_end(key)
+            return frame
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+
+frame_cache = FrameCache(ANALYTICS_CACHE_SECONDS, ANALYTICS_CACHE_WINDOWS)
@@ -0,0 +1,85 @@
+from datetime import date
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.analytics.dto import (
+    AffinityPairDTO,
+    CategoryShareDTO,
+    HeatmapDTO,
+    PercentilesDTO,
+)
+from app.config.types import Roles
+from app.middlewares.security import role_required
+from app.reports.route import report_range
+
+analytics_router = APIRouter(
+    prefix="/analytics",
+    tags=["Analytics"],
+    dependencies=[Depends(role_required(Roles.ADMIN))],
+)
+
+# NumPy se importa recien en el primer request de analitica: el resto de los
+# workers no lo necesita y es lo mas pesado del arranque.
+
+
+@analytics_router.get(
+    "/heatmap",
+    response_model=HeatmapDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Weekday x hour heatmap",
+    description="Order count and revenue per weekday (Monday = 0) and hour, in UTC. Canceled orders are excluded.",
+)
+def get_heatmap(dates: tuple[date, date] = Depends(report_range)):
+    from app.analytics.compute import hourly_heatmap
+    from app.analytics.frame import frame_cache
+
+    frame = frame_cache.get(*dates)
+    return {"date_from": dates[0], "date_to": dates[1], **hourly_heatmap(frame)}
+
+
+@analytics_router.get(
+    "/affinity",
+    response_model=List[AffinityPairDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Basket affinity",
+    description="Menu item pairs most often ordered together, with support, confidence and lift.",
+)
+def get_affinity(
+    top: int = Query(20, ge=1, le=200),
+    min_pairs: int = Query(1, ge=1),
+    dates: tuple[date, date] = Depends(report_range),
+):
+    from app.analytics.compute import basket_affinity
+    from app.analytics.frame import frame_cache
+
+    return basket_affinity(frame_cache.get(*dates), top=top, min_pairs=min_pairs)
+
+
+@analytics_router.get(
+    "/percentiles",
+    response_model=PercentilesDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Order size percentiles",
+    description="Percentiles of the order total and of the number of items per order.",
+)
+def get_percentiles(dates: tuple[date, date] = Depends(report_range)):
+    from app.analytics.compute import order_percentiles
+    from app.analytics.frame import frame_cache
+
+    frame = frame_cache.get(*dates)
+    return {"date_from": dates[0], "date_to": dates[1], **order_percentiles(frame)}
+
+
+@analytics_router.get(
+    "/categories",
+    response_model=List[CategoryShareDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Revenue share by category",
+    description="Items sold, revenue at current prices and share of total revenue per menu category.",
+)
+def get_category_share(dates: tuple[date, date] = Depends(report_range)):
+    from app.analytics.compute import category_share
+    from app.analytics.frame import frame_cache
+
+    return category_share(frame_cache.get(*dates))
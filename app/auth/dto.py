@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -11,9 +13,18 @@ class UserLoginDTO(BaseModel):
         }
 
 
+class RefreshTokenDTO(BaseModel):
+    refresh_token: Optional[str] = None
+
+    class Config:
+        json_schema_extra = {"example": {"refresh_token": "q0c4M1t0...Qd8"}}
+
+
 class TokenDTO(BaseModel):
     access_token: str
     token_type: str
+    expires_in: int
+    refresh_token: str
     user_id: str
     user_email: str
     roles: list[str]
@@ -23,6 +34,8 @@ class TokenDTO(BaseModel):
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "token_type": "bearer",
+                "expires_in": 900,
+                "refresh_token": "q0c4M1t0...Qd8",
                 "user_id": "fb2e3fd3-12f2-4173-b9a2-ec57e4d39c36",
                 "user_email": "alice@example.com",
                 "roles": ["admin", "waiter"],
@@ -43,3 +56,72 @@ class UserTokenDataDTO(BaseModel):
                 "roles": ["admin", "waiter"],
             }
         }
+
+
+class PinLoginDTO(BaseModel):
+    device_id: int
+    device_secret: str
+    user_id: int
+    pin: str
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "device_id": 1,
+                "device_secret": "Vx3k9...p2Q",
+                "user_id": 2,
+                "pin": "4821",
+            }
+        }
+
+
+class PinTokenDTO(BaseModel):
+    access_token: str
+    token_type: str
+    expires_in: int
+    user_id: str
+    user_email: str
+    roles: list[str]
+    device_id: int
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                "token_type": "bearer",
+                "expires_in": 3600,
+                "user_id": "2",
+                "user_email": "bob@example.com",
+                "roles": ["waiter"],
+                "device_id": 1,
+            }
+        }
+
+
+class SetPinDTO(BaseModel):
+    pin: str
+
+    class Config:
+        json_schema_extra = {"example": {"pin": "4821"}}
+
+
+class DeviceCreateDTO(BaseModel):
+    name: str
+
+    class Config:
+        json_schema_extra = {"example": {"name": "Tablet salón 1"}}
+
+
+class DeviceRegisteredDTO(BaseModel):
+    device_id: int
+    name: str
+    device_secret: str
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "device_id": 1,
+                "name": "Tablet salón 1",
+                "device_secret": "Vx3k9...p2Q",
+            }
+        }
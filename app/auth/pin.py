@@ -0,0 +1,306 @@
+"""
+Cambio rapido de usuario con PIN en tablets compartidas.
+
+Un admin registra cada tablet y recibe una sola vez su secreto. Con ese
+secreto y el PIN del mesero la tablet obtiene un access token con alcance
+`device` (solo rutas de salon, ver DEVICE_SCOPE_PREFIXES), sin refresh token.
+
+El PIN y el secreto se guardan como HMAC-SHA256 con SECRET_KEY, no con
+bcrypt: el cambio de usuario no paga los cientos de ms del login. Un PIN tiene
+poca entropia, asi que lo que lo protege es otra cosa: hace falta el secreto
+de una tablet registrada, los fallos se cortan por tablet (PIN_MAX_FAILURES)
+y sin SECRET_KEY los hashes de la base no sirven para probar PINs.
+
+Secretos de tablets y PINs se cachean por proceso con TTL (PIN_CACHE_SECONDS).
+La sesion vigente de cada tablet (usuario, jti y vencimiento) se guarda en
+`devices`: un cambio de usuario la reemplaza con un UPDATE condicional sobre el
+jti anterior y revoca ese token, asi funciona igual con varios workers.
+"""
+
+import hashlib
+import hmac
+import logging
+import re
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import jwt
+from sqlalchemy import select, update
+
+from app.auth.revocation import revocation_list
+from app.auth.roles import role_cache
+from app.config import (
+    ALGORITHM,
+    PIN_CACHE_SECONDS,
+    PIN_TOKEN_EXPIRE_MINUTES,
+    SECRET_KEY,
+)
+from app.config.cnx import SessionLocal
+from app.config.sql_models import Device, StaffPin, User
+from app.config.types import Roles
+from app.middlewares.auth import DEVICE_SCOPE, create_access_token
+
+logger = logging.getLogger(__name__)
+
+PIN_PATTERN = re.compile(r"\d{4,8}")
+
+
+class PinError(ValueError):
+    """Tablet desconocida o revocada, o PIN incorrecto."""
+
+
+def _keyed_hash(kind: str, value: str) -> str:
+    message = f"{kind}:{value}".encode("utf-8")
+    return hmac.new(SECRET_KEY, message, hashlib.sha256).hexdigest()
+
+
+def hash_pin(user_id: int, pin: str) -> str:
+    # Con el user_id adentro, dos usuarios con el mismo PIN no comparten hash
+    return _keyed_hash("pin", f"{user_id}:{pin}")
+
+
+def hash_device_secret(secret: str) -> str:
+    return _keyed_hash("device", secret)
+
+
+# Reintentos si otro worker cambia la misma tablet al mismo tiempo
+SWITCH_ATTEMPTS = 3
+
+
+@dataclass
+class DeviceSession:
+    user_id: int
+    jti: str
+    expires_at: datetime
+
+
+def _active_session(db, device_id: int) -> DeviceSession | None:
+    row = db.execute(
+        select(Device.active_user_id, Device.active_jti, Device.active_expires_at)
+        .where(Device.id == device_id)
+    ).first()
+    if row is None or row.active_jti is None:
+        return None
+    return DeviceSession(row.active_user_id, row.active_jti, row.active_expires_at)
+
+
+def _claim_device(device_id: int, session: DeviceSession) -> DeviceSession | None:
+    """
+    Deja `session` como la vigente de la tablet y retorna la anterior. Lanza
+    PinError si la tablet se dio de baja o la cambian demasiados a la vez.
+    """
+    with SessionLocal() as db:
+        for _ in range(SWITCH_ATTEMPTS):
+            previous = _active_session(db, device_id)
+            claimed = db.execute(
+                update(Device)
+                .where(
+                    Device.id == device_id,
+                    Device.revoked_at.is_(None),
+                    Device.active_jti.is_not_distinct_from(
+                        previous.jti if previous else None
+                    ),
+                )
+                .values(
+                    active_user_id=session.user_id,
+                    active_jti=session.jti,
+                    active_expires_at=session.expires_at,
+                )
+            ).rowcount
+            db.commit()
+            if claimed:
+                return previous
+            device = db.execute(
+                select(Device.revoked_at).where(Device.id == device_id)
+            ).first()
+            if device is None or device.revoked_at is not None:
+                raise PinError("Dispositivo no registrado")
+    raise PinError("Dispositivo ocupado, reintente")
+
+
+class DeviceSessions:
+    """Cache de secretos de tablets y PINs; las sesiones viven en `devices`."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # device_id -> (secret_hash, cargado en)
+        self._devices: dict[int, tuple[str, float]] = {}
+        # user_id -> (pin_hash, email, cargado en)
+        self._pins: dict[int, tuple[str, str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _device_hash(self, device_id: int) -> str | None:
+        entry = self._devices.get(device_id)
+        if entry is not None and time.monotonic() - entry[1] <= self.ttl:
+            return entry[0]
+
+        with SessionLocal() as db:
+            secret_hash = db.execute(
+                select(Device.secret_hash).where(
+                    Device.id == device_id, Device.revoked_at.is_(None)
+                )
+            ).scalar_one_or_none()
+        with self._lock:
+            if secret_hash is None:
+                self._devices.pop(device_id, None)
+            else:
+                self._devices[device_id] = (secret_hash, time.monotonic())
+        return secret_hash
+
+    def _pin(self, user_id: int) -> tuple[str, str] | None:
+        entry = self._pins.get(user_id)
+        if entry is not None and time.monotonic() - entry[2] <= self.ttl:
+            return entry[0], entry[1]
+
+        with SessionLocal() as db:
+            row = db.execute(
+                select(StaffPin.pin_hash, User.email)
+                .join(User, User.id == StaffPin.user_id)
+                .where(StaffPin.user_id == user_id, User.deleted_at.is_(None))
+            ).first()
+        with self._lock:
+            if row is None:
+                self._pins.pop(user_id, None)
+                return None
+            self._pins[user_id] = (row[0], row[1], time.monotonic())
+        return row[0], row[1]
+
+    def verify_device(self, device_id: int, device_secret: str):
+        """Lanza PinError si la tablet no existe, esta revocada o el secreto no es."""
+        secret_hash = self._device_hash(device_id)
+        if secret_hash is None or not hmac.compare_digest(
+            secret_hash, hash_device_secret(device_secret)
+        ):
+            raise PinError("Dispositivo no registrado")
+
+    def switch(self, device_id: int, device_secret: str, user_id: int, pin: str):
+        """
+        Valida tablet y PIN y emite el token de la nueva sesion. Revoca el
+        token de quien tenia la tablet antes. Lanza PinError si algo no cierra.
+        """
+        self.verify_device(device_id, device_secret)
+
+        stored = self._pin(user_id)
+        if stored is None or not hmac.compare_digest(
+            stored[0], hash_pin(user_id, pin)
+        ):
+            raise PinError("PIN inválido")
+        email = stored[1]
+
+        # Un token de tablet nunca lleva permisos de admin
+        roles = [role for role in role_cache.get(user_id) if role != Roles.ADMIN]
+        if not roles:
+            raise PinError("El usuario no tiene roles de salón")
+
+        expires_delta = timedelta(minutes=PIN_TOKEN_EXPIRE_MINUTES)
+        access_token = create_access_token(
+            data={
+                "sub": email,
+                "user_id": str(user_id),
+                "roles": roles,
+                "scope": DEVICE_SCOPE,
+                "device_id": device_id,
+            },
+            expires_delta=expires_delta,
+        )
+        payload = jwt.decode(access_token, SECRET_KEY, algorithms=[ALGORITHM])
+
+        session = DeviceSession(
+            user_id=user_id,
+            jti=payload["jti"],
+            expires_at=datetime.fromtimestamp(payload["exp"], timezone.utc),
+        )
+        previous = _claim_device(device_id, session)
+        if previous is not None:
+            revocation_list.revoke(
+                previous.jti, previous.expires_at, previous.user_id
+            )
+
+        return {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "expires_in": int(expires_delta.total_seconds()),
+            "user_id": str(user_id),
+            "user_email": email,
+            "roles": roles,
+            "device_id": device_id,
+        }
+
+    def ended(self, device_id: int, jti: str):
+        """Logout desde la tablet: libera la sesion si sigue siendo esa."""
+        with SessionLocal() as db:
+            db.execute(
+                update(Device)
+                .where(Device.id == device_id, Device.active_jti == jti)
+                .values(active_user_id=None, active_jti=None, active_expires_at=None)
+            )
+            db.commit()
+
+    def invalidate_pin(self, user_id: int):
+        with self._lock:
+            self._pins.pop(user_id, None)
+
+    def invalidate_device(self, device_id: int):
+        with self._lock:
+            self._devices.pop(device_id, None)
+
+
+device_sessions = DeviceSessions(PIN_CACHE_SECONDS)
+
+
+def register_device(name: str, created_by: int | None = None) -> tuple[Device, str]:
+    """Registra una tablet. El secreto en claro solo se retorna aca."""
+    secret = secrets.token_urlsafe(32)
+    with SessionLocal() as db:
+        device = Device(
+            name=name,
+            secret_hash=hash_device_secret(secret),
+            created_by=created_by,
+        )
+        db.add(device)
+        db.commit()
+        db.refresh(device)
+    logger.info("Registered device %s (%s)", device.id, name)
+    return device, secret
+
+
+def revoke_device(device_id: int) -> bool:
+    """Da de baja una tablet y revoca su sesion activa."""
+    with SessionLocal() as db:
+        session = _active_session(db, device_id)
+        revoked = db.execute(
+            update(Device)
+            .where(Device.id == device_id, Device.revoked_at.is_(None))
+            .values(
+                revoked_at=datetime.now(timezone.utc),
+                active_user_id=None,
+                active_jti=None,
+                active_expires_at=None,
+            )
+        ).rowcount
+        db.commit()
+
+    device_sessions.invalidate_device(device_id)
+    if session is not None:
+        revocation_list.revoke(session.jti, session.expires_at, session.user_id)
+    if revoked:
+        logger.info("Revoked device %s", device_id)
+    return bool(revoked)
+
+
+def set_pin(user_id: int, pin: str):
+    """Crea o cambia el PIN del usuario. Lanza ValueError si no es valido."""
+    if not PIN_PATTERN.fullmatch(pin):
+        raise ValueError("El PIN debe tener entre 4 y 8 dígitos")
+
+    with SessionLocal() as db:
+        stored = db.get(StaffPin, user_id)
+        if stored is None:
+            db.add(StaffPin(user_id=user_id, pin_hash=hash_pin(user_id, pin)))
+        else:
+            stored.pin_hash = hash_pin(user_id, pin)
+        db.commit()
+    device_sessions.invalidate_pin(user_id)
@@ -0,0 +1,136 @@
+"""
+Refresh tokens rotativos.
+
+El login entrega un access token corto y un refresh token opaco. En la base
+solo queda el HMAC-SHA256 del refresh (con SECRET_KEY): es un valor aleatorio
+de 256 bits, asi que no hace falta un hash lento como bcrypt y validarlo cuesta
+microsegundos.
+
+Cada refresh marca el token como usado y entrega uno nuevo de la misma
+familia. Si llega un token ya usado o revocado alguien lo copio: se revoca toda
+la familia y el dispositivo tiene que volver a hacer login.
+"""
+
+import hashlib
+import hmac
+import logging
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, update
+
+from app.config import REFRESH_TOKEN_EXPIRE_DAYS, SECRET_KEY
+from app.config.cnx import SessionLocal
+from app.config.sql_models import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenError(ValueError):
+    """Refresh token inexistente, vencido, revocado o reutilizado."""
+
+
+def hash_refresh_token(token: str) -> str:
+    return hmac.new(SECRET_KEY, token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _create(db, user_id: int, family_id: str, now: datetime) -> str:
+    token = secrets.token_urlsafe(32)
+    db.add(
+        RefreshToken(
+            token_hash=hash_refresh_token(token),
+            family_id=family_id,
+            user_id=user_id,
+            expires_at=now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+            created_at=now,
+        )
+    )
+    return token
+
+
+def issue_refresh_token(user_id: int) -> str:
+    """Refresh token de una familia nueva (un login)."""
+    with SessionLocal() as db:
+        token = _create(db, user_id, uuid.uuid4().hex, datetime.now(timezone.utc))
+        db.commit()
+    return token
+
+
+def _revoke_family(db, family_id: str, now: datetime):
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+
+
+def rotate_refresh_token(token: str) -> tuple[int, str]:
+    """
+    Consume un refresh token y retorna (user_id, nuevo refresh token).
+    Lanza RefreshTokenError si no es valido; si fue reutilizado, ademas
+    revoca la familia.
+    """
+    now = datetime.now(timezone.utc)
+    with SessionLocal() as db:
+        stored = db.execute(
+            select(RefreshToken).where(
+                RefreshToken.token_hash == hash_refresh_token(token)
+            )
+        ).scalar_one_or_none()
+        if stored is None:
+            raise RefreshTokenError("Refresh token inválido")
+
+        if stored.used_at is not None or stored.revoked_at is not None:
+            _revoke_family(db, stored.family_id, now)
+            db.commit()
+            logger.warning(
+                "Refresh token reuse for user %s, family %s revoked",
+                stored.user_id,
+                stored.family_id,
+            )
+            raise RefreshTokenError("Refresh token reutilizado")
+
+        if stored.expires_at.replace(tzinfo=timezone.utc) < now:
+            raise RefreshTokenError("Refresh token expirado")
+
+        # Solo un refresh concurrente puede ganar la rotacion
+        claimed = db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == stored.id, RefreshToken.used_at.is_(None))
+            .values(used_at=now)
+        ).rowcount
+        if not claimed:
+            db.rollback()
+            raise RefreshTokenError("Refresh token reutilizado")
+
+        new_token = _create(db, stored.user_id, stored.family_id, now)
+        db.commit()
+        return stored.user_id, new_token
+
+
+def revoke_refresh_token(token: str) -> bool:
+    """Revoca la familia del token (logout). Retorna False si no existe."""
+    with SessionLocal() as db:
+        family_id = db.execute(
+            select(RefreshToken.family_id).where(
+                RefreshToken.token_hash == hash_refresh_token(token)
+            )
+        ).scalar_one_or_none()
+        if family_id is None:
+            return False
+        _revoke_family(db, family_id, datetime.now(timezone.utc))
+        db.commit()
+    return True
+
+
+def prune_refresh_tokens() -> int:
+    """Borra los refresh tokens vencidos."""
+    with SessionLocal() as db:
+        result = db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.expires_at < datetime.now(timezone.utc)
+            )
+        )
+        db.commit()
+    return result.rowcount
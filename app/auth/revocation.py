@@ -0,0 +1,203 @@
+"""
+Revocacion de access tokens por `jti`.
+
+La lista vive en `revoked_tokens`. Cada worker guarda un filtro de Bloom con
+los jti revocados y vigentes: si el filtro dice que no, el token no esta
+revocado y no se consulta la base (el caso de casi todas las requests). Si
+dice que tal vez, se confirma con una busqueda por indice.
+
+Un hilo por proceso trae las revocaciones nuevas cada REVOCATION_SYNC_SECONDS
+(por `id` creciente) y de vez en cuando borra las ya vencidas, junto con los
+refresh tokens vencidos. Una revocacion hecha en otro worker tarda como mucho
+ese intervalo en verse aca; las de este mismo proceso se ven en el acto.
+"""
+
+import hashlib
+import logging
+import math
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, exists, func, insert, select
+
+from app.auth.refresh import prune_refresh_tokens
+from app.config import (
+    REVOCATION_BLOOM_CAPACITY,
+    REVOCATION_BLOOM_ERROR_RATE,
+    REVOCATION_SYNC_SECONDS,
+)
+from app.config.cnx import SessionLocal
+from app.config.sql_models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+# Vueltas del hilo de sync entre podas de tokens vencidos
+PRUNE_EVERY = 1800
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(
+            8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        # Doble hashing (Kirsch-Mitzenmacher) sobre un solo digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class RevocationList:
+    def __init__(
+        self,
+        capacity: int = REVOCATION_BLOOM_CAPACITY,
+        error_rate: float = REVOCATION_BLOOM_ERROR_RATE,
+        sync_seconds: float = REVOCATION_SYNC_SECONDS,
+    ):
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._last_id = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def might_be_revoked(self, jti: str | None) -> bool:
+        """Camino rapido: False asegura que el token no esta revocado."""
+        return jti is not None and jti in self._bloom
+
+    def is_revoked(self, jti: str) -> bool:
+        """Confirmacion contra la base para los positivos del filtro."""
+        with SessionLocal() as db:
+            return db.execute(
+                select(exists().where(RevokedToken.jti == jti))
+            ).scalar()
+
+    def revoke(self, jti: str, expires_at: datetime, user_id: int | None = None):
+        with SessionLocal() as db:
+            already = db.execute(
+                select(exists().where(RevokedToken.jti == jti))
+            ).scalar()
+            if not already:
+                db.execute(
+                    insert(RevokedToken).values(
+                        jti=jti,
+                        user_id=user_id,
+                        expires_at=expires_at,
+                        revoked_at=datetime.now(timezone.utc),
+                    )
+                )
+                db.commit()
+        with self._lock:
+            self._bloom.add(jti)
+        logger.info("Revoked token %s (user %s)", jti, user_id)
+
+    def sync(self) -> int:
+        """Agrega al filtro las revocaciones nuevas. Retorna cuantas."""
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(RevokedToken.id, RevokedToken.jti)
+                .where(RevokedToken.id > self._last_id)
+                .order_by(RevokedToken.id)
+            ).all()
+        if not rows:
+            return 0
+
+        with self._lock:
+            if self._bloom.count + len(rows) > self._bloom.capacity:
+                self._rebuild(self._bloom.capacity * 2)
+            else:
+                for _, jti in rows:
+                    self._bloom.add(jti)
+                self._last_id = max(self._last_id, rows[-1][0])
+        return len(rows)
+
+    def _rebuild(self, capacity: int):
+        """Filtro nuevo solo con los tokens vigentes (se llama con el lock)."""
+        now = datetime.now(timezone.utc)
+        with SessionLocal() as db:
+            last_id = db.execute(select(func.max(RevokedToken.id))).scalar() or 0
+            jtis = (
+                db.execute(
+                    select(RevokedToken.jti).where(
+                        RevokedToken.expires_at > now, RevokedToken.id <= last_id
+                    )
+                )
+                .scalars()
+                .all()
+            )
+        bloom = BloomFilter(max(capacity, len(jtis) * 2), self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._last_id = last_id
+        logger.info(
+            "Revocation filter rebuilt: %s tokens, %s KB",
+            len(jtis),
+            len(bloom._bits) // 1024,
+        )
+
+    def load(self):
+        with self._lock:
+            self._rebuild(self._bloom.capacity)
+
+    def prune(self) -> int:
+        """Borra las revocaciones de tokens que ya vencieron solos."""
+        with SessionLocal() as db:
+            result = db.execute(
+                delete(RevokedToken).where(
+                    RevokedToken.expires_at < datetime.now(timezone.utc)
+                )
+            )
+            db.commit()
+        return result.rowcount
+
+    def run_forever(self):
+        loops = 0
+        while not self._stop.wait(self.sync_seconds):
+            try:
+                self.sync()
+                loops += 1
+                if loops % PRUNE_EVERY == 0:
+                    self.prune()
+                    prune_refresh_tokens()
+            except Exception:
+                logger.exception("Revocation sync failed")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.load()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run_forever, name="revocation-sync", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+revocation_list = RevocationList()
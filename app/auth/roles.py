@@ -0,0 +1,74 @@
+"""
+Roles de cada usuario, leidos de `user_roles` y cacheados por proceso.
+
+Login, refresh, `/auth/me` y `role_required` toman los roles de aca y no de
+los perfiles del usuario: sin cache es una sola busqueda por la clave
+primaria de `user_roles`, con cache no toca la base. Como `role_required`
+consulta el cache y no el token, un cambio de roles se ve sin esperar a que
+venza el access token: en el acto en el proceso que lo hizo (make_user_role
+invalida la entrada) y en los demas workers cuando vence ROLE_CACHE_SECONDS.
+"""
+
+import threading
+import time
+
+from sqlalchemy import select
+
+from app.config import ROLE_CACHE_SECONDS
+from app.config.cnx import SessionLocal
+from app.config.sql_models import UserRole
+from app.config.types import Roles
+
+# Mismo orden que armaba el login a partir de los perfiles
+ROLE_ORDER = (Roles.CASHIER, Roles.COOK, Roles.WAITER, Roles.ADMIN)
+
+
+def load_roles(user_id: int) -> tuple[Roles, ...]:
+    with SessionLocal() as db:
+        found = set(
+            db.execute(select(UserRole.role).where(UserRole.user_id == user_id))
+            .scalars()
+            .all()
+        )
+    return tuple(role for role in ROLE_ORDER if role in found)
+
+
+class RoleCache:
+    """user_id -> roles, con TTL por entrada."""
+
+    def __init__(self, ttl: float, max_entries: int = 50_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # user_id -> (roles, cargado en)
+        self._entries: dict[int, tuple[tuple[Roles, ...], float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> tuple[Roles, ...]:
+        entry = self._entries.get(user_id)
+        now = time.monotonic()
+        if entry is not None and now - entry[1] <= self.ttl:
+            return entry[0]
+
+        roles = load_roles(user_id)
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._prune(now)
+            self._entries[user_id] = (roles, now)
+        return roles
+
+    def _prune(self, now: float):
+        stale = [k for k, (_, at) in self._entries.items() if now - at > self.ttl]
+        for user_id in stale:
+            del self._entries[user_id]
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+
+    def invalidate(self, user_id: int | None = None):
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+role_cache = RoleCache(ROLE_CACHE_SECONDS)
@@ -1,17 +1,44 @@
 import logging
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.auth.dto import TokenDTO, UserLoginDTO, UserTokenDataDTO
-from app.auth.services import login_user
-from app.middlewares.security import get_current_user_token
+from app.auth.dto import (
+    DeviceCreateDTO,
+    DeviceRegisteredDTO,
+    PinLoginDTO,
+    PinTokenDTO,
+    RefreshTokenDTO,
+    SetPinDTO,
+    TokenDTO,
+    UserLoginDTO,
+    UserTokenDataDTO,
+)
+from app.auth.pin import (
+    PinError,
+    device_sessions,
+    register_device,
+    revoke_device,
+    set_pin,
+)
+from app.auth.refresh import RefreshTokenError, revoke_refresh_token
+from app.auth.revocation import revocation_list
+from app.auth.roles import role_cache
+from app.auth.services import login_user, refresh_session
+from app.auth.throttle import login_throttle, retry_after_header
+from app.config import ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
+from app.config.types import Roles
+from app.middlewares.auth import DEVICE_SCOPE
+from app.middlewares.security import get_current_user_token, role_required
 from app.resto.services import get_employee_by_id
 
 logger = logging.getLogger(__name__)
 
 auth_router = APIRouter(prefix="/auth", tags=["Auth"])
 
+REFRESH_COOKIE = "RESTORefreshToken"
+
 
 @auth_router.get(
     "/me",
@@ -31,7 +58,8 @@ def get_current_user_profile(current_user: dict = Depends(get_current_user_token
                 status_code=status.HTTP_404_NOT_FOUND, detail="Usuario no encontrado"
             )
 
-        return current_user
+        # Roles vigentes, aunque el token se haya emitido con otros
+        return {**current_user, "roles": list(role_cache.get(user.id))}
 
     except HTTPException:
         raise
@@ -51,28 +79,54 @@ def get_current_user_profile(current_user: dict = Depends(get_current_user_token
         ) from error
 
 
+def _set_session_cookies(response: Response, token_data: dict):
+    response.set_cookie(
+        key="RESTOApiToken",
+        value=token_data["access_token"],
+        httponly=True,
+        secure=False,
+        path="/",
+        samesite="lax",
+        max_age=int(ACCESS_TOKEN_EXPIRE_MINUTES * 60),
+        domain="localhost",
+    )
+    # Solo viaja a /api/auth: el resto de las rutas no lo necesita
+    response.set_cookie(
+        key=REFRESH_COOKIE,
+        value=token_data["refresh_token"],
+        httponly=True,
+        secure=False,
+        path="/api/auth",
+        samesite="strict",
+        max_age=REFRESH_TOKEN_EXPIRE_DAYS * 86400,
+        domain="localhost",
+    )
+
+
 @auth_router.post(
     "/login",
     response_model=TokenDTO,
     status_code=status.HTTP_200_OK,
     summary="User login",
-    description="Authenticate a user and issue a JWT token. Public route, no authentication required",
+    description="Authenticate a user and issue a JWT token. Public route, no authentication required. Attempts are rate limited per IP and per email (429 with Retry-After)",
+    responses={429: {"description": "Too many login attempts"}},
 )
 def login_endpoint(response: Response, login_data: UserLoginDTO):
     """Login de usuario - SIN middleware (acceso público)"""
+    # La IP ya se limito en LoginThrottleMiddleware
+    wait = login_throttle.check_email(login_data.email)
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Demasiados intentos de login para este usuario",
+            headers=retry_after_header(wait),
+        )
+
     try:
         token_data = login_user(login_data.email, login_data.password)
+        login_throttle.succeeded(login_data.email)
 
-        response.set_cookie(
-            key="RESTOApiToken",
-            value=token_data["access_token"],
-            httponly=True,
-            secure=False,
-            path="/",
-            samesite="lax",
-            max_age=3600,
-            domain="localhost",
-        )
+        _set_session_cookies(response, token_data)
 
         return token_data
 
@@ -89,13 +143,159 @@ def login_endpoint(response: Response, login_data: UserLoginDTO):
         ) from e
 
 
+@auth_router.post(
+    "/refresh",
+    response_model=TokenDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Refresh session",
+    description="Exchange a refresh token (body or HTTP-only cookie) for a new access token and a new refresh token. The used refresh token is invalidated; presenting it again revokes the whole session. Public route, no password check",
+)
+def refresh_endpoint(
+    request: Request, response: Response, data: RefreshTokenDTO | None = None
+):
+    refresh_token = (data and data.refresh_token) or request.cookies.get(
+        REFRESH_COOKIE
+    )
+    if not refresh_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token requerido",
+        )
+
+    try:
+        token_data = refresh_session(refresh_token)
+    except RefreshTokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e)
+        ) from e
+
+    _set_session_cookies(response, token_data)
+    return token_data
+
+
+@auth_router.post(
+    "/pin",
+    response_model=PinTokenDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Switch user on a shared device",
+    description="Exchange a registered device secret plus a staff PIN for a short, device-scoped access token (floor routes only, no refresh token). The previous session of the device is revoked. Attempts are rate limited per IP, and failed PINs per device once its secret is accepted (429 with Retry-After)",
+    responses={429: {"description": "Too many failed PIN attempts"}},
+)
+def pin_login_endpoint(data: PinLoginDTO):
+    # La IP ya se limito en LoginThrottleMiddleware. El contador de la tablet
+    # solo corre con su secreto: si no, cualquiera podria bloquearla por id
+    try:
+        device_sessions.verify_device(data.device_id, data.device_secret)
+    except PinError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e)
+        ) from e
+
+    wait = login_throttle.check_device(data.device_id)
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Demasiados intentos de PIN en este dispositivo",
+            headers=retry_after_header(wait),
+        )
+
+    try:
+        token_data = device_sessions.switch(
+            data.device_id, data.device_secret, data.user_id, data.pin
+        )
+    except PinError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e)
+        ) from e
+
+    login_throttle.device_succeeded(data.device_id)
+    return token_data
+
+
+@auth_router.put(
+    "/pin",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Set own PIN",
+    description="Create or change the PIN (4 to 8 digits) the current user types on shared devices. Requires a regular login, not a device token",
+)
+def set_pin_endpoint(data: SetPinDTO, request: Request):
+    payload = getattr(request.state, "user", None) or {}
+    if payload.get("scope") == DEVICE_SCOPE:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="El PIN se cambia con un login completo",
+        )
+
+    try:
+        set_pin(int(payload["user_id"]), data.pin)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+
+@auth_router.post(
+    "/devices",
+    response_model=DeviceRegisteredDTO,
+    status_code=status.HTTP_201_CREATED,
+    summary="Register a shared device",
+    description="Admin only. Registers a tablet for PIN switching. The device secret is returned only in this response",
+)
+def register_device_endpoint(
+    data: DeviceCreateDTO, token=Depends(role_required(Roles.ADMIN))
+):
+    device, secret = register_device(data.name, int(token["user_id"]))
+    return {"device_id": device.id, "name": device.name, "device_secret": secret}
+
+
+@auth_router.delete(
+    "/devices/{device_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Revoke a shared device",
+    description="Admin only. The device can no longer switch users and its current session is revoked",
+)
+def revoke_device_endpoint(device_id: int, _=Depends(role_required(Roles.ADMIN))):
+    if not revoke_device(device_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dispositivo no encontrado",
+        )
+
+
 @auth_router.post(
     "/logout",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="User logout",
-    description="Invalidate the current user session by deleting the HTTP-only JWT cookie",
+    description="Revoke the current access token and its refresh token server-side and delete the HTTP-only cookies",
 )
-def logout_user(response: Response):
+def logout_user(
+    request: Request, response: Response, data: RefreshTokenDTO | None = None
+):
+    payload = getattr(request.state, "user", None) or {}
+    if payload.get("jti") and payload.get("exp"):
+        revocation_list.revoke(
+            payload["jti"],
+            datetime.fromtimestamp(payload["exp"], timezone.utc),
+            int(payload["user_id"]) if payload.get("user_id") else None,
+        )
+        if payload.get("scope") == DEVICE_SCOPE:
+            device_sessions.ended(payload.get("device_id"), payload["jti"])
+
+    refresh_token = (data and data.refresh_token) or request.cookies.get(
+        REFRESH_COOKIE
+    )
+    if refresh_token:
+        revoke_refresh_token(refresh_token)
+
+    response.delete_cookie(
+        key=REFRESH_COOKIE,
+        path="/api/auth",
+        httponly=True,
+        secure=False,
+        samesite="strict",
+        domain="localhost",
+    )
+
     return response.delete_cookie(
         key="RESTOApiToken",
         path="/",
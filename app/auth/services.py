@@ -1,14 +1,17 @@
 import logging
 
-from sqlalchemy.orm import selectinload
-
+from app.auth.refresh import (
+    RefreshTokenError,
+    issue_refresh_token,
+    rotate_refresh_token,
+)
+from app.auth.roles import role_cache
+from app.config import ACCESS_TOKEN_EXPIRE_MINUTES
 from app.config.cnx import SessionLocal
 from app.config.sql_models import User
-from app.config.types import Roles
 from app.middlewares.auth import compare_password, create_access_token
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 
 def authenticate_user(email: str, password: str):
@@ -18,15 +21,8 @@ def authenticate_user(email: str, password: str):
             if not email or not password:
                 return None
 
-            logger.info(f"DEBUG here: {password} {email}")
-
             user = (
                 db.query(User)
-                .options(
-                    selectinload(User.waiter_profile),
-                    selectinload(User.cook_profile),
-                    selectinload(User.cashier_profile),
-                )
                 .filter(User.email == email, User.deleted_at.is_(None))
                 .first()
             )
@@ -46,37 +42,58 @@ def authenticate_user(email: str, password: str):
             db.close()
 
 
-def login_user(email: str, password: str):
-    """Login de usuario y generación de token"""
-    user = authenticate_user(email, password)
-
-    if not user:
-        raise ValueError("Credenciales inválidas")
-
-    roles = []
+def user_roles(user: User) -> list:
+    """Roles del usuario desde el cache de app/auth/roles.py."""
+    return list(role_cache.get(user.id))
 
-    if user.cashier_profile:
-        roles.append(Roles.CASHIER)
-    if user.cook_profile:
-        roles.append(Roles.COOK)
-    if user.waiter_profile:
-        roles.append(Roles.WAITER)
 
-    # assign admin privileges to single user for mock pourposes
-    if user.email == "evan@example.com":
-        roles.append("admin")  # type: ignore
+def _token_response(user: User, refresh_token: str) -> dict:
+    roles = user_roles(user)
 
     # Generar token
     token_data = {"sub": user.email, "user_id": str(user.id), "roles": roles}
 
     access_token = create_access_token(data=token_data)
 
-    logger.info(f"Login exitoso para usuario: {user.email}")
-
     return {
         "access_token": access_token,
         "token_type": "bearer",
+        "expires_in": int(ACCESS_TOKEN_EXPIRE_MINUTES * 60),
+        "refresh_token": refresh_token,
         "user_id": str(user.id),
         "user_email": user.email,
         "roles": roles,
     }
+
+
+def login_user(email: str, password: str):
+    """Login de usuario y generación de token"""
+    user = authenticate_user(email, password)
+
+    if not user:
+        raise ValueError("Credenciales inválidas")
+
+    token_data = _token_response(user, issue_refresh_token(user.id))
+
+    logger.info(f"Login exitoso para usuario: {user.email}")
+
+    return token_data
+
+
+def refresh_session(refresh_token: str):
+    """
+    Rota el refresh token y emite un access token nuevo, sin pasar por la
+    contraseña ni bcrypt. Lanza RefreshTokenError si el token no sirve.
+    """
+    user_id, new_refresh_token = rotate_refresh_token(refresh_token)
+
+    with SessionLocal() as db:
+        user = (
+            db.query(User)
+            .filter(User.id == user_id, User.deleted_at.is_(None))
+            .first()
+        )
+        if not user:
+            raise RefreshTokenError("Usuario inexistente")
+
+        return _token_response(user, new_refresh_token)
@@ -0,0 +1,212 @@
+"""
+Limite de intentos de login por IP y por email, y de PINs por dispositivo.
+
+Ventana deslizante aproximada: por clave se guardan los intentos de la ventana
+fija actual y de la anterior, y la anterior se pondera por la fraccion que
+todavia cae dentro de los ultimos `window` segundos. Es O(1) en tiempo y
+memoria por clave, y rechazar un intento es una busqueda en un dict.
+
+Los intentos rechazados no suman: un atacante que sigue golpeando no extiende
+su propio bloqueo, pero tampoco consigue que se haga trabajo de base o bcrypt.
+
+Con varios workers cada proceso cuenta por su cuenta (el limite efectivo se
+multiplica por la cantidad de workers). LOGIN_THROTTLE_BACKEND=sqlite comparte
+los contadores entre procesos en un archivo SQLite aparte de la base principal.
+"""
+
+import logging
+import math
+import sqlite3
+import threading
+import time
+
+from app.config import (
+    LOGIN_MAX_PER_EMAIL,
+    LOGIN_MAX_PER_IP,
+    LOGIN_THROTTLE_BACKEND,
+    LOGIN_THROTTLE_DB,
+    LOGIN_WINDOW_SECONDS,
+    PIN_MAX_FAILURES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _estimate(previous: int, current: int, elapsed: float, window: float) -> float:
+    return previous * (1 - elapsed / window) + current
+
+
+def _retry_after(
+    previous: int, current: int, elapsed: float, window: float, limit: int
+) -> float:
+    """Segundos hasta que la estimacion baje del limite."""
+    if current >= limit or not previous:
+        return window - elapsed
+    # previous * (1 - t / window) + current < limit
+    needed = (1 - (limit - current) / previous) * window
+    return max(needed - elapsed, 0.0)
+
+
+class MemoryWindow:
+    """Contadores en memoria del proceso."""
+
+    def __init__(self, limit: int, window: float, max_keys: int = 100_000):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        # clave -> [ventana, intentos en la ventana, intentos en la anterior]
+        self._counters: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, now: float | None = None) -> float:
+        """Registra un intento. Retorna 0 si se admite o los segundos a esperar."""
+        now = time.time() if now is None else now
+        slot = int(now // self.window)
+        elapsed = now - slot * self.window
+
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                if len(self._counters) >= self.max_keys:
+                    self._prune(slot)
+                counter = self._counters[key] = [slot, 0, 0]
+            elif counter[0] != slot:
+                counter[2] = counter[1] if counter[0] == slot - 1 else 0
+                counter[1] = 0
+                counter[0] = slot
+
+            _, current, previous = counter
+            if _estimate(previous, current, elapsed, self.window) >= self.limit:
+                return _retry_after(previous, current, elapsed, self.window, self.limit)
+            counter[1] += 1
+            return 0.0
+
+    def reset(self, key: str):
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def _prune(self, slot: int):
+        stale = [key for key, counter in self._counters.items() if counter[0] < slot - 1]
+        for key in stale:
+            del self._counters[key]
+        logger.info("Login throttle: pruned %s stale keys", len(stale))
+
+
+class SQLiteWindow:
+    """Contadores compartidos entre procesos en un archivo SQLite."""
+
+    def __init__(self, limit: int, window: float, path: str):
+        self.limit = limit
+        self.window = window
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS login_attempts ("
+                " key TEXT NOT NULL, slot INTEGER NOT NULL, count INTEGER NOT NULL,"
+                " PRIMARY KEY (key, slot))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=1, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _counts(self, conn, key: str, slot: int) -> tuple[int, int]:
+        rows = dict(
+            conn.execute(
+                "SELECT slot, count FROM login_attempts WHERE key = ? AND slot >= ?",
+                (key, slot - 1),
+            ).fetchall()
+        )
+        return rows.get(slot - 1, 0), rows.get(slot, 0)
+
+    def hit(self, key: str, now: float | None = None) -> float:
+        now = time.time() if now is None else now
+        slot = int(now // self.window)
+        elapsed = now - slot * self.window
+        conn = self._connect()
+
+        # Lectura sin lock de escritura: el caso de ataque no escribe
+        previous, current = self._counts(conn, key, slot)
+        if _estimate(previous, current, elapsed, self.window) >= self.limit:
+            return _retry_after(previous, current, elapsed, self.window, self.limit)
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            previous, current = self._counts(conn, key, slot)
+            if _estimate(previous, current, elapsed, self.window) >= self.limit:
+                conn.execute("COMMIT")
+                return _retry_after(previous, current, elapsed, self.window, self.limit)
+            conn.execute(
+                "INSERT INTO login_attempts (key, slot, count) VALUES (?, ?, 1)"
+                " ON CONFLICT (key, slot) DO UPDATE SET count = count + 1",
+                (key, slot),
+            )
+            # Poda barata de ventanas viejas de esta misma clave
+            conn.execute(
+                "DELETE FROM login_attempts WHERE key = ? AND slot < ?", (key, slot - 1)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return 0.0
+
+    def reset(self, key: str):
+        self._connect().execute("DELETE FROM login_attempts WHERE key = ?", (key,))
+
+    def prune(self, now: float | None = None) -> int:
+        """Borra ventanas vencidas de todas las claves."""
+        now = time.time() if now is None else now
+        slot = int(now // self.window)
+        cursor = self._connect().execute(
+            "DELETE FROM login_attempts WHERE slot < ?", (slot - 1,)
+        )
+        return cursor.rowcount
+
+
+def _window(limit: int):
+    if LOGIN_THROTTLE_BACKEND == "sqlite":
+        return SQLiteWindow(limit, LOGIN_WINDOW_SECONDS, LOGIN_THROTTLE_DB)
+    return MemoryWindow(limit, LOGIN_WINDOW_SECONDS)
+
+
+class LoginThrottle:
+    """Un limitador por IP (todos los intentos), otro por email y otro por tablet."""
+
+    def __init__(self):
+        self.by_ip = _window(LOGIN_MAX_PER_IP)
+        self.by_email = _window(LOGIN_MAX_PER_EMAIL)
+        self.by_device = _window(PIN_MAX_FAILURES)
+
+    def check_ip(self, ip: str) -> float:
+        return self.by_ip.hit(ip) if LOGIN_MAX_PER_IP else 0.0
+
+    def check_email(self, email: str) -> float:
+        return self.by_email.hit(email.strip().lower()) if LOGIN_MAX_PER_EMAIL else 0.0
+
+    def succeeded(self, email: str):
+        """Un login correcto libera el email; la IP sigue contando."""
+        if LOGIN_MAX_PER_EMAIL:
+            self.by_email.reset(email.strip().lower())
+
+    def check_device(self, device_id: int) -> float:
+        """Solo despues de validar el secreto de la tablet: sin el, cuenta la IP."""
+        return self.by_device.hit(f"device:{device_id}") if PIN_MAX_FAILURES else 0.0
+
+    def device_succeeded(self, device_id: int):
+        """Un PIN correcto libera la tablet: solo cuentan los fallos seguidos."""
+        if PIN_MAX_FAILURES:
+            self.by_device.reset(f"device:{device_id}")
+
+
+def retry_after_header(seconds: float) -> dict[str, str]:
+    return {"Retry-After": str(max(math.ceil(seconds), 1))}
+
+
+login_throttle = LoginThrottle()
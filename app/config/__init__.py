@@ -14,5 +14,93 @@ DEBUG = int(os.getenv("DEBUG") or 0)
 ENV = os.getenv("ENV")
 ORIGINS = os.getenv("ALLOWED_ORIGINS")
 SECRET_KEY = os.getenv("SECRET_KEY", default="1234").encode("utf-8")
+ALGORITHM = os.getenv("ALGORITHM") or "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = float(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES") or 15)
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS") or 30)
+# Solo desarrollo: access tokens de 100 años (expires_in y cookies no lo reflejan)
+DEV_LONG_LIVED_TOKENS = int(os.getenv("DEV_LONG_LIVED_TOKENS") or 0)
 
 SQLALCHEMY_DATABSE_URI = STRCNX
+
+# Startup
+DOCS_ENABLED = int(os.getenv("DOCS_ENABLED") or 1)
+WARMUP_ENABLED = int(os.getenv("WARMUP_ENABLED") or 1)
+WARMUP_POOL_CONNECTIONS = int(os.getenv("WARMUP_POOL_CONNECTIONS") or 2)
+
+# Login throttle (ventana deslizante por IP y por email)
+LOGIN_WINDOW_SECONDS = float(os.getenv("LOGIN_WINDOW_SECONDS") or 300)
+LOGIN_MAX_PER_IP = int(os.getenv("LOGIN_MAX_PER_IP") or 30)
+LOGIN_MAX_PER_EMAIL = int(os.getenv("LOGIN_MAX_PER_EMAIL") or 5)
+LOGIN_THROTTLE_BACKEND = os.getenv("LOGIN_THROTTLE_BACKEND") or "memory"
+LOGIN_THROTTLE_DB = os.getenv("LOGIN_THROTTLE_DB") or "app/data/throttle.sqlite"
+
+# PIN en tablets compartidas (token con alcance reducido, sin refresh)
+PIN_TOKEN_EXPIRE_MINUTES = float(os.getenv("PIN_TOKEN_EXPIRE_MINUTES") or 60)
+PIN_MAX_FAILURES = int(os.getenv("PIN_MAX_FAILURES") or 5)
+PIN_CACHE_SECONDS = float(os.getenv("PIN_CACHE_SECONDS") or 30)
+
+# Token revocation (filtro de Bloom por worker)
+REVOCATION_SYNC_SECONDS = float(os.getenv("REVOCATION_SYNC_SECONDS") or 2)
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY") or 100_000)
+REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE") or 0.001)
+
+# Per-route limits (reglas en app/middlewares/ratelimit.py)
+RATE_LIMITS_ENABLED = int(os.getenv("RATE_LIMITS_ENABLED") or 1)
+
+# Load shedding (prioridades por tag en app/middlewares/loadshed.py)
+LOAD_SHED_ENABLED = int(os.getenv("LOAD_SHED_ENABLED") or 1)
+LOAD_SHED_TARGET_MS = float(os.getenv("LOAD_SHED_TARGET_MS") or 500)
+LOAD_SHED_INTERVAL_MS = float(os.getenv("LOAD_SHED_INTERVAL_MS") or 1000)
+LOAD_SHED_MIN_INFLIGHT = int(os.getenv("LOAD_SHED_MIN_INFLIGHT") or 8)
+
+# Menu
+MENU_CACHE_SECONDS = float(os.getenv("MENU_CACHE_SECONDS") or 30)
+
+# Roles
+ROLE_CACHE_SECONDS = float(os.getenv("ROLE_CACHE_SECONDS") or 30)
+
+# Health / readiness probes
+READINESS_CACHE_SECONDS = float(os.getenv("READINESS_CACHE_SECONDS") or 2)
+READINESS_DB_TIMEOUT = float(os.getenv("READINESS_DB_TIMEOUT") or 1)
+READINESS_MAX_POOL_USAGE = float(os.getenv("READINESS_MAX_POOL_USAGE") or 0.9)
+READINESS_MAX_LOOP_LAG_MS = float(os.getenv("READINESS_MAX_LOOP_LAG_MS") or 250)
+
+# Event loop monitor
+LOOP_MONITOR_INTERVAL_MS = float(os.getenv("LOOP_MONITOR_INTERVAL_MS") or 100)
+LOOP_BLOCK_DETECTOR = int(os.getenv("LOOP_BLOCK_DETECTOR") or 0)
+LOOP_BLOCK_THRESHOLD_MS = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS") or 100)
+
+# Analytics
+ANALYTICS_CACHE_SECONDS = float(os.getenv("ANALYTICS_CACHE_SECONDS") or 300)
+ANALYTICS_CACHE_WINDOWS = int(os.getenv("ANALYTICS_CACHE_WINDOWS") or 4)
+
+# Order archive
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS") or 30)
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE") or 500)
+
+# Soft-delete purge
+PURGE_RETENTION_DAYS = int(os.getenv("PURGE_RETENTION_DAYS") or 90)
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE") or 500)
+
+# Employee import (0 = un hilo de hash por CPU)
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE") or 200)
+IMPORT_MAX_ROWS = int(os.getenv("IMPORT_MAX_ROWS") or 5000)
+IMPORT_HASH_WORKERS = int(os.getenv("IMPORT_HASH_WORKERS") or 0) or os.cpu_count() or 1
+
+# Background jobs
+JOBS_WORKER_IN_APP = int(os.getenv("JOBS_WORKER_IN_APP") or 1)
+JOBS_POLL_SECONDS = float(os.getenv("JOBS_POLL_SECONDS") or 1)
+JOBS_BATCH_SIZE = int(os.getenv("JOBS_BATCH_SIZE") or 20)
+JOBS_MAX_ATTEMPTS = int(os.getenv("JOBS_MAX_ATTEMPTS") or 5)
+JOBS_BACKOFF_SECONDS = float(os.getenv("JOBS_BACKOFF_SECONDS") or 2)
+JOBS_BACKOFF_MAX_SECONDS = float(os.getenv("JOBS_BACKOFF_MAX_SECONDS") or 600)
+JOBS_LOCK_TIMEOUT = float(os.getenv("JOBS_LOCK_TIMEOUT") or 300)
+JOBS_RETENTION_DAYS = int(os.getenv("JOBS_RETENTION_DAYS") or 7)
+JOBS_DEAD_RETENTION_DAYS = int(os.getenv("JOBS_DEAD_RETENTION_DAYS") or 30)
+JOBS_PRUNE_BATCH_SIZE = int(os.getenv("JOBS_PRUNE_BATCH_SIZE") or 1000)
+
+# Outbox relay
+OUTBOX_RELAY_IN_APP = int(os.getenv("OUTBOX_RELAY_IN_APP") or 1)
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS") or 0.5)
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE") or 100)
+OUTBOX_RETENTION_DAYS = int(os.getenv("OUTBOX_RETENTION_DAYS") or 7)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import unicodedata
+from datetime import date, datetime, timezone
 
 from sqlalchemy import (
     DECIMAL,
     Boolean,
     Column,
+    Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
@@ -17,7 +20,17 @@ from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.config.basemodel import Base
-from app.config.types import OrderStatus, RestaurantTableStatus
+from app.config.types import JobStatus, OrderStatus, RestaurantTableStatus, Roles
+
+
+def search_key(value: str) -> str:
+    """Texto sin acentos y en minusculas, para buscar sin depender del motor."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _name_key_default(context) -> str:
+    return search_key(context.get_current_parameters()["name"])
 
 
 class User(Base):
@@ -25,6 +38,11 @@ class User(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
+    # search_key(name), lo que compara la busqueda por nombre (ver filter_users)
+    name_key: Mapped[str] = mapped_column(
+        String, nullable=False, default=_name_key_default, index=True
+    )
+    # Siempre en minusculas: create_user, update_user y el import lo normalizan
     email: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     password: Mapped[str] = mapped_column(String, nullable=False)
 
@@ -58,6 +76,23 @@ class User(Base):
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
 
+class UserRole(Base):
+    """
+    Roles de cada usuario ya resueltos. Se escribe junto con el perfil
+    (mesero, cocina, caja) o la fila de admins; login, refresh y los chequeos
+    de permisos leen de aca (ver app/auth/roles.py).
+    """
+
+    __tablename__ = "user_roles"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), primary_key=True
+    )
+    role: Mapped[Roles] = mapped_column(
+        SqlEnum(Roles, name="role_enum"), primary_key=True
+    )
+
+
 class Waiter(Base):
     __tablename__ = "waiters"
 
@@ -143,11 +178,26 @@ order_menuitem_association = Table(
     Base.metadata,
     Column("order_id", ForeignKey("orders.id"), primary_key=True),
     Column("menu_item_id", ForeignKey("menu_items.id"), primary_key=True),
+    # Precio del item al tomar la orden: reparte Order.total en el rollup
+    Column("price", DECIMAL, nullable=True),
+    Index("ix_order_menuitem_menu_item_id", "menu_item_id"),
 )
 
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Indice cubriente para los reportes por rango de fechas
+        Index(
+            "ix_orders_reporting",
+            "created_at",
+            "status",
+            "deleted_at",
+            "total",
+            "waiter_id",
+            "table_id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -186,6 +236,52 @@ class Order(Base):
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
 
+class ArchivedOrder(Base):
+    """
+    Ordenes cerradas movidas fuera de `orders` por el job de archivo. Conserva
+    los ids originales; no tiene claves foraneas para no bloquear el borrado
+    de mesas, mozos o items ya retirados.
+    """
+
+    __tablename__ = "orders_archive"
+    __table_args__ = (
+        Index(
+            "ix_orders_archive_reporting",
+            "created_at",
+            "status",
+            "deleted_at",
+            "total",
+            "waiter_id",
+            "table_id",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    table_id: Mapped[int] = mapped_column(Integer)
+    waiter_id: Mapped[int] = mapped_column(Integer)
+    total: Mapped[DECIMAL] = mapped_column(DECIMAL)
+    status: Mapped[OrderStatus] = mapped_column(
+        SqlEnum(OrderStatus, name="order_status_enum"), nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+
+order_menuitem_archive = Table(
+    "order_menuitem_archive",
+    Base.metadata,
+    Column("order_id", Integer, primary_key=True),
+    Column("menu_item_id", Integer, primary_key=True),
+    Column("price", DECIMAL, nullable=True),
+    Index("ix_order_menuitem_archive_menu_item_id", "menu_item_id"),
+)
+
+
 class MenuItem(Base):
     __tablename__ = "menu_items"
 
@@ -211,3 +307,171 @@ class MenuItem(Base):
         onupdate=lambda: datetime.now(timezone.utc),
     )
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class DailySalesRollup(Base):
+    """Ventas pre-agregadas por dia, item de menu y mozo."""
+
+    __tablename__ = "daily_sales_rollup"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    menu_item_id: Mapped[int] = mapped_column(
+        ForeignKey("menu_items.id"), primary_key=True
+    )
+    waiter_id: Mapped[int] = mapped_column(ForeignKey("waiters.id"), primary_key=True)
+
+    # Ordenes no canceladas
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[DECIMAL] = mapped_column(DECIMAL, nullable=False, default=0)
+
+    # Subconjunto ya entregado
+    delivered_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    delivered_revenue: Mapped[DECIMAL] = mapped_column(
+        DECIMAL, nullable=False, default=0
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class Job(Base):
+    """Tarea en segundo plano encolada en la base (ver app/jobs)."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_status_run_at", "status", "run_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+
+    status: Mapped[JobStatus] = mapped_column(
+        SqlEnum(JobStatus, name="job_status_enum"),
+        nullable=False,
+        default=JobStatus.QUEUED,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    locked_by: Mapped[str | None] = mapped_column(String, nullable=True)
+    locked_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class OutboxEvent(Base):
+    """Evento de dominio escrito en la misma transaccion que el cambio."""
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    topic: Mapped[str] = mapped_column(String, nullable=False)
+    aggregate_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    payload: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+
+class OutboxOffset(Base):
+    """Ultimo evento entregado a cada consumidor del relay."""
+
+    __tablename__ = "outbox_offsets"
+
+    consumer: Mapped[str] = mapped_column(String, primary_key=True)
+    last_event_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class RevokedToken(Base):
+    """Access token revocado antes de su `exp` (ver app/auth/revocation.py)."""
+
+    __tablename__ = "revoked_tokens"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    jti: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    user_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+
+class RefreshToken(Base):
+    """
+    Refresh token rotativo. Solo se guarda su HMAC; cada uso crea el siguiente
+    de la misma familia (ver app/auth/refresh.py).
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    token_hash: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    family_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False, index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    used_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+
+class Device(Base):
+    """
+    Tablet compartida registrada por un admin. Solo se guarda el HMAC de su
+    secreto (ver app/auth/pin.py). `active_*` es la sesion PIN vigente, para
+    que cualquier worker revoque el token anterior al cambiar de usuario.
+    """
+
+    __tablename__ = "devices"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    secret_hash: Mapped[str] = mapped_column(String, nullable=False)
+    created_by: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    active_user_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    active_jti: Mapped[str | None] = mapped_column(String, nullable=True)
+    active_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True
+    )
+
+
+class StaffPin(Base):
+    """PIN de cambio rapido de usuario en tablets, como HMAC con SECRET_KEY."""
+
+    __tablename__ = "staff_pins"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), primary_key=True
+    )
+    pin_hash: Mapped[str] = mapped_column(String, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
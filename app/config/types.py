@@ -23,3 +23,10 @@ class RestaurantTableStatus(str, Enum):
     RESERVED = "reserved"
     CLEANING = "cleaning"
     MAINTENANCE = "maintenance"
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    DEAD = "dead"
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BlockedCallDTO(BaseModel):
+    route: Optional[str] = None
+    started_at: datetime
+    duration_ms: float
+    stack: list[str]
+
+    class Config:
+        from_attributes = True
+
+
+class LoopStatsDTO(BaseModel):
+    running: bool
+    interval_ms: float
+    samples: int
+    last_lag_ms: float
+    avg_lag_ms: float
+    p99_lag_ms: float
+    max_lag_ms: float
+    detector_enabled: bool
+    threshold_ms: float
+    blocked_by_route: dict[str, int]
+    blocked: list[BlockedCallDTO]
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "running": True,
+                "interval_ms": 100,
+                "samples": 5400,
+                "last_lag_ms": 0.4,
+                "avg_lag_ms": 0.6,
+                "p99_lag_ms": 12.5,
+                "max_lag_ms": 310.2,
+                "detector_enabled": True,
+                "threshold_ms": 100,
+                "blocked_by_route": {"POST /api/users/": 3},
+                "blocked": [
+                    {
+                        "route": "POST /api/users/",
+                        "started_at": "2025-11-01T10:00:00Z",
+                        "duration_ms": 310.2,
+                        "stack": ['  File "app/middlewares/auth.py", line 48, ...'],
+                    }
+                ],
+            }
+        }
+
+
+class LoadShedStatsDTO(BaseModel):
+    enabled: bool
+    level: int
+    shedding: list[str]
+    inflight: int
+    shed_total: int
+    target_ms: float
+    interval_ms: float
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "enabled": True,
+                "level": 1,
+                "shedding": ["LOW"],
+                "inflight": 23,
+                "shed_total": 418,
+                "target_ms": 500,
+                "interval_ms": 1000,
+            }
+        }
+
+
+class ProfileStackDTO(BaseModel):
+    stack: str
+    count: int
+
+
+class ProfileDTO(BaseModel):
+    id: str
+    label: str
+    duration_s: float
+    interval_ms: float
+    samples: int
+    stacks: list[ProfileStackDTO]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "5f0c3a1e9b0d4c5f8a7e6d5c4b3a2910",
+                "label": "worker",
+                "duration_s": 10.0,
+                "interval_ms": 10,
+                "samples": 1000,
+                "stacks": [
+                    {
+                        "stack": "MainThread;run (uvicorn/server.py:66);hash_password (app/middlewares/auth.py:48)",
+                        "count": 412,
+                    }
+                ],
+            }
+        }
@@ -0,0 +1,203 @@
+"""
+Monitor de lag del event loop y detector de llamadas bloqueantes.
+
+El monitor es una tarea que duerme `interval` y mide cuanto tarde se despierta.
+El detector (opcional, LOOP_BLOCK_DETECTOR=1) es un hilo que vigila el latido
+del monitor: si el loop no late por mas de `threshold`, captura el stack del
+hilo del loop y la ruta en curso para saber que handler lo esta bloqueando.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from app.config import (
+    LOOP_BLOCK_DETECTOR,
+    LOOP_BLOCK_THRESHOLD_MS,
+    LOOP_MONITOR_INTERVAL_MS,
+)
+from app.middlewares.inflight import route_for_task
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BlockedCall:
+    route: str | None
+    started_at: datetime
+    duration_ms: float
+    stack: list[str] = field(default_factory=list)
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        interval_ms: float,
+        threshold_ms: float,
+        detect_blocking: bool = False,
+        history: int = 600,
+        max_blocked: int = 50,
+    ):
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self.detect_blocking = detect_blocking
+
+        self._lags: deque[float] = deque(maxlen=history)
+        self._max_lag = 0.0
+        self._samples = 0
+        self._heartbeat = time.monotonic()
+
+        self.blocked: deque[BlockedCall] = deque(maxlen=max_blocked)
+        self.blocked_by_route: Counter[str] = Counter()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if self.running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._run(), name="loop-monitor")
+
+        if self.detect_blocking:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="loop-block-detector", daemon=True
+            )
+            self._watchdog.start()
+
+        logger.info(
+            "Monitor de event loop iniciado (intervalo %.0f ms, detector %s)",
+            self.interval * 1000,
+            "activo" if self.detect_blocking else "inactivo",
+        )
+
+    async def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _run(self):
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(now - start - self.interval, 0.0)
+
+            self._lags.append(lag)
+            self._samples += 1
+            self._max_lag = max(self._max_lag, lag)
+            self._heartbeat = now
+
+            if lag >= self.threshold:
+                logger.warning("Event loop bloqueado %.1f ms", lag * 1000)
+
+    def _watch(self):
+        stalled: BlockedCall | None = None
+        poll = max(self.threshold / 4, 0.005)
+
+        while not self._stop.wait(poll):
+            now = time.monotonic()
+            overdue = now - self._heartbeat - self.interval
+
+            if overdue < self.threshold:
+                if stalled is not None:
+                    # El lag del ultimo tick es la duracion total del bloqueo
+                    if self._lags:
+                        stalled.duration_ms = max(
+                            stalled.duration_ms, self._lags[-1] * 1000
+                        )
+                    stalled = None
+                continue
+
+            if stalled is not None:
+                stalled.duration_ms = overdue * 1000
+                continue
+
+            stalled = self._capture(overdue)
+
+    def _capture(self, overdue: float) -> BlockedCall:
+        frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type]
+        stack = traceback.format_stack(frame) if frame is not None else []
+
+        task = None
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            pass
+        route = route_for_task(task)
+
+        blocked = BlockedCall(
+            route=route,
+            started_at=datetime.now(timezone.utc),
+            duration_ms=overdue * 1000,
+            stack=[line.rstrip() for line in stack],
+        )
+        self.blocked.append(blocked)
+        self.blocked_by_route[route or "<sin request>"] += 1
+
+        logger.warning(
+            "Llamada bloqueante en el event loop (%s) por mas de %.0f ms:\n%s",
+            route or "sin request en curso",
+            overdue * 1000,
+            "".join(stack[-5:]),
+        )
+        return blocked
+
+    def recent_max_lag_ms(self, samples: int = 10) -> float:
+        recent = list(self._lags)[-samples:]
+        return max(recent, default=0.0) * 1000
+
+    def stale_for_ms(self) -> float:
+        """Cuanto hace que el monitor no late mas alla de lo esperado."""
+        return max(time.monotonic() - self._heartbeat - self.interval, 0.0) * 1000
+
+    def snapshot(self) -> dict:
+        lags = sorted(self._lags)
+        count = len(lags)
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "samples": self._samples,
+            "last_lag_ms": (self._lags[-1] * 1000) if count else 0.0,
+            "avg_lag_ms": (sum(lags) / count * 1000) if count else 0.0,
+            "p99_lag_ms": (lags[min(int(count * 0.99), count - 1)] * 1000)
+            if count
+            else 0.0,
+            "max_lag_ms": self._max_lag * 1000,
+            "detector_enabled": self.detect_blocking,
+            "threshold_ms": self.threshold * 1000,
+            "blocked_by_route": dict(self.blocked_by_route.most_common()),
+            "blocked": list(reversed(self.blocked)),
+        }
+
+
+loop_monitor = LoopMonitor(
+    interval_ms=LOOP_MONITOR_INTERVAL_MS,
+    threshold_ms=LOOP_BLOCK_THRESHOLD_MS,
+    detect_blocking=LOOP_BLOCK_DETECTOR == 1,
+)
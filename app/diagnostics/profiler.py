@@ -0,0 +1,202 @@
+"""
+Profiler por muestreo de stacks para diagnostico en produccion.
+
+Un hilo toma `sys._current_frames()` cada `interval` y cuenta los stacks
+colapsados (formato `raiz;...;hoja cantidad`, listo para flamegraph.pl o
+speedscope). No instrumenta el codigo, asi que el costo es proporcional a la
+frecuencia de muestreo y no a la carga del worker.
+"""
+
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+MAX_PROFILE_SECONDS = 60
+MIN_INTERVAL_MS = 1
+MAX_STACK_DEPTH = 128
+
+# Funciones hoja que indican un hilo esperando, no trabajando
+IDLE_FUNCTIONS = frozenset(
+    {
+        "wait",
+        "select",
+        "poll",
+        "control",
+        "sleep",
+        "accept",
+        "_wait_for_tstate_lock",
+        "_worker",
+    }
+)
+
+# Solo un muestreo a la vez por worker
+_profile_lock = threading.Lock()
+
+
+@dataclass
+class ProfileResult:
+    id: str
+    label: str
+    duration_s: float
+    interval_ms: float
+    samples: int
+    stacks: Counter
+
+    def collapsed(self) -> str:
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self.stacks.most_common()
+        )
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    try:
+        filename = str(Path(filename).relative_to(BASE_DIR))
+    except ValueError:
+        filename = Path(filename).name
+    return f"{code.co_name} ({filename}:{frame.f_lineno})"
+
+
+def _collapse(frame, thread_name: str) -> str:
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+class StackSampler:
+    def __init__(
+        self,
+        interval_ms: float = 10,
+        include_idle: bool = False,
+        label: str = "worker",
+        exclude_threads: frozenset[int] = frozenset(),
+    ):
+        self.interval = max(interval_ms, MIN_INTERVAL_MS) / 1000
+        self.include_idle = include_idle
+        self.exclude_threads = exclude_threads
+        self.label = label
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+        self._elapsed = 0.0
+
+    def sample_once(self):
+        own_id = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id or thread_id in self.exclude_threads:
+                continue
+            if not self.include_idle and frame.f_code.co_name in IDLE_FUNCTIONS:
+                continue
+            thread_name = names.get(thread_id, f"thread-{thread_id}")
+            self.stacks[_collapse(frame, thread_name)] += 1
+
+        self.samples += 1
+
+    def _loop(self):
+        next_tick = time.perf_counter()
+        while not self._stop.is_set():
+            self.sample_once()
+            next_tick += self.interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                # Si el muestreo se atrasa no intentamos recuperar ticks
+                next_tick = time.perf_counter()
+
+    def start(self):
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._loop, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> ProfileResult:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._elapsed = time.perf_counter() - self._started_at
+        return ProfileResult(
+            id=uuid.uuid4().hex,
+            label=self.label,
+            duration_s=self._elapsed,
+            interval_ms=self.interval * 1000,
+            samples=self.samples,
+            stacks=self.stacks,
+        )
+
+
+class ProfileStore:
+    """Guarda los ultimos perfiles por request para consultarlos despues."""
+
+    def __init__(self, max_entries: int = 20):
+        self.max_entries = max_entries
+        self._results: OrderedDict[str, ProfileResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, result: ProfileResult):
+        with self._lock:
+            self._results[result.id] = result
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def get(self, profile_id: str) -> ProfileResult | None:
+        with self._lock:
+            return self._results.get(profile_id)
+
+
+profile_store = ProfileStore()
+
+
+def try_acquire_profiler() -> bool:
+    return _profile_lock.acquire(blocking=False)
+
+
+def release_profiler():
+    _profile_lock.release()
+
+
+def profile_worker(
+    seconds: float, interval_ms: float = 10, include_idle: bool = False
+) -> ProfileResult:
+    """
+    Muestrea todos los hilos del worker durante `seconds`. Es bloqueante: se
+    debe llamar desde un hilo (asyncio.to_thread), nunca desde el event loop.
+    El llamador es responsable de tomar y liberar el lock del profiler.
+    """
+    seconds = min(max(seconds, 0.1), MAX_PROFILE_SECONDS)
+    sampler = StackSampler(
+        interval_ms=interval_ms,
+        include_idle=include_idle,
+        label="worker",
+        # El hilo que espera el muestreo no aporta informacion
+        exclude_threads=frozenset({threading.get_ident()}),
+    )
+    sampler.start()
+    time.sleep(seconds)
+    result = sampler.stop()
+
+    logger.info(
+        "Perfil de worker completado: %s muestras en %.1fs, %s stacks distintos",
+        result.samples,
+        result.duration_s,
+        len(result.stacks),
+    )
+    return result
@@ -0,0 +1,115 @@
+import asyncio
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.config.types import Roles
+from app.diagnostics.dto import LoadShedStatsDTO, LoopStatsDTO, ProfileDTO
+from app.diagnostics.loop_monitor import loop_monitor
+from app.diagnostics.profiler import (
+    MAX_PROFILE_SECONDS,
+    ProfileResult,
+    profile_store,
+    profile_worker,
+    release_profiler,
+    try_acquire_profiler,
+)
+from app.middlewares.loadshed import load_shedder
+from app.middlewares.security import role_required
+
+diagnostics_router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+
+
+def _render_profile(result: ProfileResult, output: str):
+    if output == "collapsed":
+        return PlainTextResponse(result.collapsed())
+
+    return ProfileDTO(
+        id=result.id,
+        label=result.label,
+        duration_s=result.duration_s,
+        interval_ms=result.interval_ms,
+        samples=result.samples,
+        stacks=[
+            {"stack": stack, "count": count}
+            for stack, count in result.stacks.most_common()
+        ],
+    )
+
+
+@diagnostics_router.get(
+    "/loop",
+    response_model=LoopStatsDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Event loop lag and blocking calls",
+    description="Lag statistics for this worker's event loop and, when LOOP_BLOCK_DETECTOR=1, the stack traces of callbacks that held the loop past the threshold, grouped by route.",
+)
+async def get_loop_stats(_=Depends(role_required(Roles.ADMIN))):
+    return loop_monitor.snapshot()
+
+
+@diagnostics_router.get(
+    "/load",
+    response_model=LoadShedStatsDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Load shedding state",
+    description="Current shedding level of this worker, the priorities being rejected, in-flight requests and how many requests were shed since start.",
+)
+async def get_load_stats(_=Depends(role_required(Roles.ADMIN))):
+    return load_shedder.snapshot()
+
+
+@diagnostics_router.get(
+    "/profile",
+    response_model=ProfileDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Sample this worker's stacks",
+    description="Samples every thread of the worker for the given seconds and returns collapsed stacks (format=collapsed, flamegraph-ready) or JSON. Only one profile runs at a time per worker.",
+    responses={409: {"description": "Another profile is already running"}},
+)
+async def profile_current_worker(
+    seconds: float = Query(5, gt=0, le=MAX_PROFILE_SECONDS),
+    interval_ms: float = Query(10, ge=1, le=1000),
+    include_idle: bool = False,
+    output: Literal["json", "collapsed"] = Query("json", alias="format"),
+    _=Depends(role_required(Roles.ADMIN)),
+):
+    if not try_acquire_profiler():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already running on this worker",
+        )
+
+    try:
+        # El muestreo corre en un hilo para no bloquear el event loop
+        result = await asyncio.to_thread(
+            profile_worker, seconds, interval_ms, include_idle
+        )
+    finally:
+        release_profiler()
+
+    profile_store.add(result)
+    return _render_profile(result, output)
+
+
+@diagnostics_router.get(
+    "/profile/{profile_id}",
+    response_model=ProfileDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Get a stored request profile",
+    description="Returns the profile captured for a request sent with the 'X-Profile: 1' header, using the id from its 'X-Profile-Id' response header.",
+)
+async def get_request_profile(
+    profile_id: str,
+    output: Literal["json", "collapsed"] = Query("json", alias="format"),
+    _=Depends(role_required(Roles.ADMIN)),
+):
+    result = profile_store.get(profile_id)
+
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
+        )
+
+    return _render_profile(result, output)
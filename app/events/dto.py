@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class OutboxOffsetDTO(BaseModel):
+    consumer: str
+    last_event_id: int
+    lag: int
+    registered: bool
+    updated_at: datetime
@@ -0,0 +1,29 @@
+"""
+Outbox transaccional.
+
+Los servicios llaman `record_event` con su propia sesion: el evento se inserta
+en `outbox_events` dentro de la misma transaccion que la orden, asi no hay
+eventos de cambios que no se confirmaron ni cambios confirmados sin evento. La
+publicacion real la hace el relay (relay.py) fuera del request.
+"""
+
+import json
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.config.sql_models import OutboxEvent
+
+
+def record_event(
+    db: Session, topic: str, aggregate_id: int | None, payload: dict
+) -> OutboxEvent:
+    """Agrega el evento a la sesion. No hace commit."""
+    event = OutboxEvent(
+        topic=topic,
+        aggregate_id=aggregate_id,
+        payload=json.dumps(payload, default=str),
+        created_at=datetime.now(timezone.utc),
+    )
+    db.add(event)
+    return event
@@ -0,0 +1,247 @@
+"""
+Relay del outbox hacia suscriptores en proceso.
+
+Un hilo lee `outbox_events` en orden de id y entrega cada evento a los
+suscriptores registrados con `subscribe`. Cada suscriptor tiene su offset en
+`outbox_offsets`: avanza solo despues de procesar el evento, asi la entrega es
+al menos una vez y en orden. Si un suscriptor falla se reintenta desde ese
+evento en la siguiente vuelta; cada suscriptor lee desde su propio offset, asi
+uno trabado no frena a los demas. `replay` mueve el offset
+hacia atras para volver a procesar.
+
+En SQLite las escrituras son serializadas y los ids se confirman en orden, por
+eso alcanza con leer `id > offset`.
+"""
+
+import importlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import delete, func, select, update
+
+from app.config import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_POLL_SECONDS,
+    OUTBOX_RETENTION_DAYS,
+)
+from app.config.cnx import SessionLocal
+from app.config.sql_models import OutboxEvent, OutboxOffset
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_MODULES = ("app.events.subscribers",)
+PRUNE_EVERY = 1000
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    topic: str
+    aggregate_id: int | None
+    payload: dict
+    created_at: datetime
+
+
+@dataclass
+class Subscriber:
+    name: str
+    handler: Callable[[Event], None]
+    topics: frozenset[str] | None = None
+
+    def wants(self, event: Event) -> bool:
+        return self.topics is None or event.topic in self.topics
+
+
+SUBSCRIBERS: dict[str, Subscriber] = {}
+
+
+def subscribe(name: str, topics: list[str] | None = None):
+    """Registra la funcion decorada como suscriptor durable `name`."""
+
+    def decorator(handler: Callable[[Event], None]):
+        if name in SUBSCRIBERS:
+            raise ValueError(f"Subscriber {name} already registered")
+        SUBSCRIBERS[name] = Subscriber(
+            name=name,
+            handler=handler,
+            topics=frozenset(topics) if topics else None,
+        )
+        return handler
+
+    return decorator
+
+
+def load_subscribers():
+    for module in SUBSCRIBER_MODULES:
+        importlib.import_module(module)
+
+
+def _offsets(db) -> dict[str, int]:
+    stored = dict(
+        db.execute(select(OutboxOffset.consumer, OutboxOffset.last_event_id)).all()
+    )
+    missing = [name for name in SUBSCRIBERS if name not in stored]
+    if missing:
+        # Un suscriptor nuevo arranca desde el evento actual, no desde el inicio
+        latest = db.execute(select(func.max(OutboxEvent.id))).scalar() or 0
+        for name in missing:
+            db.add(OutboxOffset(consumer=name, last_event_id=latest))
+            stored[name] = latest
+        db.commit()
+    return stored
+
+
+def _to_event(row: OutboxEvent) -> Event:
+    return Event(
+        id=row.id,
+        topic=row.topic,
+        aggregate_id=row.aggregate_id,
+        payload=json.loads(row.payload),
+        created_at=row.created_at,
+    )
+
+
+def _deliver(db, subscriber: Subscriber, offset: int, batch_size: int) -> int:
+    """Entrega al suscriptor los eventos siguientes a `offset` y avanza el offset."""
+    stmt = select(OutboxEvent).where(OutboxEvent.id > offset)
+    if subscriber.topics is not None:
+        stmt = stmt.where(OutboxEvent.topic.in_(subscriber.topics))
+    rows = db.execute(stmt.order_by(OutboxEvent.id).limit(batch_size)).scalars()
+
+    position = offset
+    delivered = 0
+    for row in rows:
+        event = _to_event(row)
+        try:
+            subscriber.handler(event)
+        except Exception:
+            logger.exception(
+                "Subscriber %s failed on event %s (%s), will retry",
+                subscriber.name,
+                event.id,
+                event.topic,
+            )
+            break
+        position = event.id
+        delivered += 1
+
+    if position != offset:
+        db.execute(
+            update(OutboxOffset)
+            .where(OutboxOffset.consumer == subscriber.name)
+            .values(last_event_id=position)
+        )
+        db.commit()
+    return delivered
+
+
+def deliver_batch(batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    """
+    Entrega hasta `batch_size` eventos a cada suscriptor. Retorna la cantidad
+    de entregas (0 si todos estan al dia).
+    """
+    with SessionLocal() as db:
+        offsets = _offsets(db)
+        return sum(
+            _deliver(db, subscriber, offsets[name], batch_size)
+            for name, subscriber in SUBSCRIBERS.items()
+        )
+
+
+def replay(consumer: str, from_event_id: int = 0) -> bool:
+    """Hace que `consumer` reciba otra vez los eventos posteriores a `from_event_id`."""
+    with SessionLocal() as db:
+        result = db.execute(
+            update(OutboxOffset)
+            .where(OutboxOffset.consumer == consumer)
+            .values(last_event_id=max(from_event_id, 0))
+        )
+        db.commit()
+    return result.rowcount == 1
+
+
+def list_offsets() -> list[dict]:
+    with SessionLocal() as db:
+        latest = db.execute(select(func.max(OutboxEvent.id))).scalar() or 0
+        rows = db.execute(select(OutboxOffset).order_by(OutboxOffset.consumer)).scalars()
+        return [
+            {
+                "consumer": row.consumer,
+                "last_event_id": row.last_event_id,
+                "lag": latest - row.last_event_id,
+                "registered": row.consumer in SUBSCRIBERS,
+                "updated_at": row.updated_at,
+            }
+            for row in rows
+        ]
+
+
+def prune_events(retention_days: int = OUTBOX_RETENTION_DAYS) -> int:
+    """
+    Borra eventos viejos que todos los suscriptores registrados ya procesaron.
+    Los offsets de consumidores que ya no existen no frenan la limpieza.
+    """
+    if not SUBSCRIBERS:
+        return 0
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    with SessionLocal() as db:
+        floor = db.execute(
+            select(func.min(OutboxOffset.last_event_id)).where(
+                OutboxOffset.consumer.in_(list(SUBSCRIBERS))
+            )
+        ).scalar()
+        if floor is None:
+            return 0
+        result = db.execute(
+            delete(OutboxEvent).where(
+                OutboxEvent.id <= floor, OutboxEvent.created_at < cutoff
+            )
+        )
+        db.commit()
+    return result.rowcount
+
+
+class OutboxRelay:
+    def __init__(self, poll_seconds: float = OUTBOX_POLL_SECONDS):
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_forever(self):
+        load_subscribers()
+        logger.info("Outbox relay started with %s subscribers", len(SUBSCRIBERS))
+        loops = 0
+        while not self._stop.is_set():
+            try:
+                advanced = deliver_batch()
+                loops += 1
+                if loops % PRUNE_EVERY == 0:
+                    prune_events()
+            except Exception:
+                logger.exception("Outbox relay loop failed")
+                advanced = 0
+            if not advanced:
+                self._stop.wait(self.poll_seconds)
+        logger.info("Outbox relay stopped")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run_forever, name="outbox-relay", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+outbox_relay = OutboxRelay()
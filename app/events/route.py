@@ -0,0 +1,39 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.config.types import Roles
+from app.events.dto import OutboxOffsetDTO
+from app.events.relay import list_offsets, replay
+from app.middlewares.security import role_required
+
+events_router = APIRouter(
+    prefix="/events",
+    tags=["Events"],
+    dependencies=[Depends(role_required(Roles.ADMIN))],
+)
+
+
+@events_router.get(
+    "/offsets",
+    response_model=List[OutboxOffsetDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Outbox consumer offsets",
+    description="Last event delivered to each outbox subscriber and how far behind the newest event it is.",
+)
+def get_offsets():
+    return list_offsets()
+
+
+@events_router.post(
+    "/offsets/{consumer}/replay",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Replay events for a consumer",
+    description="Rewinds the consumer offset so the relay delivers every event after from_event_id again.",
+)
+def replay_consumer(consumer: str, from_event_id: int = Query(0, ge=0)):
+    if not replay(consumer, from_event_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Consumer not found"
+        )
+    return {"consumer": consumer, "last_event_id": from_event_id}
@@ -0,0 +1,17 @@
+import logging
+
+from app.events.relay import Event, subscribe
+
+logger = logging.getLogger(__name__)
+
+
+@subscribe("order_audit", topics=["order.created", "order.status_changed"])
+def order_audit(event: Event):
+    """Bitacora de eventos de ordenes."""
+    logger.info(
+        "Event %s %s order=%s %s",
+        event.id,
+        event.topic,
+        event.aggregate_id,
+        event.payload,
+    )
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class HealthCheckDTO(BaseModel):
+    ok: bool
+    detail: Optional[str] = None
+    duration_ms: float = 0.0
+
+
+class ReadinessDTO(BaseModel):
+    status: str
+    draining: bool = False
+    cached: bool = False
+    checks: dict[str, HealthCheckDTO]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "ready",
+                "draining": False,
+                "cached": False,
+                "checks": {
+                    "database": {"ok": True, "detail": None, "duration_ms": 1.2},
+                    "pool": {"ok": True, "detail": "1/15 in use", "duration_ms": 0},
+                    "migrations": {
+                        "ok": True,
+                        "detail": "417fc53dcdaf",
+                        "duration_ms": 0.4,
+                    },
+                    "event_loop": {"ok": True, "detail": "0.3 ms", "duration_ms": 0.3},
+                },
+            }
+        }
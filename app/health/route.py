@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from app.config.types import Roles
+from app.health.dto import ReadinessDTO
+from app.health.services import get_readiness, start_draining
+from app.middlewares.security import role_required
+
+health_router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@health_router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Liveness probe",
+    description="Always answers while the worker process is running.",
+)
+async def health_check():
+    return {"status": "ok"}
+
+
+@health_router.get(
+    "/live",
+    status_code=status.HTTP_200_OK,
+    summary="Liveness probe",
+    description="Answers while the event loop is running, without touching the database.",
+)
+async def liveness_check():
+    return {"status": "ok"}
+
+
+@health_router.get(
+    "/ready",
+    response_model=ReadinessDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Readiness probe",
+    description="Checks database, pool saturation, Alembic head and event-loop lag. Returns 503 when the worker should not receive traffic.",
+    responses={503: {"model": ReadinessDTO, "description": "Worker not ready"}},
+)
+async def readiness_check(response: Response):
+    report = await get_readiness()
+
+    if report.draining:
+        report.status = "draining"
+
+    if report.status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return report
+
+
+@health_router.post(
+    "/drain",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Drain this worker",
+    description="Makes the readiness probe fail so the load balancer stops routing new traffic here before a restart.",
+)
+async def drain_worker(_=Depends(role_required(Roles.ADMIN))):
+    start_draining()
+    return {"status": "draining"}
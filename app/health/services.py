@@ -0,0 +1,203 @@
+import ast
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app.config import (
+    READINESS_CACHE_SECONDS,
+    READINESS_DB_TIMEOUT,
+    READINESS_MAX_LOOP_LAG_MS,
+    READINESS_MAX_POOL_USAGE,
+)
+from app.config.cnx import engine
+from app.diagnostics.loop_monitor import loop_monitor
+from app.health.dto import HealthCheckDTO, ReadinessDTO
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+_draining = False
+_cached_report: ReadinessDTO | None = None
+_cached_at = 0.0
+_lock = asyncio.Lock()
+
+
+def start_draining():
+    """Marca el worker como saliente: readiness responde 503 desde ahora."""
+    global _draining
+    _draining = True
+    logger.info("Worker marcado como draining, readiness devolverá 503")
+
+
+def is_draining() -> bool:
+    return _draining
+
+
+def _revision_ids(value) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def _read_revision(path: Path) -> tuple[str | None, list[str]]:
+    """(revision, down_revisions) de un archivo de migracion, sin ejecutarlo."""
+    revision, down = None, []
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.AnnAssign):
+            targets, value = [node.target], node.value
+        elif isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        else:
+            continue
+        names = {t.id for t in targets if isinstance(t, ast.Name)}
+        if "revision" in names:
+            revision = ast.literal_eval(value)
+        elif "down_revision" in names:
+            down = _revision_ids(ast.literal_eval(value))
+    return revision, down
+
+
+@lru_cache(maxsize=1)
+def get_migration_heads() -> frozenset[str]:
+    """
+    Revisiones head del directorio de migraciones (se calcula una vez).
+
+    Lee `revision` / `down_revision` de cada archivo con `ast` en vez de cargar
+    Alembic, que no tiene que importarse en los workers de la API.
+    """
+    revisions, parents = set(), set()
+    for path in (BASE_DIR / "alembic" / "versions").glob("*.py"):
+        revision, down = _read_revision(path)
+        if revision:
+            revisions.add(revision)
+            parents.update(down)
+    return frozenset(revisions - parents)
+
+
+def _query_database() -> set[str]:
+    """Ejecuta SELECT 1 y retorna las revisiones aplicadas en la base."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        rows = conn.execute(text("SELECT version_num FROM alembic_version"))
+        return {row[0] for row in rows}
+
+
+async def check_database() -> tuple[HealthCheckDTO, HealthCheckDTO]:
+    """Verifica conectividad con timeout y que la base este en el head de Alembic."""
+    start = time.perf_counter()
+    try:
+        applied = await asyncio.wait_for(
+            asyncio.to_thread(_query_database), timeout=READINESS_DB_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        elapsed = (time.perf_counter() - start) * 1000
+        database = HealthCheckDTO(
+            ok=False,
+            detail=f"SELECT 1 excedió {READINESS_DB_TIMEOUT}s",
+            duration_ms=elapsed,
+        )
+        return database, HealthCheckDTO(ok=False, detail="base no disponible")
+    except Exception as e:
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.warning("Readiness: error de base de datos: %s", e)
+        database = HealthCheckDTO(ok=False, detail=str(e), duration_ms=elapsed)
+        return database, HealthCheckDTO(ok=False, detail="base no disponible")
+
+    database = HealthCheckDTO(ok=True, duration_ms=(time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    try:
+        heads = await asyncio.to_thread(get_migration_heads)
+    except Exception as e:
+        logger.warning("Readiness: no se pudo leer el head de Alembic: %s", e)
+        return database, HealthCheckDTO(ok=False, detail=str(e))
+
+    migrations = HealthCheckDTO(
+        ok=applied == heads,
+        detail=f"db={','.join(sorted(applied)) or '-'} head={','.join(sorted(heads))}",
+        duration_ms=(time.perf_counter() - start) * 1000,
+    )
+    return database, migrations
+
+
+def check_pool() -> HealthCheckDTO:
+    """Compara conexiones en uso contra la capacidad total del pool."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return HealthCheckDTO(ok=True, detail=type(pool).__name__)
+
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    in_use = pool.checkedout()
+    usage = in_use / capacity if capacity else 0.0
+    return HealthCheckDTO(
+        ok=usage < READINESS_MAX_POOL_USAGE,
+        detail=f"{in_use}/{capacity} in use",
+    )
+
+
+async def check_event_loop() -> HealthCheckDTO:
+    """
+    Mide cuanto tarda el loop en volver a ejecutar una tarea lista y lo
+    combina con el lag reciente registrado por el monitor de fondo.
+    """
+    start = time.perf_counter()
+    await asyncio.sleep(0)
+    lag_ms = (time.perf_counter() - start) * 1000
+    if loop_monitor.running:
+        lag_ms = max(lag_ms, loop_monitor.recent_max_lag_ms())
+    return HealthCheckDTO(
+        ok=lag_ms < READINESS_MAX_LOOP_LAG_MS,
+        detail=f"{lag_ms:.1f} ms",
+        duration_ms=lag_ms,
+    )
+
+
+async def get_readiness() -> ReadinessDTO:
+    """
+    Ejecuta los chequeos de readiness. El resultado se cachea durante
+    READINESS_CACHE_SECONDS para que los probes no agreguen carga.
+    """
+    global _cached_report, _cached_at
+
+    async with _lock:
+        if (
+            _cached_report is not None
+            and time.monotonic() - _cached_at < READINESS_CACHE_SECONDS
+        ):
+            return _cached_report.model_copy(
+                update={"cached": True, "draining": _draining}
+            )
+
+        event_loop = await check_event_loop()
+        pool = check_pool()
+        database, migrations = await check_database()
+
+        checks = {
+            "database": database,
+            "pool": pool,
+            "migrations": migrations,
+            "event_loop": event_loop,
+        }
+        ready = all(check.ok for check in checks.values())
+
+        _cached_report = ReadinessDTO(
+            status="ready" if ready else "unavailable",
+            checks=checks,
+        )
+        _cached_at = time.monotonic()
+
+        if not ready:
+            logger.warning(
+                "Readiness fallida: %s",
+                {name: c.detail for name, c in checks.items() if not c.ok},
+            )
+
+        return _cached_report.model_copy(update={"draining": _draining})
@@ -0,0 +1,81 @@
+"""
+Calentamiento del worker antes de recibir trafico.
+
+Sin esto el primer request despues de un deploy paga lo que el resto no:
+configurar los mappers de SQLAlchemy, abrir conexiones, inicializar bcrypt y
+PyJWT, cargar el menu y armar el esquema OpenAPI. Uvicorn no acepta conexiones
+hasta que termina el startup del lifespan, asi que todo eso se hace aca.
+"""
+
+import logging
+import time
+
+import bcrypt
+from fastapi import FastAPI
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+
+from app.config import DOCS_ENABLED, WARMUP_POOL_CONNECTIONS
+from app.config.cnx import engine
+from app.health.services import get_migration_heads
+from app.menu.services import menu_cache
+from app.middlewares.auth import create_access_token, verify_jwt_token
+
+logger = logging.getLogger(__name__)
+
+
+def _open_connections(count: int):
+    # Se sacan todas a la vez para que el pool abra `count` conexiones distintas
+    pool_size = getattr(engine.pool, "size", lambda: count)()
+    connections = [engine.connect() for _ in range(min(count, pool_size))]
+    try:
+        for conn in connections:
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+def _rebuild_models():
+    # Los DTOs con referencias adelantadas quedan sin validador hasta el primer uso
+    pending = list(BaseModel.__subclasses__())
+    while pending:
+        model = pending.pop()
+        pending.extend(model.__subclasses__())
+        if model.__module__.startswith("app.") and not model.__pydantic_complete__:
+            model.model_rebuild()
+
+
+def _crypto():
+    bcrypt.checkpw(b"warmup", bcrypt.hashpw(b"warmup", bcrypt.gensalt(rounds=4)))
+    verify_jwt_token(create_access_token({"sub": "warmup"}))
+
+
+def warm_up(server: FastAPI) -> dict:
+    """
+    Corre cada paso y retorna su duracion en ms. Un paso que falla solo se
+    loguea: el worker arranca igual y lo paga el primer request.
+    """
+    steps = [
+        ("mappers", configure_mappers),
+        ("pool", lambda: _open_connections(WARMUP_POOL_CONNECTIONS)),
+        ("models", _rebuild_models),
+        ("crypto", _crypto),
+        ("menu", menu_cache.get),
+        ("migrations", get_migration_heads),
+    ]
+    if DOCS_ENABLED:
+        steps.append(("openapi", server.openapi))
+
+    timings = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning("Warmup step %s failed: %s", name, e)
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    logger.info("Warmup done: %s", timings)
+    return timings
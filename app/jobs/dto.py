@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.config.types import JobStatus
+
+
+class JobDTO(BaseModel):
+    id: int
+    name: str
+    payload: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,241 @@
+"""
+Cola de tareas durable sobre la tabla `jobs`.
+
+`enqueue` agrega la tarea a la sesion del llamador: se confirma en el mismo
+commit que el cambio que la origina y se descarta con su rollback. Los workers
+reclaman tareas con un UPDATE condicional sobre el estado, asi varios procesos
+pueden consumir la misma tabla sin tomar dos veces la misma tarea.
+
+Una tarea que falla se reprograma con backoff exponencial con jitter; al
+agotar `max_attempts` queda en estado DEAD (dead-letter) con el ultimo error
+hasta que un admin la reencole.
+
+Las tareas DONE se borran pasados JOBS_RETENTION_DAYS y las DEAD pasados
+JOBS_DEAD_RETENTION_DAYS (`prune_jobs`, llamado desde el worker).
+"""
+
+import json
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.config import (
+    JOBS_BACKOFF_MAX_SECONDS,
+    JOBS_BACKOFF_SECONDS,
+    JOBS_DEAD_RETENTION_DAYS,
+    JOBS_LOCK_TIMEOUT,
+    JOBS_MAX_ATTEMPTS,
+    JOBS_PRUNE_BATCH_SIZE,
+    JOBS_RETENTION_DAYS,
+)
+from app.config.cnx import SessionLocal
+from app.config.sql_models import Job
+from app.config.types import JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def enqueue(
+    db: Session,
+    name: str,
+    payload: dict | None = None,
+    delay: float = 0,
+    max_attempts: int = JOBS_MAX_ATTEMPTS,
+) -> Job:
+    """Agrega una tarea a la sesion. No hace commit."""
+    job = Job(
+        name=name,
+        payload=json.dumps(payload or {}),
+        status=JobStatus.QUEUED,
+        max_attempts=max_attempts,
+        run_at=_now() + timedelta(seconds=delay),
+    )
+    db.add(job)
+    return job
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Espera antes del reintento `attempts`: exponencial, con tope y jitter."""
+    delay = min(JOBS_BACKOFF_SECONDS * 2 ** (attempts - 1), JOBS_BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def claim(worker_id: str, limit: int) -> list[Job]:
+    """Reclama hasta `limit` tareas vencidas para este worker."""
+    now = _now()
+    claimed = []
+
+    with SessionLocal() as db:
+        candidates = (
+            db.execute(
+                select(Job.id)
+                .where(Job.status == JobStatus.QUEUED, Job.run_at <= now)
+                .order_by(Job.run_at)
+                .limit(limit)
+            )
+            .scalars()
+            .all()
+        )
+        for job_id in candidates:
+            # Si otro worker la tomo primero, el UPDATE no afecta filas
+            result = db.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == JobStatus.QUEUED)
+                .values(
+                    status=JobStatus.RUNNING,
+                    locked_by=worker_id,
+                    locked_at=now,
+                    attempts=Job.attempts + 1,
+                )
+            )
+            if result.rowcount == 1:
+                claimed.append(job_id)
+        db.commit()
+
+        if not claimed:
+            return []
+        jobs = db.execute(select(Job).where(Job.id.in_(claimed))).scalars().all()
+        db.expunge_all()
+        return list(jobs)
+
+
+def complete(job_id: int):
+    with SessionLocal() as db:
+        db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status=JobStatus.DONE, locked_by=None, last_error=None)
+        )
+        db.commit()
+
+
+def fail(job: Job, error: str):
+    """Reprograma la tarea o la pasa a DEAD si agoto los intentos."""
+    if job.attempts >= job.max_attempts:
+        values = {"status": JobStatus.DEAD}
+        logger.error(
+            "Job %s (%s) dead after %s attempts: %s",
+            job.id,
+            job.name,
+            job.attempts,
+            error,
+        )
+    else:
+        delay = backoff_seconds(job.attempts)
+        values = {
+            "status": JobStatus.QUEUED,
+            "run_at": _now() + timedelta(seconds=delay),
+        }
+        logger.warning(
+            "Job %s (%s) failed attempt %s, retrying in %.1fs: %s",
+            job.id,
+            job.name,
+            job.attempts,
+            delay,
+            error,
+        )
+
+    with SessionLocal() as db:
+        db.execute(
+            update(Job)
+            .where(Job.id == job.id)
+            .values(locked_by=None, last_error=error[:2000], **values)
+        )
+        db.commit()
+
+
+def requeue_stale(timeout: float = JOBS_LOCK_TIMEOUT) -> int:
+    """Devuelve a la cola las tareas de workers que murieron a mitad de camino."""
+    with SessionLocal() as db:
+        result = db.execute(
+            update(Job)
+            .where(
+                Job.status == JobStatus.RUNNING,
+                Job.locked_at < _now() - timedelta(seconds=timeout),
+            )
+            .values(status=JobStatus.QUEUED, locked_by=None)
+        )
+        db.commit()
+    if result.rowcount:
+        logger.warning("Requeued %s stale jobs", result.rowcount)
+    return result.rowcount
+
+
+def _prune_status(status: JobStatus, cutoff: datetime, batch_size: int) -> int:
+    # run_at <= fin de la tarea; usa ix_jobs_status_run_at
+    pruned = 0
+    while True:
+        with SessionLocal() as db:
+            ids = (
+                db.execute(
+                    select(Job.id)
+                    .where(Job.status == status, Job.run_at < cutoff)
+                    .limit(batch_size)
+                )
+                .scalars()
+                .all()
+            )
+            if not ids:
+                return pruned
+            db.execute(delete(Job).where(Job.id.in_(ids)))
+            db.commit()
+        pruned += len(ids)
+
+
+def prune_jobs(
+    retention_days: int = JOBS_RETENTION_DAYS,
+    dead_retention_days: int = JOBS_DEAD_RETENTION_DAYS,
+    batch_size: int = JOBS_PRUNE_BATCH_SIZE,
+) -> int:
+    """Borra en lotes las tareas DONE y DEAD viejas. Retorna cuantas."""
+    now = _now()
+    pruned = _prune_status(
+        JobStatus.DONE, now - timedelta(days=retention_days), batch_size
+    )
+    pruned += _prune_status(
+        JobStatus.DEAD, now - timedelta(days=dead_retention_days), batch_size
+    )
+    if pruned:
+        logger.info("Pruned %s finished jobs", pruned)
+    return pruned
+
+
+def retry_dead(job_id: int) -> bool:
+    """Reencola una tarea del dead-letter con los intentos en cero."""
+    with SessionLocal() as db:
+        result = db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.DEAD)
+            .values(status=JobStatus.QUEUED, attempts=0, run_at=_now())
+        )
+        db.commit()
+    return result.rowcount == 1
+
+
+def job_stats() -> dict[str, int]:
+    with SessionLocal() as db:
+        rows = db.execute(select(Job.status, func.count()).group_by(Job.status)).all()
+    counts = {status.value: 0 for status in JobStatus}
+    counts.update({status.value: count for status, count in rows})
+    return counts
+
+
+def list_jobs(status: JobStatus, limit: int = 50) -> list[Job]:
+    with SessionLocal() as db:
+        return list(
+            db.execute(
+                select(Job)
+                .where(Job.status == status)
+                .order_by(Job.updated_at.desc())
+                .limit(limit)
+            )
+            .scalars()
+            .all()
+        )
@@ -0,0 +1,31 @@
+"""
+Registro de handlers de tareas.
+
+Los servicios encolan por nombre (`enqueue(db, "resto.role_assigned", ...)`)
+y no importan los handlers; el worker carga TASK_MODULES para que se
+registren.
+"""
+
+import importlib
+from typing import Callable
+
+TASK_MODULES = ("app.resto.tasks",)
+
+HANDLERS: dict[str, Callable[..., None]] = {}
+
+
+def task(name: str):
+    """Registra la funcion decorada como handler de la tarea `name`."""
+
+    def decorator(func: Callable[..., None]):
+        if name in HANDLERS:
+            raise ValueError(f"Task {name} already registered")
+        HANDLERS[name] = func
+        return func
+
+    return decorator
+
+
+def load_tasks():
+    for module in TASK_MODULES:
+        importlib.import_module(module)
@@ -0,0 +1,52 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.config.types import JobStatus, Roles
+from app.jobs.dto import JobDTO
+from app.jobs.queue import job_stats, list_jobs, retry_dead
+from app.middlewares.security import role_required
+
+jobs_router = APIRouter(
+    prefix="/jobs",
+    tags=["Jobs"],
+    dependencies=[Depends(role_required(Roles.ADMIN))],
+)
+
+
+@jobs_router.get(
+    "/stats",
+    status_code=status.HTTP_200_OK,
+    summary="Job counts by status",
+    description="Number of background jobs queued, running, done and dead.",
+)
+def get_job_stats():
+    return job_stats()
+
+
+@jobs_router.get(
+    "/",
+    response_model=List[JobDTO],
+    status_code=status.HTTP_200_OK,
+    summary="List jobs",
+    description="Most recently updated jobs in the given status. Use status=dead to inspect the dead-letter queue.",
+)
+def get_jobs(
+    job_status: JobStatus = Query(JobStatus.DEAD, alias="status"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    return list_jobs(job_status, limit)
+
+
+@jobs_router.post(
+    "/{job_id}/retry",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Retry a dead job",
+    description="Moves a job from the dead-letter queue back to the queue with its attempts reset.",
+)
+def retry_job(job_id: int):
+    if not retry_dead(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Dead job not found"
+        )
+    return {"status": "queued"}
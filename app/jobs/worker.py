@@ -0,0 +1,107 @@
+"""
+Worker de tareas.
+
+Corre en un hilo propio: dentro de la app (JOBS_WORKER_IN_APP=1, arrancado en
+el lifespan) o como proceso aparte con `python worker.py`. Los handlers son
+sincronicos y nunca corren en el event loop de la API.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+
+from app.config import JOBS_BATCH_SIZE, JOBS_POLL_SECONDS
+from app.jobs.queue import claim, complete, fail, prune_jobs, requeue_stale
+from app.jobs.registry import HANDLERS, load_tasks
+
+logger = logging.getLogger(__name__)
+
+STALE_CHECK_SECONDS = 60
+PRUNE_SECONDS = 3600
+
+
+class JobWorker:
+    def __init__(
+        self,
+        poll_seconds: float = JOBS_POLL_SECONDS,
+        batch_size: int = JOBS_BATCH_SIZE,
+    ):
+        self.poll_seconds = poll_seconds
+        self.batch_size = batch_size
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_stale_check = 0.0
+        self._last_prune = 0.0
+
+    def run_once(self) -> int:
+        """Procesa un lote de tareas vencidas. Retorna cuantas tomo."""
+        now = time.monotonic()
+        if now - self._last_stale_check > STALE_CHECK_SECONDS:
+            self._last_stale_check = now
+            requeue_stale()
+        if now - self._last_prune > PRUNE_SECONDS:
+            self._last_prune = now
+            prune_jobs()
+
+        jobs = claim(self.worker_id, self.batch_size)
+        for job in jobs:
+            self._execute(job)
+        return len(jobs)
+
+    def _execute(self, job):
+        handler = HANDLERS.get(job.name)
+        if handler is None:
+            fail(job, f"No handler registered for {job.name}")
+            return
+
+        started = time.perf_counter()
+        try:
+            handler(**json.loads(job.payload))
+        except Exception as exc:
+            fail(job, "".join(traceback.format_exception_only(exc)).strip())
+            return
+
+        complete(job.id)
+        logger.debug(
+            "Job %s (%s) done in %.1f ms",
+            job.id,
+            job.name,
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def run_forever(self):
+        load_tasks()
+        logger.info("Job worker %s started", self.worker_id)
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception:
+                logger.exception("Job worker loop failed")
+                processed = 0
+            # Con un lote lleno puede haber mas esperando: no dormir
+            if processed < self.batch_size:
+                self._stop.wait(self.poll_seconds)
+        logger.info("Job worker %s stopped", self.worker_id)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run_forever, name="job-worker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+job_worker = JobWorker()
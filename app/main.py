@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI, Request, status
@@ -6,16 +8,74 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, Response
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.config import HOST, PORT
+from app.auth.revocation import revocation_list
+from app.config import (
+    DOCS_ENABLED,
+    ENV,
+    HOST,
+    JOBS_WORKER_IN_APP,
+    OUTBOX_RELAY_IN_APP,
+    PORT,
+    WARMUP_ENABLED,
+)
+from app.diagnostics.loop_monitor import loop_monitor
+from app.events.relay import outbox_relay
+from app.health.services import start_draining
+from app.health.warmup import warm_up
+from app.jobs.worker import job_worker
 from app.middlewares.auth import AuthMiddleware, custom_openapi
+from app.middlewares.inflight import InFlightMiddleware
+from app.middlewares.loadshed import LoadShedMiddleware
+from app.middlewares.login_throttle import LoginThrottleMiddleware
+from app.middlewares.profiling import RequestProfilingMiddleware
+from app.middlewares.ratelimit import RateLimitMiddleware
 from app.routes import api_router
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(server: FastAPI):
+    if WARMUP_ENABLED:
+        await asyncio.to_thread(warm_up, server)
+    loop_monitor.start()
+    await asyncio.to_thread(revocation_list.start)
+    if JOBS_WORKER_IN_APP:
+        job_worker.start()
+    if OUTBOX_RELAY_IN_APP:
+        outbox_relay.start()
+    yield
+    # Readiness falla mientras el worker termina de atender lo pendiente
+    start_draining()
+    if JOBS_WORKER_IN_APP:
+        await asyncio.to_thread(job_worker.stop)
+    if OUTBOX_RELAY_IN_APP:
+        await asyncio.to_thread(outbox_relay.stop)
+    await asyncio.to_thread(revocation_list.stop)
+    await loop_monitor.stop()
+
+
 def create_app() -> FastAPI:
-    server = FastAPI(title="Restorant Backend API")
+    # En produccion DOCS_ENABLED=0 no expone /docs, /redoc ni /openapi.json
+    docs = {} if DOCS_ENABLED else {"docs_url": None, "redoc_url": None}
+    server = FastAPI(
+        title="Restorant Backend API",
+        lifespan=lifespan,
+        openapi_url="/openapi.json" if DOCS_ENABLED else None,
+        **docs,
+    )
+
+    # Mas interno: corre en la misma tarea que el endpoint
+    server.add_middleware(InFlightMiddleware)
+    # Dentro de AuthMiddleware: necesita el rol admin del token
+    server.add_middleware(RequestProfilingMiddleware)
+    # Dentro de CORS para que el 429 llegue al navegador con sus headers
+    server.add_middleware(LoginThrottleMiddleware)
+    # Dentro de AuthMiddleware: usa el user_id del token como clave
+    server.add_middleware(RateLimitMiddleware)
+    # Afuera de los limites por ruta: mide la latencia de todo lo admitido
+    server.add_middleware(LoadShedMiddleware)
 
     server.add_middleware(
         CORSMiddleware,
@@ -51,7 +111,7 @@ def create_app() -> FastAPI:
         )
 
     def custom_openapi_handler():
-        return custom_openapi(app)
+        return custom_openapi(server)
 
     server.openapi = custom_openapi_handler  # type: ignore
     return server
@@ -60,12 +120,13 @@ def create_app() -> FastAPI:
 app = create_app()
 
 if __name__ == "__main__":
+    # Servidor de desarrollo; en produccion usar serve.py (varios workers)
     try:
         uvicorn.run(
             "app.main:app",
             host=HOST,
             port=PORT,
-            reload=True,
+            reload=ENV == "DEV",
         )
     except OSError as e:
         logger.critical("OS error while starting server: %s", e, exc_info=True)
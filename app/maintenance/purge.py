@@ -0,0 +1,151 @@
+"""
+Purga de filas con borrado logico.
+
+`soft_delete_user`, `soft_delete_table` y `delete_menu_entry` solo marcan
+`deleted_at`; pasado el periodo de retencion esas filas se borran de verdad
+para que los scans e indices vuelvan a ser proporcionales a los datos vivos.
+
+Una fila solo se borra si nada vivo la referencia: mesas sin ordenes en
+`orders`, items de menu sin lineas ni filas de rollup, y usuarios cuyo perfil de
+mozo no tenga ordenes, mesas ni rollup. Las ordenes archivadas no tienen claves
+foraneas y no bloquean la purga. Lo que queda referenciado se reintenta en la
+proxima corrida.
+
+Cada lote es una transaccion corta. Al final `compact` corre ANALYZE y, en
+SQLite, VACUUM para devolver las paginas liberadas.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, exists, or_, select, text, update
+
+from app.config import PURGE_BATCH_SIZE, PURGE_RETENTION_DAYS
+from app.config.cnx import SessionLocal, engine
+from app.config.sql_models import (
+    Admin,
+    Cashier,
+    Cook,
+    DailySalesRollup,
+    Device,
+    MenuItem,
+    Order,
+    RefreshToken,
+    RestorantTable,
+    StaffPin,
+    User,
+    UserRole,
+    Waiter,
+    order_menuitem_association,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _purgeable_tables(cutoff: datetime):
+    return select(RestorantTable.id).where(
+        RestorantTable.deleted_at < cutoff,
+        ~exists().where(Order.table_id == RestorantTable.id),
+    )
+
+
+def _purgeable_menu_items(cutoff: datetime):
+    lines = order_menuitem_association
+    return select(MenuItem.id).where(
+        MenuItem.deleted_at < cutoff,
+        ~exists().where(lines.c.menu_item_id == MenuItem.id),
+        ~exists().where(DailySalesRollup.menu_item_id == MenuItem.id),
+    )
+
+
+def _purgeable_users(cutoff: datetime):
+    waiter_in_use = (
+        exists()
+        .where(
+            Waiter.user_id == User.id,
+            or_(
+                exists().where(Order.waiter_id == Waiter.id),
+                exists().where(RestorantTable.waiter_id == Waiter.id),
+                exists().where(DailySalesRollup.waiter_id == Waiter.id),
+            ),
+        )
+    )
+    return select(User.id).where(User.deleted_at < cutoff, ~waiter_in_use)
+
+
+def _delete_tables(db, ids: list[int]):
+    db.execute(delete(RestorantTable).where(RestorantTable.id.in_(ids)))
+
+
+def _delete_menu_items(db, ids: list[int]):
+    db.execute(delete(MenuItem).where(MenuItem.id.in_(ids)))
+
+
+def _delete_users(db, ids: list[int]):
+    # Perfiles y sesiones primero, por las claves foraneas hacia users
+    db.execute(delete(RefreshToken).where(RefreshToken.user_id.in_(ids)))
+    db.execute(delete(UserRole).where(UserRole.user_id.in_(ids)))
+    db.execute(delete(StaffPin).where(StaffPin.user_id.in_(ids)))
+    db.execute(
+        update(Device).where(Device.created_by.in_(ids)).values(created_by=None)
+    )
+    db.execute(delete(Waiter).where(Waiter.user_id.in_(ids)))
+    db.execute(delete(Cook).where(Cook.user_id.in_(ids)))
+    db.execute(delete(Cashier).where(Cashier.user_id.in_(ids)))
+    db.execute(delete(Admin).where(Admin.id.in_(ids)))
+    db.execute(delete(User).where(User.id.in_(ids)))
+
+
+TARGETS = {
+    "tables": (_purgeable_tables, _delete_tables),
+    "menu_items": (_purgeable_menu_items, _delete_menu_items),
+    "users": (_purgeable_users, _delete_users),
+}
+
+
+def purge_target(name: str, cutoff: datetime, batch_size: int) -> int:
+    """Borra en lotes las filas purgables de un tipo. Retorna cuantas."""
+    candidates, remove = TARGETS[name]
+    purged = 0
+
+    while True:
+        with SessionLocal() as db:
+            ids = db.execute(candidates(cutoff).limit(batch_size)).scalars().all()
+            if not ids:
+                break
+            remove(db, ids)
+            db.commit()
+
+        purged += len(ids)
+        logger.info("Purged %s %s (%s total)", len(ids), name, purged)
+
+    return purged
+
+
+def compact():
+    """Actualiza estadisticas y, en SQLite, devuelve el espacio libre al disco."""
+    # VACUUM no puede correr dentro de una transaccion
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if engine.dialect.name == "sqlite":
+            conn.execute(text("VACUUM"))
+            conn.execute(text("ANALYZE"))
+        else:
+            conn.execute(text("VACUUM ANALYZE"))
+
+
+def purge_soft_deleted(
+    retention_days: int = PURGE_RETENTION_DAYS,
+    batch_size: int = PURGE_BATCH_SIZE,
+    vacuum: bool = True,
+) -> dict:
+    """
+    Purga mesas, items de menu y usuarios borrados hace mas de
+    `retention_days` dias. Retorna la cantidad borrada por tipo.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    result = {name: purge_target(name, cutoff, batch_size) for name in TARGETS}
+
+    if vacuum and any(result.values()):
+        compact()
+
+    return result
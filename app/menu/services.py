@@ -1,15 +1,60 @@
 import logging
+import threading
+import time
 from datetime import datetime, timezone
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.config import MENU_CACHE_SECONDS
 from app.config.cnx import SessionLocal
 from app.config.sql_models import MenuItem
-from app.menu.dto import CreateMenuItemDTO, UpdateMenuItemDTO
+from app.menu.dto import CreateMenuItemDTO, MenuItemDTO, UpdateMenuItemDTO
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(level=logging.INFO)
+
+class MenuCache:
+    """
+    Menu activo ya validado como DTOs, con TTL.
+
+    Las escrituras de este proceso lo invalidan en el acto; con varios workers
+    los demas procesos ven el cambio cuando vence el TTL.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._items: list[MenuItemDTO] | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> list[MenuItemDTO]:
+        items = self._items
+        if items is not None and time.monotonic() - self._loaded_at <= self.ttl:
+            return items
+
+        with self._lock:
+            if self._items is None or time.monotonic() - self._loaded_at > self.ttl:
+                self._items = _load_menu()
+                self._loaded_at = time.monotonic()
+            return self._items
+
+    def invalidate(self):
+        with self._lock:
+            self._items = None
+
+
+def _load_menu() -> list[MenuItemDTO]:
+    with SessionLocal() as db:
+        items = (
+            db.query(MenuItem)
+            .filter(MenuItem.deleted_at.is_(None))
+            .order_by(MenuItem.id)
+            .all()
+        )
+        return [MenuItemDTO.model_validate(item) for item in items]
+
+
+menu_cache = MenuCache(MENU_CACHE_SECONDS)
 
 
 def create_menu_entry(menuItem: CreateMenuItemDTO):
@@ -30,6 +75,7 @@ def create_menu_entry(menuItem: CreateMenuItemDTO):
             db.add(new_item)
             db.commit()
             db.refresh(new_item)
+            menu_cache.invalidate()
             logger.info(
                 "Created new menu item with id %s",
                 new_item.id,
@@ -48,9 +94,7 @@ def create_menu_entry(menuItem: CreateMenuItemDTO):
 
 def get_all_menu_entries():
     """Busca y retorna todos las entradas de menu activas."""
-    with SessionLocal() as db:
-        items = db.query(MenuItem).filter(MenuItem.deleted_at.is_(None)).all()
-        return items
+    return menu_cache.get()
 
 
 def delete_menu_entry(item_id: int):
@@ -67,6 +111,7 @@ def delete_menu_entry(item_id: int):
             deleted_item.deleted_at = datetime.now(timezone.utc)
             db.commit()
             db.refresh(deleted_item)
+            menu_cache.invalidate()
 
             logger.info("Soft-deleted menu item with id %s", item_id)
             return deleted_item
@@ -94,6 +139,7 @@ def update_menu_entry(menu_id: int, update_data: UpdateMenuItemDTO) -> MenuItem:
             db.add(item)
             db.commit()
             db.refresh(item)
+            menu_cache.invalidate()
             return item
 
     except SQLAlchemyError as e:
@@ -107,13 +153,7 @@ def update_menu_entry(menu_id: int, update_data: UpdateMenuItemDTO) -> MenuItem:
 
 def get_all_menu_entries_from_category(filter_value: str):
     """Busca y retorna todos las entradas de menu activas dentro de una categoria especifica."""
-    with SessionLocal() as db:
-        items = (
-            db.query(MenuItem)
-            .filter(MenuItem.deleted_at.is_(None), MenuItem.category == filter_value)
-            .all()
-        )
-        return items
+    return [item for item in menu_cache.get() if item.category == filter_value]
 
 
 def create_menu_entries(menu_items: list[CreateMenuItemDTO]):
@@ -142,6 +182,7 @@ def create_menu_entries(menu_items: list[CreateMenuItemDTO]):
 
             for item in created_items:
                 db.refresh(item)
+            menu_cache.invalidate()
 
             logger.info(
                 "Created %s menu items successfully",
@@ -166,6 +207,7 @@ def hard_delete_all_menu_items():
         with SessionLocal() as db:
             deleted_count = db.query(MenuItem).delete()
             db.commit()
+            menu_cache.invalidate()
 
             logger.info("Hard-deleted %s menu items", deleted_count)
             return deleted_count
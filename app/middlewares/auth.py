@@ -1,23 +1,24 @@
-import os
+import asyncio
+import uuid
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 from typing import Optional
 
 import bcrypt
 import jwt
-from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.openapi.utils import get_openapi
 from fastapi.security import OAuth2PasswordBearer
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
-from app.config import ENV
-
-load_dotenv()
-
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-SECRET_KEY = os.getenv("SECRET_KEY", "1234").encode("utf-8")
+from app.auth.revocation import revocation_list
+from app.config import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ALGORITHM,
+    DEV_LONG_LIVED_TOKENS,
+    DOCS_ENABLED,
+    SECRET_KEY,
+)
 
 # Rutas públicas (no requieren token)
 PUBLIC_ROUTES = [
@@ -25,23 +26,37 @@ PUBLIC_ROUTES = [
     "/home",
     "/test",
     "/health",
-    "/docs",
-    "/redoc",
-    "/openapi.json",
     "/favicon.ico",
 ]
 
+# Documentación: solo pública si está habilitada (DOCS_ENABLED)
+DOCS_ROUTES = ["/docs", "/redoc", "/openapi.json"] if DOCS_ENABLED else []
+PUBLIC_ROUTES += DOCS_ROUTES
+
 # Rutas que requieren métodos específicos pero no autenticación
 PUBLIC_METHODS = {
     "/api/users": ["POST"],  # Registro público
     "/api/users/login": ["POST", "OPTIONS"],  # Login público
     "/api/auth/login": ["POST", "OPTIONS"],  # Login público
+    "/api/auth/refresh": ["POST", "OPTIONS"],  # Renovación con refresh token
+    "/api/auth/pin": ["POST", "OPTIONS"],  # Cambio de usuario en tablet (PIN)
     "/api/health": ["GET"],
 }
 
 # Rutas que requieren autenticación pero no verificación de permisos
 AUTHENTICATED_ONLY_ROUTES: list[str] = []
 
+# Tokens emitidos por PIN en una tablet: solo sirven para el trabajo de salon
+DEVICE_SCOPE = "device"
+DEVICE_SCOPE_PREFIXES = (
+    "/api/orders",
+    "/api/tables",
+    "/api/menu",
+    "/api/auth/me",
+    "/api/auth/pin",
+    "/api/auth/logout",
+)
+
 
 def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
@@ -56,21 +71,21 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     expire = datetime.now(timezone.utc) + (
         expires_delta
         if expires_delta
-        else timedelta(minutes=float(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")))
+        else timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
 
-    if ENV == "DEV":
+    # Solo con opt-in explicito y nunca para tokens con duracion propia (PIN)
+    if DEV_LONG_LIVED_TOKENS and expires_delta is None:
         expire = datetime.now(timezone.utc) + timedelta(days=36500)  # 100 years
 
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=os.getenv("ALGORITHM", "HS256"))
+    # jti: identificador para poder revocar el token (ver app/auth/revocation.py)
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
 def verify_jwt_token(token: str) -> dict:
     try:
-        return jwt.decode(
-            token, SECRET_KEY, algorithms=[os.getenv("ALGORITHM", "HS256")]
-        )
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.ExpiredSignatureError as err:
         raise HTTPException(status_code=401, detail="Token expirado") from err
     except jwt.InvalidTokenError as err:
@@ -119,6 +134,10 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 payload = verify_jwt_token(authorization)
                 request.state.user = payload
 
+            rejection = await self.reject_token(payload, path)
+            if rejection is not None:
+                return rejection
+
         except ValueError:
             return JSONResponse(
                 status_code=401, content={"detail": "Formato de token inválido"}
@@ -132,6 +151,24 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         return await call_next(request)
 
+    async def reject_token(self, payload: dict, path: str) -> JSONResponse | None:
+        """Respuesta de error si el token valido esta revocado o fuera de su alcance."""
+        # El filtro descarta casi todos los tokens sin consultar la base
+        jti = payload.get("jti")
+        if revocation_list.might_be_revoked(jti) and await asyncio.to_thread(
+            revocation_list.is_revoked, jti
+        ):
+            return JSONResponse(status_code=401, content={"detail": "Token revocado"})
+
+        if payload.get("scope") == DEVICE_SCOPE and not path.startswith(
+            DEVICE_SCOPE_PREFIXES
+        ):
+            return JSONResponse(
+                status_code=403,
+                content={"detail": "Token de dispositivo sin acceso a esta ruta"},
+            )
+        return None
+
     def is_public_route(self, path: str, method: str) -> bool:
         # Rutas completamente públicas
         if path in PUBLIC_ROUTES:
@@ -141,7 +178,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             if path.startswith(route) and method in methods:
                 return True
         # Prefijos para documentación
-        for prefix in ["/docs", "/redoc"]:
+        for prefix in DOCS_ROUTES:
             if path.startswith(prefix):
                 return True
         return False
@@ -153,9 +190,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/users/login")
 
 async def verify_token(token: str = Depends(oauth2_scheme)):
     try:
-        return jwt.decode(
-            token, SECRET_KEY, algorithms=[os.getenv("ALGORITHM", "HS256")]
-        )
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.ExpiredSignatureError as err:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expirado"
@@ -0,0 +1,44 @@
+"""
+Registro de las requests en curso por tarea de asyncio.
+
+Permite que herramientas de diagnostico que corren en otro hilo (detector de
+bloqueos, profiler) atribuyan lo que ven en el loop a la ruta que lo causa.
+"""
+
+import asyncio
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+IN_FLIGHT: dict[asyncio.Task, str] = {}
+
+
+def route_for_task(task: asyncio.Task | None) -> str | None:
+    if task is None:
+        return None
+    return IN_FLIGHT.get(task)
+
+
+class InFlightMiddleware:
+    """
+    Debe ser el middleware mas interno: asi corre en la misma tarea que el
+    endpoint aunque los middlewares externos creen tareas nuevas.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        if task is None:
+            await self.app(scope, receive, send)
+            return
+
+        IN_FLIGHT[task] = f"{scope['method']} {scope['path']}"
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            IN_FLIGHT.pop(task, None)
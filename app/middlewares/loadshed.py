@@ -0,0 +1,168 @@
+"""
+Control de admision: rechaza trafico de baja prioridad cuando el worker se
+satura, para que el flujo de cocina siga respondiendo.
+
+La señal de saturacion sigue la idea de CoDel: en cada intervalo se guarda la
+menor latencia de las requests que terminaron. Si hasta la mas rapida supero
+LOAD_SHED_TARGET_MS (o el lag del event loop lo supero) con al menos
+LOAD_SHED_MIN_INFLIGHT requests en curso, hay cola de verdad y no solo un
+reporte lento. Cada intervalo saturado sube un nivel y cada intervalo sano lo
+baja:
+
+- nivel 1: se rechazan las rutas LOW (reportes, analitica, diagnostico...);
+- nivel 2: tambien las NORMAL (listados genericos: usuarios, mesas, resto...).
+
+Las HIGH (lecturas de ordenes y menu que usan cocina y mozos, otras
+escrituras, login) y CRITICAL (alta y cambio de estado de ordenes, health)
+nunca se rechazan. La prioridad sale de los tags de cada
+router en app/routes.py y del metodo; solo se resuelve mientras hay un nivel
+activo, asi que sin saturacion el costo es un contador.
+"""
+
+import math
+import time
+from enum import IntEnum
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import (
+    LOAD_SHED_ENABLED,
+    LOAD_SHED_INTERVAL_MS,
+    LOAD_SHED_MIN_INFLIGHT,
+    LOAD_SHED_TARGET_MS,
+)
+from app.diagnostics.loop_monitor import loop_monitor
+from app.middlewares.ratelimit import send_json_error
+
+
+class Priority(IntEnum):
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+    CRITICAL = 3
+
+
+# Tags de los routers (app/routes.py)
+LOW_PRIORITY_TAGS = frozenset(
+    {"Reports", "Analytics", "Jobs", "Events", "Diagnostics"}
+)
+CRITICAL_TAGS = frozenset({"Health"})
+# Escrituras que la cocina necesita siempre
+CRITICAL_WRITE_TAGS = frozenset({"Orders"})
+# Lecturas del flujo de cocina: pantallas de ordenes y menu para tomar pedidos
+HIGH_READ_TAGS = frozenset({"Orders", "Menu"})
+
+# Rechaza como mucho LOW y NORMAL
+MAX_SHED_LEVEL = int(Priority.HIGH)
+
+
+def route_priority(tags: list[str], method: str) -> Priority:
+    tags = set(tags)
+    if tags & CRITICAL_TAGS:
+        return Priority.CRITICAL
+    if method != "GET" and tags & CRITICAL_WRITE_TAGS:
+        return Priority.CRITICAL
+    if tags & LOW_PRIORITY_TAGS:
+        return Priority.LOW
+    if method == "GET":
+        return Priority.HIGH if tags & HIGH_READ_TAGS else Priority.NORMAL
+    return Priority.HIGH
+
+
+def priority_for(scope: Scope) -> Priority:
+    app = scope.get("app")
+    for route in getattr(app, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route_priority(getattr(route, "tags", None) or [], scope["method"])
+    return Priority.NORMAL
+
+
+class LoadShedder:
+    def __init__(self, target_ms: float, interval_ms: float, min_inflight: int):
+        self.target = target_ms / 1000
+        self.interval = interval_ms / 1000
+        self.min_inflight = min_inflight
+
+        self.level = 0
+        self.inflight = 0
+        self.shed = 0
+        self._interval_start = time.monotonic()
+        self._interval_min = math.inf
+        self._interval_peak = 0
+
+    def admit(self, priority: Priority) -> bool:
+        if priority >= self.level:
+            return True
+        self.shed += 1
+        return False
+
+    def started(self):
+        self.inflight += 1
+        self._interval_peak = max(self._interval_peak, self.inflight)
+
+    def finished(self, elapsed: float):
+        self.inflight -= 1
+        self._interval_min = min(self._interval_min, elapsed)
+
+    def tick(self, now: float):
+        """Cierra el intervalo si ya paso y ajusta el nivel."""
+        if now - self._interval_start < self.interval:
+            return
+
+        lag = loop_monitor.recent_max_lag_ms() / 1000 if loop_monitor.running else 0
+        # Sin requests terminadas en todo el intervalo tambien es cola
+        floor = max(self._interval_min, lag)
+        busy = max(self._interval_peak, self.inflight) >= self.min_inflight
+        if busy and floor > self.target:
+            self.level = min(self.level + 1, MAX_SHED_LEVEL)
+        elif self.level:
+            self.level -= 1
+
+        self._interval_start = now
+        self._interval_min = math.inf
+        self._interval_peak = self.inflight
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": bool(LOAD_SHED_ENABLED),
+            "level": self.level,
+            "shedding": [p.name for p in Priority if p < self.level],
+            "inflight": self.inflight,
+            "shed_total": self.shed,
+            "target_ms": self.target * 1000,
+            "interval_ms": self.interval * 1000,
+        }
+
+
+load_shedder = LoadShedder(
+    LOAD_SHED_TARGET_MS, LOAD_SHED_INTERVAL_MS, LOAD_SHED_MIN_INFLIGHT
+)
+
+
+class LoadShedMiddleware:
+    def __init__(self, app: ASGIApp, shedder: LoadShedder = load_shedder):
+        self.app = app
+        self.shedder = shedder
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not LOAD_SHED_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        shedder = self.shedder
+        started = time.monotonic()
+        shedder.tick(started)
+
+        if shedder.level and not shedder.admit(priority_for(scope)):
+            await send_json_error(
+                send, 503, "Servidor saturado, reintentar", shedder.interval
+            )
+            return
+
+        shedder.started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            shedder.finished(time.monotonic() - started)
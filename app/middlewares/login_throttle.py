@@ -0,0 +1,47 @@
+"""
+Corte por IP de los intentos de login y de cambio por PIN antes de leer el
+body.
+
+El limite por email (y el de PINs por tablet) se aplica en el endpoint, una
+vez parseado el body, pero igual antes de tocar la base o bcrypt.
+
+Con LOGIN_THROTTLE_BACKEND=sqlite el chequeo escribe en un archivo y puede
+esperar su lock, asi que corre en un hilo para no frenar el event loop; el
+backend en memoria se consulta en linea.
+"""
+
+import asyncio
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.auth.throttle import login_throttle
+from app.config import LOGIN_THROTTLE_BACKEND
+from app.middlewares.ratelimit import send_json_error
+
+LOGIN_PATHS = frozenset({"/api/auth/login", "/api/auth/pin"})
+
+
+class LoginThrottleMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in LOGIN_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        if LOGIN_THROTTLE_BACKEND == "sqlite":
+            wait = await asyncio.to_thread(login_throttle.check_ip, ip)
+        else:
+            wait = login_throttle.check_ip(ip)
+        if not wait:
+            await self.app(scope, receive, send)
+            return
+
+        await send_json_error(send, 429, "Demasiados intentos de login", wait)
@@ -0,0 +1,79 @@
+"""
+Profiling por request activado con el header `X-Profile: 1`.
+
+Solo se respeta para tokens con rol admin y si no hay otro muestreo en curso.
+El perfil se guarda en memoria y se consulta con el id devuelto en el header
+`X-Profile-Id` (GET /api/diagnostics/profile/{profile_id}).
+"""
+
+import logging
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.types import Roles
+from app.diagnostics.profiler import (
+    StackSampler,
+    profile_store,
+    release_profiler,
+    try_acquire_profiler,
+)
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+
+
+def _is_admin(scope: Scope) -> bool:
+    user = scope.get("state", {}).get("user") or {}
+    return Roles.ADMIN.value in user.get("roles", [])
+
+
+class RequestProfilingMiddleware:
+    """Debe ir dentro de AuthMiddleware para conocer los roles del token."""
+
+    def __init__(self, app: ASGIApp, interval_ms: float = 5):
+        self.app = app
+        self.interval_ms = interval_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if Headers(scope=scope).get(PROFILE_HEADER) != "1" or not _is_admin(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not try_acquire_profiler():
+            logger.info("Profiling omitido: ya hay un muestreo en curso")
+            await self.app(scope, receive, send)
+            return
+
+        # El id se genera antes para poder enviarlo en los headers de respuesta
+        profile_id = uuid.uuid4().hex
+        sampler = StackSampler(
+            interval_ms=self.interval_ms,
+            label=f"{scope['method']} {scope['path']}",
+        )
+
+        async def send_with_profile_id(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Profile-Id"] = profile_id
+            await send(message)
+
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            result = sampler.stop()
+            release_profiler()
+            result.id = profile_id
+            profile_store.add(result)
+            logger.info(
+                "Perfil de request %s guardado (%s muestras)",
+                profile_id,
+                result.samples,
+            )
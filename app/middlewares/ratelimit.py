@@ -0,0 +1,208 @@
+"""
+Limites por ruta: token bucket por usuario y concurrencia maxima por grupo.
+
+Cada regla de ROUTE_LIMITS agrupa rutas por metodo y prefijo de path:
+
+- `rate` / `burst`: token bucket por usuario (el `user_id` del JWT que dejo
+  AuthMiddleware en el scope, o la IP si no hay token). Sin tokens -> 429.
+- `max_concurrent` / `max_queue` / `queue_timeout`: cuantas requests del grupo
+  corren a la vez en el proceso y cuantas pueden esperar turno. Con la cola
+  llena, o si la espera vence, -> 503.
+
+Asi un reporte pesado ocupa como mucho `max_concurrent` hilos del threadpool y
+el alta de ordenes siempre encuentra lugar. Los limites son por proceso.
+"""
+
+import asyncio
+import json
+import math
+import time
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import RATE_LIMITS_ENABLED
+
+
+@dataclass(frozen=True)
+class RouteLimit:
+    name: str
+    prefix: str
+    methods: frozenset[str] = frozenset({"GET"})
+    rate: float = 0.0  # tokens por segundo (0 = sin token bucket)
+    burst: int = 1
+    max_concurrent: int = 0  # 0 = sin limite de concurrencia
+    max_queue: int = 0
+    queue_timeout: float = 5.0
+
+
+# Primera regla que coincide gana
+ROUTE_LIMITS = [
+    RouteLimit(
+        "reports",
+        "/api/reports/",
+        rate=1,
+        burst=10,
+        max_concurrent=2,
+        max_queue=8,
+        queue_timeout=10,
+    ),
+    RouteLimit(
+        "analytics",
+        "/api/analytics/",
+        rate=0.5,
+        burst=5,
+        max_concurrent=1,
+        max_queue=4,
+        queue_timeout=30,
+    ),
+    RouteLimit("orders_polling", "/api/orders/", rate=5, burst=20),
+    RouteLimit("menu", "/api/menu/", rate=10, burst=30),
+]
+
+
+async def send_json_error(
+    send: Send, status: int, detail: str, retry_after: float | None = None
+):
+    """Responde un error JSON directo desde un middleware ASGI."""
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    if retry_after is not None:
+        headers.append((b"retry-after", str(max(math.ceil(retry_after), 1)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class TokenBuckets:
+    """Un bucket por clave; los buckets llenos se descartan al podar."""
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 50_000):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        # clave -> [tokens, ultimo refill]
+        self._buckets: dict[str, list[float]] = {}
+
+    def take(self, key: str, now: float | None = None) -> float:
+        """Consume un token. Retorna 0 o los segundos hasta el proximo token."""
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            bucket = self._buckets[key] = [float(self.burst), now]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / self.rate
+
+    def _prune(self, now: float):
+        # Un bucket que ya se relleno equivale a uno nuevo
+        full_after = self.burst / self.rate
+        stale = [k for k, (_, last) in self._buckets.items() if now - last > full_after]
+        for key in stale:
+            del self._buckets[key]
+
+
+class ConcurrencyLimit:
+    """Semaforo con cola acotada."""
+
+    def __init__(self, max_concurrent: int, max_queue: int, timeout: float):
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.running = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def acquire(self) -> bool:
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                return False
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.running += 1
+        return True
+
+    def release(self):
+        self.running -= 1
+        self._semaphore.release()
+
+
+def _client_key(scope: Scope) -> str:
+    user = scope.get("state", {}).get("user")
+    if user and user.get("user_id"):
+        return f"user:{user['user_id']}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    """Debe quedar dentro de AuthMiddleware para ver el usuario del token."""
+
+    def __init__(self, app: ASGIApp, limits: list[RouteLimit] | None = None):
+        self.app = app
+        self.limits = ROUTE_LIMITS if limits is None else limits
+        self.buckets = {
+            limit.name: TokenBuckets(limit.rate, limit.burst)
+            for limit in self.limits
+            if limit.rate
+        }
+        self.concurrency = {
+            limit.name: ConcurrencyLimit(
+                limit.max_concurrent, limit.max_queue, limit.queue_timeout
+            )
+            for limit in self.limits
+            if limit.max_concurrent
+        }
+
+    def match(self, method: str, path: str) -> RouteLimit | None:
+        for limit in self.limits:
+            if method in limit.methods and path.startswith(limit.prefix):
+                return limit
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not RATE_LIMITS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.match(scope["method"], scope["path"])
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        buckets = self.buckets.get(limit.name)
+        if buckets is not None:
+            wait = buckets.take(_client_key(scope))
+            if wait:
+                await send_json_error(send, 429, "Demasiadas requests", wait)
+                return
+
+        concurrency = self.concurrency.get(limit.name)
+        if concurrency is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await concurrency.acquire():
+            await send_json_error(
+                send, 503, "Servicio ocupado, reintentar", limit.queue_timeout
+            )
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            concurrency.release()
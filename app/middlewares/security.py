@@ -3,19 +3,16 @@ Security utilities for FastAPI with JWT authentication
 """
 
 import logging
-import os
 
 import jwt
-from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.config import SECRET_KEY
+from app.auth.roles import role_cache
+from app.config import ALGORITHM, SECRET_KEY
 from app.config.types import Roles
+from app.middlewares.auth import DEVICE_SCOPE
 
-load_dotenv()
-
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -49,9 +46,7 @@ def get_current_user_token(
 
     try:
         # decode the token
-        payload = jwt.decode(
-            token, SECRET_KEY, algorithms=[os.getenv("ALGORITHM", "HS256")]
-        )
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
         user_id = payload.get("user_id")
         email = payload.get("sub")
@@ -69,6 +64,7 @@ def get_current_user_token(
             "user_id": user_id,
             "user_email": email,
             "roles": roles,
+            "scope": payload.get("scope"),
         }
 
     except jwt.ExpiredSignatureError as err:
@@ -87,7 +83,11 @@ def get_current_user_token(
 
 def role_required(role: str | Roles):
     def dependency(token=Depends(get_current_user_token)):
-        user_roles = token["roles"]
+        # Roles actuales y no los del token, asi un cambio rige sin re-login
+        user_roles = role_cache.get(int(token["user_id"]))
+        if token.get("scope") == DEVICE_SCOPE:
+            # Sesion de tablet: nunca con permisos de admin
+            user_roles = tuple(r for r in user_roles if r != Roles.ADMIN)
         if not user_roles:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="No roles in token"
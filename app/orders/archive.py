@@ -0,0 +1,177 @@
+"""
+Archivo de ordenes cerradas.
+
+`orders` solo deberia tener la ventana de servicio actual. Las ordenes
+entregadas o canceladas con mas de ARCHIVE_AFTER_DAYS dias se mueven a
+`orders_archive` (y sus lineas a `order_menuitem_archive`) en lotes chicos,
+cada uno en su propia transaccion, para no retener el lock de escritura mientras
+el servicio sigue tomando pedidos.
+
+Los reportes leen ambas tablas con `order_history` / `line_history`, que
+aplican el filtro de fechas en cada rama del UNION ALL para que cada tabla use
+su indice de reportes.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, literal, select, union_all
+
+from app.config import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE
+from app.config.cnx import SessionLocal
+from app.config.sql_models import (
+    ArchivedOrder,
+    Order,
+    order_menuitem_archive,
+    order_menuitem_association,
+)
+from app.config.types import OrderStatus
+
+logger = logging.getLogger(__name__)
+
+CLOSED_STATUSES = (OrderStatus.DELIVERED, OrderStatus.CANCELED)
+
+ORDER_COLUMNS = (
+    "id",
+    "table_id",
+    "waiter_id",
+    "total",
+    "status",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+)
+
+
+def archive_batch(cutoff: datetime, batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+    """Mueve un lote de ordenes cerradas anteriores a `cutoff`. Retorna cuantas."""
+    hot = Order.__table__
+    with SessionLocal() as db:
+        # La ultima orden nunca se archiva: SQLite asigna max(id) + 1 y sin
+        # ella un id nuevo podria repetir uno ya archivado
+        last_id = db.execute(select(func.max(hot.c.id))).scalar()
+        ids = (
+            db.execute(
+                select(hot.c.id)
+                .where(
+                    hot.c.status.in_(CLOSED_STATUSES),
+                    hot.c.created_at < cutoff,
+                    hot.c.id < last_id,
+                )
+                .order_by(hot.c.id)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not ids:
+            return 0
+
+        columns = [hot.c[name] for name in ORDER_COLUMNS]
+        db.execute(
+            insert(ArchivedOrder.__table__).from_select(
+                [*ORDER_COLUMNS, "archived_at"],
+                select(*columns, literal(datetime.now(timezone.utc))).where(
+                    hot.c.id.in_(ids)
+                ),
+            )
+        )
+
+        lines = order_menuitem_association
+        db.execute(
+            insert(order_menuitem_archive).from_select(
+                ["order_id", "menu_item_id", "price"],
+                select(lines.c.order_id, lines.c.menu_item_id, lines.c.price).where(
+                    lines.c.order_id.in_(ids)
+                ),
+            )
+        )
+        db.execute(delete(lines).where(lines.c.order_id.in_(ids)))
+        db.execute(delete(hot).where(hot.c.id.in_(ids)))
+        db.commit()
+
+    return len(ids)
+
+
+def archive_closed_orders(
+    older_than_days: int = ARCHIVE_AFTER_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    max_batches: int | None = None,
+    pause: float = 0.0,
+) -> int:
+    """
+    Archiva en lotes todas las ordenes cerradas con mas de `older_than_days`
+    dias. `pause` deja respirar a los escritores concurrentes entre lotes.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    archived = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        started = time.perf_counter()
+        moved = archive_batch(cutoff, batch_size)
+        if not moved:
+            break
+
+        archived += moved
+        batches += 1
+        logger.info(
+            "Archived %s orders in %.0f ms (%s total)",
+            moved,
+            (time.perf_counter() - started) * 1000,
+            archived,
+        )
+        if pause:
+            time.sleep(pause)
+
+    return archived
+
+
+def _window(orders, start: datetime | None, end: datetime | None) -> list:
+    criteria = [orders.c.deleted_at.is_(None)]
+    if start is not None:
+        criteria.append(orders.c.created_at >= start)
+    if end is not None:
+        criteria.append(orders.c.created_at < end)
+    return criteria
+
+
+def order_history(start: datetime | None = None, end: datetime | None = None):
+    """
+    Subconsulta con las ordenes no borradas de [start, end) de ambas tablas.
+    Expone las mismas columnas que `orders`.
+    """
+    branches = [
+        select(*(table.c[name] for name in ORDER_COLUMNS)).where(
+            *_window(table, start, end)
+        )
+        for table in (Order.__table__, ArchivedOrder.__table__)
+    ]
+    return union_all(*branches).subquery("order_history")
+
+
+def line_history(start: datetime | None = None, end: datetime | None = None):
+    """
+    Subconsulta (order_id, menu_item_id, price, status, waiter_id, total,
+    created_at) con las lineas de las ordenes no borradas de [start, end) de
+    ambas tablas.
+    """
+    branches = [
+        select(
+            lines.c.order_id,
+            lines.c.menu_item_id,
+            lines.c.price,
+            orders.c.status,
+            orders.c.waiter_id,
+            orders.c.total,
+            orders.c.created_at,
+        )
+        .join(orders, orders.c.id == lines.c.order_id)
+        .where(*_window(orders, start, end))
+        for orders, lines in (
+            (Order.__table__, order_menuitem_association),
+            (ArchivedOrder.__table__, order_menuitem_archive),
+        )
+    ]
+    return union_all(*branches).subquery("line_history")
@@ -1,17 +1,32 @@
 import logging
 from datetime import datetime, timezone
 
+from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
 from app.config.cnx import SessionLocal
-from app.config.sql_models import MenuItem, Order
+from app.config.sql_models import MenuItem, Order, order_menuitem_association
 from app.config.types import OrderStatus
+from app.events.outbox import record_event
 from app.orders.dto import CreateOrderDTO
+from app.reports.rollup import apply_order_delta
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(level=logging.INFO)
+
+def _book_line_prices(db, order_id: int):
+    """Guarda en cada linea el precio del menu al momento de tomar la orden."""
+    lines = order_menuitem_association
+    db.execute(
+        update(lines)
+        .where(lines.c.order_id == order_id)
+        .values(
+            price=select(MenuItem.price)
+            .where(MenuItem.id == lines.c.menu_item_id)
+            .scalar_subquery()
+        )
+    )
 
 
 def create_menu_order(order_data: CreateOrderDTO):
@@ -36,14 +51,23 @@ def create_menu_order(order_data: CreateOrderDTO):
             )
 
             db.add(new_order)
-            db.commit()
-            db.refresh(new_order)
-
-            logger.info(
-                "Created new order with id %s for table %s",
+            db.flush()
+            _book_line_prices(db, new_order.id)
+            apply_order_delta(db, new_order, None, new_order.status)
+            record_event(
+                db,
+                "order.created",
                 new_order.id,
-                new_order.table_id,
+                {
+                    "table_id": new_order.table_id,
+                    "waiter_id": new_order.waiter_id,
+                    "total": new_order.total,
+                    "menu_item_ids": [item.id for item in menu_items],
+                    "status": new_order.status.value,
+                },
             )
+            db.commit()
+            db.refresh(new_order)
 
             return new_order
 
@@ -83,9 +107,21 @@ def update_order_status_for_table(order_id: int, new_status: str) -> Order:
             if not order:
                 raise ValueError(f"Order {order_id} not found")
 
+            old_status = order.status
             order.status = OrderStatus(new_status)
 
             db.add(order)
+            apply_order_delta(db, order, old_status, order.status)
+            record_event(
+                db,
+                "order.status_changed",
+                order.id,
+                {
+                    "table_id": order.table_id,
+                    "old_status": old_status.value,
+                    "new_status": order.status.value,
+                },
+            )
             db.commit()
             db.refresh(order)
             return order
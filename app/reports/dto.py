@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class RevenueBucketDTO(BaseModel):
+    period: str
+    orders: int
+    revenue: Decimal
+
+    class Config:
+        json_schema_extra = {
+            "example": {"period": "2025-11-01", "orders": 182, "revenue": "4210.50"}
+        }
+
+
+class DailySalesDTO(BaseModel):
+    day: date
+    items: int
+    revenue: Decimal
+    delivered_items: int
+    delivered_revenue: Decimal
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "day": "2025-11-01",
+                "items": 540,
+                "revenue": "4210.50",
+                "delivered_items": 512,
+                "delivered_revenue": "3990.00",
+            }
+        }
+
+
+class WaiterRevenueDTO(BaseModel):
+    waiter_id: int
+    user_id: int
+    name: str
+    orders: int
+    revenue: Decimal
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "waiter_id": 2,
+                "user_id": 2,
+                "name": "Bob",
+                "orders": 64,
+                "revenue": "1530.00",
+            }
+        }
+
+
+class TableRevenueDTO(BaseModel):
+    table_id: int
+    orders: int
+    revenue: Decimal
+
+    class Config:
+        json_schema_extra = {
+            "example": {"table_id": 7, "orders": 41, "revenue": "980.50"}
+        }
+
+
+class TopMenuItemDTO(BaseModel):
+    menu_item_id: int
+    name: str
+    category: Optional[str] = None
+    quantity: int
+    revenue: Decimal
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "menu_item_id": 8,
+                "name": "Pizza Margherita",
+                "category": "plato_principal",
+                "quantity": 310,
+                "revenue": "3875.00",
+            }
+        }
@@ -0,0 +1,228 @@
+"""
+Rollup diario de ventas (daily_sales_rollup).
+
+Una fila por dia x item de menu x mozo. Los servicios de ordenes aplican el
+delta de cada orden en la misma transaccion que la crean o le cambian el
+estado, asi el rollup nunca queda adelantado ni atrasado respecto a `orders`.
+`rebuild_rollup` lo recalcula desde cero para un rango (backfill o reparacion).
+
+Cuentan como venta las ordenes no canceladas ni borradas. La facturacion de
+cada linea es su parte de `Order.total`, repartido en proporcion al precio con
+que se tomo cada linea (`price` de la linea, no el precio actual del menu): asi
+un cambio de precio no descuadra los deltas, cada item factura lo que vale y la
+suma del rollup coincide con `/reports/revenue`. Si ninguna linea tiene precio
+el total se reparte en partes iguales. Las ordenes sin lineas no entran en el
+rollup.
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import (
+    Date,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.config.cnx import SessionLocal, engine
+from app.config.sql_models import (
+    DailySalesRollup,
+    Order,
+    order_menuitem_association,
+)
+from app.config.types import OrderStatus
+from app.orders.archive import line_history
+
+logger = logging.getLogger(__name__)
+
+rollup_table = DailySalesRollup.__table__
+
+COUNTERS = ("item_count", "revenue", "delivered_count", "delivered_revenue")
+
+
+def _weights(status: OrderStatus | None) -> tuple[int, int]:
+    """Retorna (cuenta como venta, cuenta como entregada) para un estado."""
+    if status is None or status == OrderStatus.CANCELED:
+        return 0, 0
+    return 1, int(status == OrderStatus.DELIVERED)
+
+
+def _order_day(order: Order) -> date:
+    created_at = order.created_at or datetime.now(timezone.utc)
+    return created_at.date()
+
+
+KEY = ("day", "menu_item_id", "waiter_id")
+
+UPSERT_DIALECTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _upsert_statement(rows: list[dict]):
+    stmt = UPSERT_DIALECTS[engine.dialect.name](rollup_table).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=list(KEY),
+        set_={
+            **{
+                name: rollup_table.c[name] + stmt.excluded[name]
+                for name in COUNTERS
+            },
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+def _update_then_insert(db: Session, row: dict):
+    """Upsert para dialectos sin ON CONFLICT: UPDATE y, si no habia fila, INSERT."""
+    updated = db.execute(
+        update(rollup_table)
+        .where(*(rollup_table.c[name] == row[name] for name in KEY))
+        .values(
+            **{name: rollup_table.c[name] + row[name] for name in COUNTERS},
+            updated_at=row["updated_at"],
+        )
+    ).rowcount
+    if not updated:
+        db.execute(insert(rollup_table).values(row))
+
+
+def _upsert(db: Session, rows: list[dict]):
+    if engine.dialect.name in UPSERT_DIALECTS:
+        db.execute(_upsert_statement(rows))
+        return
+    for row in rows:
+        _update_then_insert(db, row)
+
+
+def line_shares(total, prices: list) -> list[Decimal]:
+    """Reparte `total` entre las lineas en proporcion a su precio."""
+    total = Decimal(str(total or 0))
+    prices = [Decimal(str(price or 0)) for price in prices]
+    booked = sum(prices)
+    if not booked:
+        return [total / len(prices)] * len(prices)
+    return [total * price / booked for price in prices]
+
+
+def apply_order_delta(
+    db: Session,
+    order: Order,
+    old_status: OrderStatus | None,
+    new_status: OrderStatus | None,
+):
+    """
+    Suma al rollup la diferencia entre el estado viejo y el nuevo de la orden.
+    No hace commit: se ejecuta dentro de la transaccion del llamador.
+    """
+    if order.deleted_at is not None:
+        return
+
+    old_sale, old_delivered = _weights(old_status)
+    new_sale, new_delivered = _weights(new_status)
+    sale = new_sale - old_sale
+    delivered = new_delivered - old_delivered
+    if not sale and not delivered:
+        return
+
+    lines = order_menuitem_association
+    items = db.execute(
+        select(lines.c.menu_item_id, lines.c.price).where(
+            lines.c.order_id == order.id
+        )
+    ).all()
+    if not items:
+        return
+
+    day = _order_day(order)
+    now = datetime.now(timezone.utc)
+    shares = line_shares(order.total, [price for _, price in items])
+    rows = [
+        {
+            "day": day,
+            "menu_item_id": menu_item_id,
+            "waiter_id": order.waiter_id,
+            "item_count": sale,
+            "revenue": share * sale,
+            "delivered_count": delivered,
+            "delivered_revenue": share * delivered,
+            "updated_at": now,
+        }
+        for (menu_item_id, _), share in zip(items, shares, strict=True)
+    ]
+    _upsert(db, rows)
+
+
+def _day(column):
+    if engine.dialect.name == "sqlite":
+        return func.date(column)
+    return cast(column, Date)
+
+
+def rebuild_rollup(date_from: date | None = None, date_to: date | None = None) -> int:
+    """
+    Recalcula el rollup desde las ordenes activas y archivadas para el rango
+    [date_from, date_to] (todo el historial si no se indica). Retorna la
+    cantidad de filas escritas.
+    """
+    start = datetime.combine(date_from, time.min) if date_from else None
+    end = datetime.combine(date_to + timedelta(days=1), time.min) if date_to else None
+
+    history = line_history(start, end)
+    # La parte de cada linea en el total de su orden, igual que line_shares
+    # (* 1.0 evita la division entera de SQLite)
+    price = func.coalesce(history.c.price, 0)
+    booked = func.sum(price).over(partition_by=history.c.order_id)
+    share = case(
+        (booked > 0, history.c.total * price * 1.0 / booked),
+        else_=history.c.total * 1.0 / func.count().over(
+            partition_by=history.c.order_id
+        ),
+    )
+    lines = select(
+        history.c.menu_item_id,
+        history.c.waiter_id,
+        history.c.status,
+        history.c.created_at,
+        share.label("share"),
+    ).subquery("lines")
+    day = _day(lines.c.created_at)
+    is_delivered = case((lines.c.status == OrderStatus.DELIVERED, 1), else_=0)
+
+    source = (
+        select(
+            day.label("day"),
+            lines.c.menu_item_id,
+            lines.c.waiter_id,
+            func.count().label("item_count"),
+            func.sum(lines.c.share).label("revenue"),
+            func.sum(is_delivered).label("delivered_count"),
+            func.sum(lines.c.share * is_delivered).label("delivered_revenue"),
+            literal(datetime.now(timezone.utc)).label("updated_at"),
+        )
+        .where(lines.c.status != OrderStatus.CANCELED)
+        .group_by(day, lines.c.menu_item_id, lines.c.waiter_id)
+    )
+
+    wipe = delete(rollup_table)
+    if date_from is not None:
+        wipe = wipe.where(rollup_table.c.day >= date_from)
+    if date_to is not None:
+        wipe = wipe.where(rollup_table.c.day <= date_to)
+
+    columns = ["day", "menu_item_id", "waiter_id", *COUNTERS, "updated_at"]
+
+    with SessionLocal() as db:
+        db.execute(wipe)
+        result = db.execute(insert(rollup_table).from_select(columns, source))
+        db.commit()
+
+    logger.info("Rebuilt daily sales rollup: %s rows", result.rowcount)
+    return result.rowcount
@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.config.types import Roles
+from app.middlewares.security import role_required
+from app.reports.dto import (
+    DailySalesDTO,
+    RevenueBucketDTO,
+    TableRevenueDTO,
+    TopMenuItemDTO,
+    WaiterRevenueDTO,
+)
+from app.reports.services import (
+    daily_sales,
+    revenue_by_period,
+    revenue_by_table,
+    revenue_by_waiter,
+    top_menu_items,
+)
+
+reports_router = APIRouter(
+    prefix="/reports",
+    tags=["Reports"],
+    dependencies=[Depends(role_required(Roles.ADMIN))],
+)
+
+DEFAULT_RANGE_DAYS = 30
+
+
+def report_range(
+    date_from: Optional[date] = Query(None, description="First day, inclusive"),
+    date_to: Optional[date] = Query(None, description="Last day, inclusive"),
+) -> tuple[date, date]:
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+
+    if date_to < date_from:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="date_to must be on or after date_from",
+        )
+    return date_from, date_to
+
+
+@reports_router.get(
+    "/revenue",
+    response_model=List[RevenueBucketDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Revenue over time",
+    description="Order count and revenue per day or hour. Canceled and deleted orders are excluded.",
+)
+def get_revenue(
+    granularity: Literal["day", "hour"] = "day",
+    dates: tuple[date, date] = Depends(report_range),
+):
+    return revenue_by_period(*dates, granularity=granularity)
+
+
+@reports_router.get(
+    "/daily",
+    response_model=List[DailySalesDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Daily sales",
+    description="Items sold and revenue per day, read from the pre-aggregated daily rollup.",
+)
+def get_daily_sales(dates: tuple[date, date] = Depends(report_range)):
+    return daily_sales(*dates)
+
+
+@reports_router.get(
+    "/revenue/waiters",
+    response_model=List[WaiterRevenueDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Revenue by waiter",
+    description="Order count and revenue per waiter, highest revenue first.",
+)
+def get_revenue_by_waiter(dates: tuple[date, date] = Depends(report_range)):
+    return revenue_by_waiter(*dates)
+
+
+@reports_router.get(
+    "/revenue/tables",
+    response_model=List[TableRevenueDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Revenue by table",
+    description="Order count and revenue per table, highest revenue first.",
+)
+def get_revenue_by_table(dates: tuple[date, date] = Depends(report_range)):
+    return revenue_by_table(*dates)
+
+
+@reports_router.get(
+    "/top-items",
+    response_model=List[TopMenuItemDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Best-selling menu items",
+    description="Menu items ordered most often in the range, read from the daily rollup.",
+)
+def get_top_items(
+    limit: int = Query(10, ge=1, le=100),
+    dates: tuple[date, date] = Depends(report_range),
+):
+    return top_menu_items(*dates, limit=limit)
@@ -0,0 +1,220 @@
+"""
+Reportes de ventas calculados con agregaciones SQL.
+
+Ninguna consulta carga objetos ORM: todas agrupan en la base y retornan solo
+las filas agregadas. Los reportes por orden leen `orders` y `orders_archive`
+(ver app/orders/archive.py), cada una por su indice de reportes; los de items
+leen el rollup diario (ver rollup.py).
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from sqlalchemy import func, select
+
+from app.config.cnx import SessionLocal, engine
+from app.config.sql_models import (
+    DailySalesRollup,
+    MenuItem,
+    User,
+    Waiter,
+)
+from app.config.types import OrderStatus
+from app.orders.archive import order_history
+
+logger = logging.getLogger(__name__)
+
+GRANULARITY_FORMATS = {
+    "day": ("%Y-%m-%d", "YYYY-MM-DD"),
+    "hour": ("%Y-%m-%d %H:00", "YYYY-MM-DD HH24:00"),
+}
+
+
+def date_range(date_from: date, date_to: date) -> tuple[datetime, datetime]:
+    """Convierte un rango de fechas inclusivo en [inicio, fin) de datetimes."""
+    if date_to < date_from:
+        raise ValueError("date_to debe ser posterior o igual a date_from")
+    start = datetime.combine(date_from, time.min)
+    end = datetime.combine(date_to + timedelta(days=1), time.min)
+    return start, end
+
+
+def _period(column, granularity: str):
+    sqlite_format, pg_format = GRANULARITY_FORMATS[granularity]
+    if engine.dialect.name == "sqlite":
+        return func.strftime(sqlite_format, column)
+    return func.to_char(column, pg_format)
+
+
+def _billable(start: datetime, end: datetime):
+    """Ordenes activas y archivadas del rango que cuentan como venta."""
+    history = order_history(start, end)
+    return history, history.c.status != OrderStatus.CANCELED
+
+
+def _money(value) -> Decimal:
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
+
+
+def revenue_by_period(date_from: date, date_to: date, granularity: str = "day"):
+    """Facturacion agrupada por dia u hora."""
+    orders, billable = _billable(*date_range(date_from, date_to))
+    period = _period(orders.c.created_at, granularity).label("period")
+
+    stmt = (
+        select(period, func.count().label("orders"), func.sum(orders.c.total))
+        .where(billable)
+        .group_by(period)
+        .order_by(period)
+    )
+
+    with SessionLocal() as db:
+        rows = db.execute(stmt).all()
+
+    return [
+        {"period": row[0], "orders": row[1], "revenue": _money(row[2])} for row in rows
+    ]
+
+
+def revenue_by_waiter(date_from: date, date_to: date):
+    """Facturacion por mozo, con el nombre del usuario asociado."""
+    orders, billable = _billable(*date_range(date_from, date_to))
+
+    totals = (
+        select(
+            orders.c.waiter_id,
+            func.count().label("orders"),
+            func.sum(orders.c.total).label("revenue"),
+        )
+        .where(billable)
+        .group_by(orders.c.waiter_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            totals.c.waiter_id,
+            Waiter.user_id,
+            User.name,
+            totals.c.orders,
+            totals.c.revenue,
+        )
+        .join(Waiter, Waiter.id == totals.c.waiter_id)
+        .join(User, User.id == Waiter.user_id)
+        .order_by(totals.c.revenue.desc())
+    )
+
+    with SessionLocal() as db:
+        rows = db.execute(stmt).all()
+
+    return [
+        {
+            "waiter_id": row.waiter_id,
+            "user_id": row.user_id,
+            "name": row.name,
+            "orders": row.orders,
+            "revenue": _money(row.revenue),
+        }
+        for row in rows
+    ]
+
+
+def revenue_by_table(date_from: date, date_to: date):
+    """Facturacion por mesa."""
+    orders, billable = _billable(*date_range(date_from, date_to))
+    revenue = func.sum(orders.c.total).label("revenue")
+
+    stmt = (
+        select(orders.c.table_id, func.count().label("orders"), revenue)
+        .where(billable)
+        .group_by(orders.c.table_id)
+        .order_by(revenue.desc())
+    )
+
+    with SessionLocal() as db:
+        rows = db.execute(stmt).all()
+
+    return [
+        {"table_id": row[0], "orders": row[1], "revenue": _money(row[2])}
+        for row in rows
+    ]
+
+
+def daily_sales(date_from: date, date_to: date):
+    """Items vendidos y facturacion por dia, leidos del rollup."""
+    rollup = DailySalesRollup
+
+    stmt = (
+        select(
+            rollup.day,
+            func.sum(rollup.item_count),
+            func.sum(rollup.revenue),
+            func.sum(rollup.delivered_count),
+            func.sum(rollup.delivered_revenue),
+        )
+        .where(rollup.day >= date_from, rollup.day <= date_to)
+        .group_by(rollup.day)
+        .order_by(rollup.day)
+    )
+
+    with SessionLocal() as db:
+        rows = db.execute(stmt).all()
+
+    return [
+        {
+            "day": row[0],
+            "items": row[1],
+            "revenue": _money(row[2]),
+            "delivered_items": row[3],
+            "delivered_revenue": _money(row[4]),
+        }
+        for row in rows
+    ]
+
+
+def top_menu_items(date_from: date, date_to: date, limit: int = 10):
+    """
+    Items de menu mas vendidos, leidos del rollup diario: el costo depende de
+    la cantidad de dias e items, no de la cantidad de ordenes.
+    """
+    rollup = DailySalesRollup
+    quantity = func.sum(rollup.item_count).label("quantity")
+
+    totals = (
+        select(
+            rollup.menu_item_id,
+            quantity,
+            func.sum(rollup.revenue).label("revenue"),
+        )
+        .where(rollup.day >= date_from, rollup.day <= date_to)
+        .group_by(rollup.menu_item_id)
+        .having(quantity > 0)
+        .order_by(quantity.desc())
+        .limit(limit)
+        .subquery()
+    )
+    stmt = (
+        select(
+            MenuItem.id,
+            MenuItem.name,
+            MenuItem.category,
+            totals.c.quantity,
+            totals.c.revenue,
+        )
+        .join(totals, totals.c.menu_item_id == MenuItem.id)
+        .order_by(totals.c.quantity.desc())
+    )
+
+    with SessionLocal() as db:
+        rows = db.execute(stmt).all()
+
+    return [
+        {
+            "menu_item_id": row.id,
+            "name": row.name,
+            "category": row.category,
+            "quantity": row.quantity,
+            "revenue": _money(row.revenue),
+        }
+        for row in rows
+    ]
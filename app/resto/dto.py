@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
+
+from app.config.types import Roles
 
 
 class UserBaseWithRestoProfilesDTO(BaseModel):
@@ -58,3 +61,74 @@ class CookBaseDTO(BaseModel):
     class Config:
         from_attributes = True
         json_schema_extra = {"example": {"id": 3, "user_id": 10}}
+
+
+class EmployeeImportRowDTO(BaseModel):
+    name: str
+    email: EmailStr
+    password: str
+    roles: list[Roles] = []
+
+    @field_validator("name", "password")
+    @classmethod
+    def not_empty(cls, value: str) -> str:
+        if not value:
+            raise ValueError("no puede estar vacío")
+        return value
+
+    @field_validator("roles", mode="before")
+    @classmethod
+    def split_roles(cls, value):
+        # En CSV los roles van en una sola columna: "waiter;cook"
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = [role for role in re.split(r"[;|]", value) if role.strip()]
+        return [role.strip().lower() if isinstance(role, str) else role for role in value]
+
+    @field_validator("roles")
+    @classmethod
+    def staff_roles_only(cls, value: list[Roles]) -> list[Roles]:
+        if Roles.ADMIN in value:
+            raise ValueError("el import no asigna el rol admin")
+        return list(dict.fromkeys(value))
+
+    class Config:
+        str_strip_whitespace = True
+        json_schema_extra = {
+            "example": {
+                "name": "Bob Smith",
+                "email": "bob@example.com",
+                "password": "securepassword123",
+                "roles": ["waiter", "cashier"],
+            }
+        }
+
+
+class EmployeeImportErrorDTO(BaseModel):
+    row: int
+    email: str | None = None
+    error: str
+
+
+class EmployeeImportResultDTO(BaseModel):
+    total: int
+    created: int
+    failed: int
+    dry_run: bool = False
+    user_ids: list[int] = []
+    errors: list[EmployeeImportErrorDTO] = []
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total": 3,
+                "created": 2,
+                "failed": 1,
+                "dry_run": False,
+                "user_ids": [41, 42],
+                "errors": [
+                    {"row": 2, "email": "bob@example.com", "error": "Email ya registrado"}
+                ],
+            }
+        }
@@ -0,0 +1,246 @@
+"""
+Alta masiva de empleados desde CSV o JSON.
+
+Reemplaza el ida y vuelta de `POST /api/users/` mas un
+`POST /api/resto/roles/{user_id}/{role}` por empleado. Cada fila trae nombre,
+email, contraseña y roles (waiter, cook, cashier). El import:
+
+1. valida todas las filas y descarta emails repetidos en el archivo o ya
+   registrados (una consulta por lote);
+2. hashea las contraseñas con bcrypt en un pool de hilos: bcrypt libera el GIL
+   mientras calcula, asi que escala con los nucleos sin levantar procesos;
+3. inserta usuarios, perfiles y `user_roles` con INSERT multi-fila, una
+   transaccion por lote de IMPORT_BATCH_SIZE filas.
+
+Si un lote choca con la base (por ejemplo un email que se registro mientras
+tanto) se reintenta fila por fila, asi solo fallan las filas con problemas.
+El resultado informa cada fila fallida con su numero (1 = la primera fila de
+datos) y el motivo.
+"""
+
+import csv
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app.config import IMPORT_BATCH_SIZE, IMPORT_HASH_WORKERS, IMPORT_MAX_ROWS
+from app.config.cnx import SessionLocal
+from app.config.sql_models import Cashier, Cook, User, UserRole, Waiter
+from app.config.types import Roles
+from app.jobs.queue import enqueue
+from app.middlewares.auth import hash_password
+from app.resto.dto import EmployeeImportRowDTO
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODELS = {Roles.WAITER: Waiter, Roles.COOK: Cook, Roles.CASHIER: Cashier}
+
+# Lotes para buscar emails ya registrados (limite de parametros de SQLite)
+EMAIL_LOOKUP_CHUNK = 500
+
+
+def parse_employees(content: bytes | str, content_type: str = "") -> list[dict]:
+    """
+    Filas del archivo como dicts. JSON si el content type o el contenido lo
+    indican (una lista o {"employees": [...]}), si no CSV con encabezado
+    name,email,password,roles. Lanza ValueError si no se puede leer.
+    """
+    text = content.decode("utf-8-sig") if isinstance(content, bytes) else content
+    stripped = text.lstrip()
+
+    if "json" in content_type or stripped[:1] in ("[", "{"):
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido: {e}") from e
+        if isinstance(data, dict):
+            data = data.get("employees")
+        if not isinstance(data, list) or not all(isinstance(r, dict) for r in data):
+            raise ValueError("Se espera una lista de empleados")
+        rows = data
+    else:
+        reader = csv.DictReader(io.StringIO(text))
+        missing = {"name", "email", "password"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"Faltan columnas: {', '.join(sorted(missing))}")
+        rows = list(reader)
+
+    if len(rows) > IMPORT_MAX_ROWS:
+        raise ValueError(f"Máximo {IMPORT_MAX_ROWS} empleados por import")
+    return rows
+
+
+def hash_passwords(
+    passwords: list[str], workers: int = IMPORT_HASH_WORKERS
+) -> list[str]:
+    if workers <= 1 or len(passwords) < 2:
+        return [hash_password(password) for password in passwords]
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(passwords)), thread_name_prefix="import-hash"
+    ) as pool:
+        return list(pool.map(hash_password, passwords))
+
+
+def _error(row: int, email, message: str) -> dict:
+    return {"row": row, "email": email, "error": message}
+
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    field = ".".join(str(part) for part in first["loc"])
+    return f"{field}: {first['msg']}" if field else first["msg"]
+
+
+def _registered_emails(emails: list[str]) -> set[str]:
+    registered = set()
+    with SessionLocal() as db:
+        for start in range(0, len(emails), EMAIL_LOOKUP_CHUNK):
+            chunk = emails[start : start + EMAIL_LOOKUP_CHUNK]
+            registered.update(
+                db.execute(select(User.email).where(User.email.in_(chunk)))
+                .scalars()
+                .all()
+            )
+    return registered
+
+
+def _insert_rows(db, rows: list[tuple[EmployeeImportRowDTO, str]]) -> list[int]:
+    """Inserta usuarios, perfiles y roles de un lote. No hace commit."""
+    now = datetime.now(timezone.utc)
+    user_ids = (
+        db.execute(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": employee.name,
+                    "email": employee.email,
+                    "password": password,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for employee, password in rows
+            ],
+        )
+        .scalars()
+        .all()
+    )
+
+    role_rows = []
+    for role, model in PROFILE_MODELS.items():
+        owners = [
+            user_id
+            for user_id, (employee, _) in zip(user_ids, rows, strict=True)
+            if role in employee.roles
+        ]
+        if not owners:
+            continue
+        profiles = db.execute(
+            insert(model).returning(model.id, model.user_id),
+            [{"user_id": user_id} for user_id in owners],
+        ).all()
+        for profile_id, user_id in profiles:
+            enqueue(
+                db,
+                "resto.role_assigned",
+                {"user_id": user_id, "role": role.value, "profile_id": profile_id},
+            )
+        role_rows.extend({"user_id": user_id, "role": role} for user_id in owners)
+
+    if role_rows:
+        db.execute(insert(UserRole), role_rows)
+    return user_ids
+
+
+def _insert_batch(batch: list[tuple[int, EmployeeImportRowDTO, str]], errors: list):
+    """Inserta un lote; si falla, fila por fila. Retorna los ids creados."""
+    rows = [(employee, password) for _, employee, password in batch]
+    with SessionLocal() as db:
+        try:
+            user_ids = _insert_rows(db, rows)
+            db.commit()
+            return user_ids
+        except IntegrityError:
+            db.rollback()
+    logger.warning("Import batch failed, retrying %s rows one by one", len(batch))
+
+    user_ids = []
+    for row, employee, password in batch:
+        with SessionLocal() as db:
+            try:
+                user_ids.extend(_insert_rows(db, [(employee, password)]))
+                db.commit()
+            except IntegrityError as e:
+                db.rollback()
+                errors.append(_error(row, employee.email, f"Error de base: {e.orig}"))
+    return user_ids
+
+
+def import_employees(
+    rows: list[dict],
+    batch_size: int = IMPORT_BATCH_SIZE,
+    dry_run: bool = False,
+) -> dict:
+    """
+    Importa empleados. Las filas con errores no frenan al resto. Con
+    `dry_run` solo valida (no hashea ni escribe).
+    """
+    errors: list[dict] = []
+    valid: list[tuple[int, EmployeeImportRowDTO]] = []
+    seen: set[str] = set()
+
+    for row, raw in enumerate(rows, 1):
+        try:
+            employee = EmployeeImportRowDTO.model_validate(raw)
+        except ValidationError as e:
+            errors.append(_error(row, raw.get("email"), _validation_message(e)))
+            continue
+
+        employee.email = employee.email.strip().lower()
+        if employee.email in seen:
+            errors.append(_error(row, employee.email, "Email repetido en el archivo"))
+            continue
+        seen.add(employee.email)
+        valid.append((row, employee))
+
+    registered = _registered_emails([employee.email for _, employee in valid])
+    if registered:
+        errors.extend(
+            _error(row, employee.email, "Email ya registrado")
+            for row, employee in valid
+            if employee.email in registered
+        )
+        valid = [(row, e) for row, e in valid if e.email not in registered]
+
+    user_ids: list[int] = []
+    if valid and not dry_run:
+        passwords = hash_passwords([employee.password for _, employee in valid])
+        prepared = [
+            (row, employee, password)
+            for (row, employee), password in zip(valid, passwords, strict=True)
+        ]
+        for start in range(0, len(prepared), batch_size):
+            user_ids.extend(_insert_batch(prepared[start : start + batch_size], errors))
+
+    errors.sort(key=lambda error: error["row"])
+    created = len(valid) if dry_run else len(user_ids)
+    logger.info(
+        "Employee import: %s rows, %s created, %s failed%s",
+        len(rows),
+        created,
+        len(errors),
+        " (dry run)" if dry_run else "",
+    )
+    return {
+        "total": len(rows),
+        "created": created,
+        "failed": len(errors),
+        "dry_run": dry_run,
+        "user_ids": user_ids,
+        "errors": errors,
+    }
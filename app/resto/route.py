@@ -1,12 +1,27 @@
-from typing import List
+import asyncio
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config.types import Roles
 from app.middlewares.security import role_required
-from app.resto.dto import UserBaseWithRestoProfilesDTO
+from app.resto.dto import (
+    EmployeeImportResultDTO,
+    EmployeeImportRowDTO,
+    UserBaseWithRestoProfilesDTO,
+)
+from app.resto.importer import import_employees, parse_employees
 from app.resto.services import get_all_employees, get_employee_by_id, make_user_role
+from app.user.services import set_next_page_header
 
 resto_router = APIRouter(prefix="/resto", tags=["Restorant"])
 
@@ -15,13 +30,22 @@ resto_router = APIRouter(prefix="/resto", tags=["Restorant"])
     "/roles",
     response_model=List[UserBaseWithRestoProfilesDTO],
     status_code=status.HTTP_200_OK,
-    summary="List all users as employees with roles.",
-    description="Endpoint only meant for Admin to check current users as Employees: users with their waiter, cook and cashier profile info.",
+    summary="List users as employees with roles.",
+    description="Endpoint only meant for Admin to check current users as Employees: a page of users with their waiter, cook and cashier profile info, ordered by id. Filter by name or email prefix (search) and by role. When more users exist, the X-Next-After-Id header holds the after_id for the next page.",
 )
-async def list_users(
+def list_users(
+    response: Response,
+    search: Optional[str] = Query(None, description="Name or email prefix"),
+    role: Optional[Roles] = Query(None),
+    after_id: Optional[int] = Query(
+        None, ge=0, description="Last id of the previous page"
+    ),
+    limit: int = Query(100, ge=1, le=500),
     _=Depends(role_required(Roles.ADMIN)),
 ):
-    return get_all_employees()
+    users, next_after = get_all_employees(search, role, after_id, limit)
+    set_next_page_header(response, next_after)
+    return users
 
 
 @resto_router.post(
@@ -59,3 +83,43 @@ async def get_single_user_with_profile(
     _=Depends(role_required(Roles.ADMIN)),
 ):
     return get_employee_by_id(user_id)
+
+
+@resto_router.post(
+    "/employees/import",
+    response_model=EmployeeImportResultDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Bulk import employees",
+    description="Admin only. Creates users with their waiter, cook and cashier profiles from a CSV body (columns name,email,password,roles; roles separated by ';') or a JSON list. Passwords are hashed in parallel and rows are inserted in batches. Invalid or duplicated rows are reported one by one and do not stop the rest. Use dry_run=true to only validate.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {
+                    "schema": {"type": "string"},
+                    "example": "name,email,password,roles\nBob Smith,bob@example.com,secret123,waiter;cashier\n",
+                },
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": EmployeeImportRowDTO.model_json_schema(),
+                    }
+                },
+            },
+        }
+    },
+)
+async def import_employees_endpoint(
+    request: Request,
+    dry_run: bool = False,
+    _=Depends(role_required(Roles.ADMIN)),
+):
+    try:
+        rows = parse_employees(
+            await request.body(), request.headers.get("content-type", "")
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    # bcrypt y las inserciones fuera del event loop
+    return await asyncio.to_thread(import_employees, rows, dry_run=dry_run)
@@ -2,33 +2,48 @@ import logging
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
+from app.auth.roles import role_cache
 from app.config.cnx import SessionLocal
-from app.config.sql_models import Cashier, Cook, User, Waiter
+from app.config.sql_models import Cashier, Cook, User, UserRole, Waiter
 from app.config.types import Roles
+from app.jobs.queue import enqueue
+from app.user.services import filter_users, next_after_id
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(level=logging.INFO)
 
-
-def get_all_employees():
+def _employees(db):
+    """
+    Usuarios con los tres perfiles en una sola consulta: cada perfil es uno a
+    uno (user_id unico), asi que los LEFT JOIN no multiplican filas y el
+    LIMIT se aplica directo.
     """
-    Busca y retorna todos los usuarios con perfiles de cocina activos.
+    return db.query(User).options(
+        joinedload(User.waiter_profile),
+        joinedload(User.cook_profile),
+        joinedload(User.cashier_profile),
+    )
+
+
+def get_all_employees(
+    search: str | None = None,
+    role: Roles | None = None,
+    after_id: int | None = None,
+    limit: int = 100,
+):
+    """
+    Busca y retorna una pagina de usuarios activos con sus perfiles de
+    empleado y el `after_id` de la siguiente (None si es la ultima).
     """
     with SessionLocal() as db:
         users = (
-            db.query(User)
-            .options(
-                selectinload(User.waiter_profile),
-                selectinload(User.cook_profile),
-                selectinload(User.cashier_profile),
-            )
-            .filter(User.deleted_at.is_(None))
+            filter_users(_employees(db), search, role, after_id)
+            .limit(limit + 1)
             .all()
         )
-        return users
+        return users, next_after_id(users, limit)
 
 
 def get_employee_by_id(user_id: int):
@@ -39,12 +54,7 @@ def get_employee_by_id(user_id: int):
     """
     with SessionLocal() as db:
         user = (
-            db.query(User)
-            .options(
-                selectinload(User.waiter_profile),
-                selectinload(User.cook_profile),
-                selectinload(User.cashier_profile),
-            )
+            _employees(db)
             .filter(User.id == user_id, User.deleted_at.is_(None))
             .first()
         )
@@ -63,16 +73,7 @@ def get_employee_by_email(email: str):
     Busca y retorna el primer registro que coincida con el campo email.
     """
     with SessionLocal() as db:
-        return (
-            db.query(User)
-            .options(
-                selectinload(User.waiter_profile),
-                selectinload(User.cook_profile),
-                selectinload(User.cashier_profile),
-            )
-            .filter(User.email == email)
-            .first()
-        )
+        return _employees(db).filter(User.email == email).first()
 
 
 def make_user_role(user: User, role: Roles):
@@ -92,13 +93,15 @@ def make_user_role(user: User, role: Roles):
 
                 waiter = Waiter(user=user)
                 db.add(waiter)
+                db.add(UserRole(user_id=user.id, role=role))
+                db.flush()
+                enqueue(
+                    db,
+                    "resto.role_assigned",
+                    {"user_id": user.id, "role": role.value, "profile_id": waiter.id},
+                )
                 db.commit()
                 db.refresh(user)
-                logger.info(
-                    "Usuario convertido a rol mesero correctamente: User id %s, Waiter id %s",
-                    user.id,
-                    waiter.id,
-                )
 
             elif role == Roles.COOK:
                 if user.cook_profile:
@@ -106,13 +109,15 @@ def make_user_role(user: User, role: Roles):
 
                 cook = Cook(user=user)
                 db.add(cook)
+                db.add(UserRole(user_id=user.id, role=role))
+                db.flush()
+                enqueue(
+                    db,
+                    "resto.role_assigned",
+                    {"user_id": user.id, "role": role.value, "profile_id": cook.id},
+                )
                 db.commit()
                 db.refresh(user)
-                logger.info(
-                    "Usuario convertido a rol cocina correctamente: User id %s, Cook id %s",
-                    user.id,
-                    cook.id,
-                )
 
             elif role == Roles.CASHIER:
                 if user.cashier_profile:
@@ -120,17 +125,20 @@ def make_user_role(user: User, role: Roles):
 
                 cashier = Cashier(user=user)
                 db.add(cashier)
+                db.add(UserRole(user_id=user.id, role=role))
+                db.flush()
+                enqueue(
+                    db,
+                    "resto.role_assigned",
+                    {"user_id": user.id, "role": role.value, "profile_id": cashier.id},
+                )
                 db.commit()
                 db.refresh(user)
-                logger.info(
-                    "Usuario convertido a rol cajero correctamente: User id %s, Cashier id %s",
-                    user.id,
-                    cashier.id,
-                )
 
             else:
                 raise ValueError(f"Rol no reconocido: {role}")
 
+            role_cache.invalidate(user.id)
             return user
 
         except SQLAlchemyError as e:
@@ -0,0 +1,16 @@
+import logging
+
+from app.jobs.registry import task
+
+logger = logging.getLogger(__name__)
+
+
+@task("resto.role_assigned")
+def role_assigned(user_id: int, role: str, profile_id: int):
+    """Deja registro de la asignacion de un perfil de empleado."""
+    logger.info(
+        "Usuario convertido a rol %s correctamente: User id %s, perfil id %s",
+        role,
+        user_id,
+        profile_id,
+    )
@@ -1,8 +1,14 @@
 from fastapi import APIRouter
 
+from app.analytics.route import analytics_router
 from app.auth.route import auth_router
+from app.diagnostics.route import diagnostics_router
+from app.events.route import events_router
+from app.health.route import health_router
+from app.jobs.route import jobs_router
 from app.menu.route import menu_router
 from app.orders.route import orders_router
+from app.reports.route import reports_router
 from app.resto.route import resto_router
 from app.tables.route import tables_router
 from app.user.route import user_router
@@ -15,14 +21,15 @@ async def root():
     return {"message": "RESTO Backend API"}
 
 
-@api_router.get("/health")
-async def health_check():
-    return {"status": "ok"}
-
-
+api_router.include_router(health_router)
 api_router.include_router(user_router)
 api_router.include_router(resto_router)
 api_router.include_router(tables_router)
 api_router.include_router(auth_router)
 api_router.include_router(menu_router)
 api_router.include_router(orders_router)
+api_router.include_router(reports_router)
+api_router.include_router(analytics_router)
+api_router.include_router(jobs_router)
+api_router.include_router(events_router)
+api_router.include_router(diagnostics_router)
@@ -11,8 +11,6 @@ from app.tables.dto import RestoranTableCreateDTO
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(level=logging.INFO)
-
 
 def list_all_tables():
     """
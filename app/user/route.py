@@ -1,8 +1,16 @@
 import logging
 import time
-from typing import List
-
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import List, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config.types import Roles
@@ -16,6 +24,7 @@ from app.user.services import (
     get_user_by_id,
     hard_delete_user,
     restore_user,
+    set_next_page_header,
     soft_delete_user,
 )
 
@@ -49,11 +58,21 @@ async def log_sensitive_operation(
     "/",
     response_model=List[UserBaseDTO],
     status_code=status.HTTP_200_OK,
-    summary="List all users",
-    description="Retrieve a list of all users in the system",
+    summary="List users",
+    description="Retrieve a page of active users ordered by id. Filter by name or email prefix (search) and by role. When more users exist, the X-Next-After-Id header holds the after_id for the next page",
 )
-async def list_users():
-    return get_all_users()
+def list_users(
+    response: Response,
+    search: Optional[str] = Query(None, description="Name or email prefix"),
+    role: Optional[Roles] = Query(None),
+    after_id: Optional[int] = Query(
+        None, ge=0, description="Last id of the previous page"
+    ),
+    limit: int = Query(100, ge=1, le=500),
+):
+    users, next_after = get_all_users(search, role, after_id, limit)
+    set_next_page_header(response, next_after)
+    return users
 
 
 @user_router.post(
@@ -1,17 +1,18 @@
 import logging
 from datetime import datetime, timezone
 
+from sqlalchemy import and_, exists, or_
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import selectinload
 
+from app.auth.roles import role_cache
 from app.config.cnx import SessionLocal
-from app.config.sql_models import User
+from app.config.sql_models import StaffPin, User, UserRole, search_key
 from app.config.types import Roles
 from app.middlewares.auth import compare_password, create_access_token, hash_password
 from app.user.dto import UserCreateDTO, UserUpdateDTO
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 
 def get_user_by_id(user_id: int):
@@ -29,11 +30,77 @@ def get_user_by_email(email: str):
         return db.query(User).filter(User.email == email).first()
 
 
-def get_all_users():
-    """Busca y retorna todos los usuarios activos."""
+def _prefix_range(column, prefix: str):
+    """`column LIKE 'prefix%'` como rango, para que use el indice."""
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return and_(column >= prefix, column < upper)
+
+
+def filter_users(
+    query,
+    search: str | None = None,
+    role: Roles | None = None,
+    after_id: int | None = None,
+):
+    """
+    Filtros comunes de los listados de usuarios activos, todos en SQL:
+    prefijo de nombre o email, rol con EXISTS sobre `user_roles` y paginado
+    por id.
+
+    El nombre se compara contra `name_key` (sin acentos ni mayusculas, plegado
+    en Python y no con `lower()` del motor, que en SQLite solo pliega ASCII),
+    asi "an" encuentra a "Ángel". El email se guarda en minusculas y se compara
+    con el texto en minusculas, sin quitar acentos. Ambos usan su indice.
+    """
+    query = query.filter(User.deleted_at.is_(None))
+    text = (search or "").strip()
+    name_needle = search_key(text)
+    if name_needle:
+        query = query.filter(
+            or_(
+                _prefix_range(User.name_key, name_needle),
+                _prefix_range(User.email, text.lower()),
+            )
+        )
+    if role is not None:
+        query = query.filter(
+            exists().where(UserRole.user_id == User.id, UserRole.role == role)
+        )
+    if after_id:
+        query = query.filter(User.id > after_id)
+    return query.order_by(User.id)
+
+
+def next_after_id(items: list, limit: int) -> int | None:
+    """Recorta la fila extra pedida de mas; su presencia indica otra pagina."""
+    if len(items) <= limit:
+        return None
+    del items[limit:]
+    return items[-1].id
+
+
+def set_next_page_header(response, after_id: int | None):
+    if after_id is not None:
+        response.headers["X-Next-After-Id"] = str(after_id)
+
+
+def get_all_users(
+    search: str | None = None,
+    role: Roles | None = None,
+    after_id: int | None = None,
+    limit: int = 100,
+):
+    """
+    Busca y retorna una pagina de usuarios activos y el `after_id` de la
+    siguiente (None si es la ultima).
+    """
     with SessionLocal() as db:
-        users = db.query(User).filter(User.deleted_at.is_(None)).all()
-        return users
+        users = (
+            filter_users(db.query(User), search, role, after_id)
+            .limit(limit + 1)
+            .all()
+        )
+        return users, next_after_id(users, limit)
 
 
 def create_user(user_data: UserCreateDTO):
@@ -88,6 +155,7 @@ def update_user(user_id: str, user_data: UserUpdateDTO):
             # Actualizar campos si se proporcionan
             if user_data.name:
                 user.name = user_data.name.strip()
+                user.name_key = search_key(user.name)
             if user_data.email:
                 # Validar que el nuevo email no exista en otro usuario
                 existing_user = (
@@ -172,8 +240,11 @@ def hard_delete_user(user_id: int):
             if not user:
                 return None
 
+            db.query(UserRole).filter(UserRole.user_id == user_id).delete()
+            db.query(StaffPin).filter(StaffPin.user_id == user_id).delete()
             db.delete(user)
             db.commit()
+            role_cache.invalidate(user_id)
             logger.info("Hard-deleted user with id %s", user_id)
             return user
 
@@ -188,8 +259,11 @@ def hard_wipe_users():
     """Borra de manera PERMANENTE todos los registros de la tabla de usuarios (solo para seed)."""
     try:
         with SessionLocal() as db:
+            db.query(UserRole).delete()
+            db.query(StaffPin).delete()
             deleted = db.query(User).delete()
             db.commit()
+            role_cache.invalidate()
             logger.info("Hard-wiped %s users from the database", deleted)
             return deleted
 
@@ -205,8 +279,6 @@ def authenticate_user(email: str, password: str):
             if not email or not password:
                 return None
 
-            logger.info(f"DEBUG here: {password} {email}")
-
             user = (
                 db.query(User)
                 .options(
@@ -0,0 +1,45 @@
+"""
+Mueve las ordenes cerradas viejas de `orders` a `orders_archive`.
+
+Pensado para correr periodicamente (cron) con el servicio andando: procesa
+lotes chicos, cada uno en su propia transaccion.
+
+    python archive_orders.py
+    python archive_orders.py --days 60 --batch-size 1000 --pause 0.05
+"""
+
+import argparse
+import logging
+import time
+
+from app.config import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE
+from app.orders.archive import archive_closed_orders
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Archivar ordenes cerradas")
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=ARCHIVE_AFTER_DAYS,
+        help="Antiguedad minima en dias",
+    )
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, help="Cortar despues de N lotes")
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="Segundos de espera entre lotes"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    started = time.perf_counter()
+    archived = archive_closed_orders(
+        older_than_days=args.days,
+        batch_size=args.batch_size,
+        max_batches=args.max_batches,
+        pause=args.pause,
+    )
+    print(f"Archivadas {archived} ordenes en {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,56 @@
+"""
+Compara dos reportes de benchmarks.run.
+
+Uso:
+    python -m benchmarks.compare base.json nuevo.json
+"""
+
+import json
+import sys
+from pathlib import Path
+
+METRICS = ("rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return "   n/a"
+    return f"{(after - before) / before * 100:+6.1f}%"
+
+
+def compare(base: dict, new: dict) -> list[str]:
+    lines = [
+        f"base {base['meta'].get('commit')} -> nuevo {new['meta'].get('commit')}",
+        "",
+    ]
+    for scenario, new_result in new["scenarios"].items():
+        base_result = base["scenarios"].get(scenario)
+        if base_result is None:
+            continue
+
+        lines.append(
+            f"{scenario}: {base_result['throughput_rps']} -> "
+            f"{new_result['throughput_rps']} req/s "
+            f"({_delta(base_result['throughput_rps'], new_result['throughput_rps'])})"
+        )
+        for endpoint, after in new_result["endpoints"].items():
+            before = base_result["endpoints"].get(endpoint)
+            if before is None:
+                continue
+            cells = "  ".join(
+                f"{metric} {before[metric]:>9} -> {after[metric]:>9} "
+                f"{_delta(before[metric], after[metric])}"
+                for metric in METRICS
+            )
+            lines.append(f"  {endpoint}\n    {cells}")
+        lines.append("")
+    return lines
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("Uso: python -m benchmarks.compare base.json nuevo.json")
+
+    base_report = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+    new_report = json.loads(Path(sys.argv[2]).read_text(encoding="utf-8"))
+    print("\n".join(compare(base_report, new_report)))
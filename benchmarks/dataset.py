@@ -0,0 +1,28 @@
+"""
+Dataset escalado para benchmarks.
+
+Recrea el esquema en la base indicada y la carga con el generador de seed.py.
+Todos los usuarios comparten la misma contraseña (BENCH_PASSWORD) para que el
+escenario de login pueda usarlos.
+"""
+
+from app.config.basemodel import Base
+from app.config.cnx import engine
+from seed import DEFAULT_PASSWORD as BENCH_PASSWORD
+from seed import seed as generate
+
+ADMIN_EMAIL = "evan@example.com"
+
+
+def seed_dataset(users: int, tables: int, orders: int, seed: int = 42) -> dict:
+    """Recrea el esquema y carga el dataset. Retorna el tamaño de cada tabla."""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    return generate(
+        employees=users,
+        tables=tables,
+        orders=orders,
+        months=3,
+        random_seed=seed,
+    )
@@ -0,0 +1,210 @@
+"""
+Benchmark de la API.
+
+Uso:
+    python -m benchmarks.run --db /tmp/bench.sqlite --seed --output bench.json
+    python -m benchmarks.run --base-url http://localhost:8000 --scenarios menu_reads
+
+Sin --base-url la app corre en proceso via ASGITransport de httpx (sin red).
+Con --base-url se usa un uvicorn ya levantado apuntando a la misma base.
+El reporte JSON incluye throughput y p50/p95/p99 por endpoint.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict:
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        "count": count,
+        "rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(values) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+async def run_scenario(client, ctx, name, build_request, requests, concurrency, seed):
+    latencies: dict[str, list[float]] = defaultdict(list)
+    statuses: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    errors = 0
+    remaining = requests
+
+    async def worker(worker_id: int):
+        nonlocal remaining, errors
+        rng = random.Random(seed + worker_id)
+        while remaining > 0:
+            remaining -= 1
+            label, method, url, kwargs = build_request(ctx, rng)
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except Exception:
+                errors += 1
+                continue
+            latencies[label].append(time.perf_counter() - start)
+            statuses[label][response.status_code] += 1
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(values) for values in latencies.values())
+    return {
+        "requests": total,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "endpoints": {
+            label: {
+                **summarize(values, elapsed),
+                "status": dict(statuses[label]),
+            }
+            for label, values in sorted(latencies.items())
+        },
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args) -> dict:
+    import httpx
+
+    from benchmarks.scenarios import SCENARIOS, build_context
+
+    dataset = None
+    if args.seed:
+        from benchmarks.dataset import seed_dataset
+
+        started = time.perf_counter()
+        dataset = seed_dataset(args.users, args.tables, args.orders, seed=args.rng_seed)
+        dataset["seed_seconds"] = round(time.perf_counter() - started, 2)
+        print(f"Dataset cargado: {dataset}", file=sys.stderr)
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+        mode = "uvicorn"
+    else:
+        from app.main import app
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            timeout=args.timeout,
+        )
+        mode = "in-process"
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "mode": mode,
+            "base_url": args.base_url,
+            "python": platform.python_version(),
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "dataset": dataset,
+        },
+        "scenarios": {},
+    }
+
+    async with client:
+        ctx = await build_context(client)
+        for name in args.scenarios:
+            print(f"Ejecutando escenario {name}...", file=sys.stderr)
+            report["scenarios"][name] = await run_scenario(
+                client,
+                ctx,
+                name,
+                SCENARIOS[name],
+                args.requests,
+                args.concurrency,
+                args.rng_seed,
+            )
+
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de la API RESTO")
+    parser.add_argument("--db", help="Archivo SQLite a usar (define STRCNX)")
+    parser.add_argument("--seed", action="store_true", help="Recrear y cargar la base")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--tables", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=10000)
+    parser.add_argument("--base-url", help="Usar un servidor corriendo en vez de ASGI")
+    parser.add_argument(
+        "--scenarios",
+        default="login_burst,order_intake,kitchen_polling,menu_reads",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--rng-seed", type=int, default=42)
+    parser.add_argument("--output", help="Archivo JSON de salida (por defecto stdout)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+
+    # La configuracion se lee al importar app.config, hay que fijarla antes
+    if arguments.db:
+        os.environ["STRCNX"] = f"sqlite:///{Path(arguments.db).resolve()}"
+    os.environ.setdefault("DEBUG", "0")
+    # Un solo cliente hace todos los logins: sin esto login_burst mide 429
+    os.environ.setdefault("LOGIN_MAX_PER_IP", "0")
+    os.environ.setdefault("LOGIN_MAX_PER_EMAIL", "0")
+    # Todas las tablets simuladas comparten token: mediria los limites por ruta
+    os.environ.setdefault("RATE_LIMITS_ENABLED", "0")
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+    from benchmarks.scenarios import SCENARIOS
+
+    unknown = [name for name in arguments.scenarios if name not in SCENARIOS]
+    if unknown:
+        sys.exit(f"Escenarios desconocidos: {', '.join(unknown)}")
+
+    result = asyncio.run(main(arguments))
+    output = json.dumps(result, indent=2)
+
+    if arguments.output:
+        Path(arguments.output).write_text(output + "\n", encoding="utf-8")
+        print(f"Reporte escrito en {arguments.output}", file=sys.stderr)
+    else:
+        print(output)
@@ -0,0 +1,111 @@
+"""
+Escenarios de carga que replican el uso real del restaurante.
+
+Cada escenario genera requests (etiqueta, metodo, url, kwargs) a partir del
+contexto descubierto via API, asi funcionan igual contra la app en proceso o
+contra un uvicorn corriendo.
+"""
+
+import random
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from benchmarks.dataset import ADMIN_EMAIL, BENCH_PASSWORD
+
+
+@dataclass
+class BenchContext:
+    admin_headers: dict
+    emails: list[str] = field(default_factory=list)
+    waiter_ids: list[int] = field(default_factory=list)
+    table_ids: list[int] = field(default_factory=list)
+    menu_prices: dict[int, Decimal] = field(default_factory=dict)
+    categories: list[str] = field(default_factory=list)
+
+
+async def build_context(client) -> BenchContext:
+    """Hace login como admin y descubre ids de mozos, mesas y menu."""
+    response = await client.post(
+        "/api/auth/login", json={"email": ADMIN_EMAIL, "password": BENCH_PASSWORD}
+    )
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    ctx = BenchContext(admin_headers=headers)
+
+    users = (
+        await client.get("/api/users/", params={"limit": 500}, headers=headers)
+    ).json()
+    ctx.emails = [user["email"] for user in users]
+
+    tables = (await client.get("/api/tables/", headers=headers)).json()
+    ctx.table_ids = [table["id"] for table in tables]
+    ctx.waiter_ids = sorted({table["waiter_id"] for table in tables})
+
+    menu = (await client.get("/api/menu/", headers=headers)).json()
+    ctx.menu_prices = {item["id"]: Decimal(str(item["price"])) for item in menu}
+    ctx.categories = sorted({item["category"] for item in menu if item["category"]})
+
+    if not (ctx.emails and ctx.table_ids and ctx.menu_prices):
+        raise RuntimeError(
+            "La base no tiene datos suficientes, ejecute el benchmark con --seed"
+        )
+    return ctx
+
+
+def login_burst(ctx: BenchContext, rng: random.Random):
+    email = rng.choice(ctx.emails)
+    return (
+        "POST /api/auth/login",
+        "POST",
+        "/api/auth/login",
+        {"json": {"email": email, "password": BENCH_PASSWORD}},
+    )
+
+
+def order_intake(ctx: BenchContext, rng: random.Random):
+    items = rng.sample(list(ctx.menu_prices), min(rng.randint(1, 5), len(ctx.menu_prices)))
+    total = sum(ctx.menu_prices[i] for i in items)
+    waiter_id = rng.choice(ctx.waiter_ids)
+    table_id = rng.choice(ctx.table_ids)
+    return (
+        "POST /api/orders/{waiter_id}/{table_id}",
+        "POST",
+        f"/api/orders/{waiter_id}/{table_id}",
+        {
+            "json": {"total": str(total), "menu_item_ids": items},
+            "headers": ctx.admin_headers,
+        },
+    )
+
+
+def kitchen_polling(ctx: BenchContext, rng: random.Random):
+    # La cocina consulta sobre todo por mesa y cada tanto la lista completa
+    if rng.random() < 0.9:
+        table_id = rng.choice(ctx.table_ids)
+        return (
+            "GET /api/orders/{table_id}",
+            "GET",
+            f"/api/orders/{table_id}",
+            {"headers": ctx.admin_headers},
+        )
+    return ("GET /api/orders/", "GET", "/api/orders/", {"headers": ctx.admin_headers})
+
+
+def menu_reads(ctx: BenchContext, rng: random.Random):
+    if ctx.categories and rng.random() < 0.5:
+        category = rng.choice(ctx.categories)
+        return (
+            "GET /api/menu/search/{category}",
+            "GET",
+            f"/api/menu/search/{category}",
+            {"headers": ctx.admin_headers},
+        )
+    return ("GET /api/menu/", "GET", "/api/menu/", {"headers": ctx.admin_headers})
+
+
+SCENARIOS = {
+    "login_burst": login_burst,
+    "order_intake": order_intake,
+    "kitchen_polling": kitchen_polling,
+    "menu_reads": menu_reads,
+}
@@ -0,0 +1,148 @@
+"""
+Tiempo de arranque de un worker de la API.
+
+Uso:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --top 40 --budget-ms 1500
+    python -m benchmarks.startup --json startup.json
+
+Levanta un interprete limpio con `-X importtime`, importa `app.main` y corre el
+startup del lifespan (warmup incluido, sin el worker de tareas ni el relay).
+Informa los modulos que mas tardan en importarse, el total por paquete y el
+tiempo hasta que el worker acepta trafico. Termina con codigo 1 si se supera
+--budget-ms o si se cargo un modulo que no debe estar en la API (HEAVY_MODULES).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Solo los usan los scripts de mantenimiento o endpoints puntuales
+HEAVY_MODULES = ("alembic", "faker", "numpy")
+
+CHILD = """
+import asyncio, json, sys, time
+
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+async def startup():
+    async with app.router.lifespan_context(app):
+        pass
+
+asyncio.run(startup())
+ready = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """Filas de `-X importtime`: tiempo propio y acumulado (ms) por modulo."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append(
+            {
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+    return rows
+
+
+def by_package(rows: list[dict]) -> dict[str, float]:
+    totals: dict[str, float] = defaultdict(float)
+    for row in rows:
+        totals[row["module"].split(".")[0]] += row["self_ms"]
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def measure() -> dict:
+    env = dict(os.environ)
+    # Solo interesa el camino hasta aceptar trafico
+    env.update(JOBS_WORKER_IN_APP="0", OUTBOX_RELAY_IN_APP="0", DEBUG="0")
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode:
+        sys.exit(process.stderr[-4000:])
+
+    child = json.loads(process.stdout.strip().splitlines()[-1])
+    heavy = sorted(
+        name
+        for name in child["modules"]
+        if name.split(".")[0] in HEAVY_MODULES and "." not in name
+    )
+    return {
+        "import_ms": round(child["import_ms"], 1),
+        "startup_ms": round(child["startup_ms"], 1),
+        "total_ms": round(child["import_ms"] + child["startup_ms"], 1),
+        "heavy_modules": heavy,
+        "modules": parse_importtime(process.stderr),
+    }
+
+
+def report(result: dict, top: int) -> list[str]:
+    rows = sorted(result["modules"], key=lambda row: row["cumulative_ms"], reverse=True)
+    lines = [f"{'acumulado':>10} {'propio':>8}  modulo"]
+    for row in rows[:top]:
+        lines.append(
+            f"{row['cumulative_ms']:>8.1f}ms {row['self_ms']:>6.1f}ms  {row['module']}"
+        )
+
+    lines += ["", "Por paquete (tiempo propio):"]
+    for package, total in list(by_package(result["modules"]).items())[:top]:
+        lines.append(f"{total:>8.1f}ms  {package}")
+
+    lines += [
+        "",
+        f"import app.main: {result['import_ms']:.1f} ms",
+        f"startup (lifespan + warmup): {result['startup_ms']:.1f} ms",
+        f"total hasta aceptar trafico: {result['total_ms']:.1f} ms",
+    ]
+    if result["heavy_modules"]:
+        lines.append(f"Modulos pesados cargados: {', '.join(result['heavy_modules'])}")
+    return lines
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de arranque de la API")
+    parser.add_argument("--top", type=int, default=25, help="Modulos a listar")
+    parser.add_argument(
+        "--budget-ms", type=float, help="Falla si el total supera este valor"
+    )
+    parser.add_argument("--json", help="Guardar el resultado completo en un archivo")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    result = measure()
+    print("\n".join(report(result, arguments.top)))
+
+    if arguments.json:
+        Path(arguments.json).write_text(json.dumps(result, indent=2) + "\n")
+
+    failed = bool(result["heavy_modules"])
+    if arguments.budget_ms is not None and result["total_ms"] > arguments.budget_ms:
+        print(f"Presupuesto excedido: {arguments.budget_ms:.0f} ms", file=sys.stderr)
+        failed = True
+    sys.exit(1 if failed else 0)
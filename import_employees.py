@@ -0,0 +1,45 @@
+"""
+Alta masiva de empleados desde un archivo CSV o JSON (ver app/resto/importer.py).
+
+    python import_employees.py empleados.csv
+    python import_employees.py empleados.json --dry-run
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+from app.config import IMPORT_BATCH_SIZE
+from app.resto.importer import import_employees, parse_employees
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Importar empleados")
+    parser.add_argument("path", type=Path, help="Archivo .csv o .json")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Solo validar, sin escribir"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    content_type = "json" if args.path.suffix.lower() == ".json" else "csv"
+    try:
+        rows = parse_employees(args.path.read_bytes(), content_type)
+    except ValueError as e:
+        sys.exit(f"No se pudo leer {args.path}: {e}")
+
+    started = time.perf_counter()
+    result = import_employees(rows, batch_size=args.batch_size, dry_run=args.dry_run)
+    print(
+        f"Import completado en {time.perf_counter() - started:.1f}s: "
+        f"{result['created']} creados, {result['failed']} con errores"
+    )
+    for error in result["errors"]:
+        print(json.dumps(error, ensure_ascii=False))
@@ -0,0 +1,42 @@
+"""
+Borra definitivamente las filas con borrado logico mas viejas que la
+retencion (usuarios, mesas e items de menu) y compacta la base.
+
+    python purge_deleted.py
+    python purge_deleted.py --days 30 --batch-size 1000 --no-vacuum
+"""
+
+import argparse
+import logging
+import time
+
+from app.config import PURGE_BATCH_SIZE, PURGE_RETENTION_DAYS
+from app.maintenance.purge import purge_soft_deleted
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Purgar filas borradas")
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=PURGE_RETENTION_DAYS,
+        help="Dias de retencion desde deleted_at",
+    )
+    parser.add_argument("--batch-size", type=int, default=PURGE_BATCH_SIZE)
+    parser.add_argument(
+        "--no-vacuum",
+        dest="vacuum",
+        action="store_false",
+        help="No correr VACUUM/ANALYZE al final",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    started = time.perf_counter()
+    result = purge_soft_deleted(
+        retention_days=args.days, batch_size=args.batch_size, vacuum=args.vacuum
+    )
+    print(f"Purga completada en {time.perf_counter() - started:.1f}s: {result}")
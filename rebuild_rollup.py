@@ -0,0 +1,29 @@
+"""
+Recalcula el rollup diario de ventas (daily_sales_rollup) desde `orders`.
+
+Sirve para el backfill inicial despues de la migracion y para reparar un rango
+si el rollup quedo inconsistente:
+
+    python rebuild_rollup.py
+    python rebuild_rollup.py --from 2025-10-01 --to 2025-10-31
+"""
+
+import argparse
+import time
+from datetime import date
+
+from app.reports.rollup import rebuild_rollup
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Recalcular el rollup diario")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat)
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    started = time.perf_counter()
+    rows = rebuild_rollup(args.date_from, args.date_to)
+    print(f"Rollup recalculado en {time.perf_counter() - started:.1f}s: {rows} filas")
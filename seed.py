@@ -1,49 +1,444 @@
-from app.config.types import Roles
-from app.resto.services import make_user_role
-from app.user.dto import UserCreateDTO
-from app.user.services import create_user, get_user_by_email, hard_wipe_users
-
-
-def seed(should_wipe: bool):
-    if should_wipe:
-        hard_wipe_users()
-
-    seed_users = [
-        {"name": "Alice", "email": "alice@example.com", "password": "pass123"},
-        {"name": "Bob", "email": "bob@example.com", "password": "pass123"},
-        {"name": "Charlie", "email": "charlie@example.com", "password": "pass123"},
-        {"name": "Diana", "email": "diana@example.com", "password": "pass123"},
-        {"name": "Evan", "email": "evan@example.com", "password": "pass123"},
+"""
+Generador de datos sinteticos para la base SQLite.
+
+Borra y recrea los datos. Sin argumentos carga los usuarios demo (alice..evan,
+con los mismos roles de siempre) y el menu base de seed_menu.py. Con volumenes
+genera ademas miles de empleados, cientos de mesas y millones de ordenes
+repartidas en meses:
+
+    python seed.py --employees 5000 --tables 300 --orders 1000000 --months 6
+
+Todo se inserta con executemany sobre el INSERT compilado de Core, en lotes
+grandes y con los valores ya en el formato de almacenamiento de SQLite, asi
+SQLAlchemy no procesa tipos fila por fila. Las contraseñas se hashean una sola
+vez (todos los usuarios generados usan DEFAULT_PASSWORD).
+"""
+
+import argparse
+import random
+import time
+import unicodedata
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert
+
+from app.config.cnx import engine
+from app.config.sql_models import (
+    Admin,
+    ArchivedOrder,
+    Cashier,
+    Cook,
+    DailySalesRollup,
+    Device,
+    Job,
+    MenuItem,
+    Order,
+    OutboxEvent,
+    OutboxOffset,
+    RefreshToken,
+    RestorantTable,
+    StaffPin,
+    User,
+    UserRole,
+    Waiter,
+    order_menuitem_archive,
+    order_menuitem_association,
+    search_key,
+)
+from app.config.types import OrderStatus, RestaurantTableStatus, Roles
+from app.middlewares.auth import hash_password
+from app.reports.rollup import rebuild_rollup
+
+DEFAULT_PASSWORD = "pass123"
+DEFAULT_BATCH_SIZE = 50_000
+
+DEMO_USERS = [
+    {
+        "name": "Alice",
+        "email": "alice@example.com",
+        "roles": ["cashier", "waiter", "cook"],
+    },
+    {"name": "Bob", "email": "bob@example.com", "roles": ["waiter"]},
+    {"name": "Charlie", "email": "charlie@example.com", "roles": ["cook"]},
+    {"name": "Diana", "email": "diana@example.com", "roles": ["cashier"]},
+    {"name": "Evan", "email": "evan@example.com", "roles": ["admin"]},
+]
+
+# Orden de borrado compatible con las claves foraneas
+WIPE_ORDER = (
+    OutboxOffset.__table__,
+    OutboxEvent.__table__,
+    Job.__table__,
+    DailySalesRollup.__table__,
+    order_menuitem_archive,
+    ArchivedOrder.__table__,
+    order_menuitem_association,
+    Order.__table__,
+    RestorantTable.__table__,
+    RefreshToken.__table__,
+    StaffPin.__table__,
+    Device.__table__,
+    UserRole.__table__,
+    Waiter.__table__,
+    Cook.__table__,
+    Cashier.__table__,
+    Admin.__table__,
+    User.__table__,
+    MenuItem.__table__,
+)
+
+# Peso relativo de cada hora del dia: picos de almuerzo y cena
+HOUR_WEIGHTS = [
+    0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 6, 14, 16, 10, 4, 3, 4, 6, 9, 15, 17, 12, 5,
+]
+EXTRA_CATEGORIES = ["entrada", "plato_principal", "postre", "bebida", "snack"]
+
+# Sufijos "HH:MM:SS.000000" precalculados: formatear fechas fila por fila es
+# lo mas caro de generar millones de ordenes
+_TIME_OF_DAY = [
+    f"{s // 3600:02d}:{s % 3600 // 60:02d}:{s % 60:02d}.000000" for s in range(86400)
+]
+
+
+def _sqlite_datetime(value: datetime) -> str:
+    """Mismo formato que usa el tipo DateTime de SQLAlchemy en SQLite."""
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _ascii_slug(value: str) -> str:
+    normalized = unicodedata.normalize("NFKD", value).encode("ascii", "ignore")
+    return "".join(c for c in normalized.decode().lower() if c.isalnum())
+
+
+def bulk_insert(conn, table, columns: list[str], rows, batch_size: int) -> int:
+    """Inserta tuplas en lotes con executemany sobre el INSERT compilado de Core."""
+    statement = str(insert(table).compile(dialect=conn.dialect, column_keys=columns))
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.exec_driver_sql(statement, batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        conn.exec_driver_sql(statement, batch)
+        total += len(batch)
+    return total
+
+
+def wipe(conn):
+    for table in WIPE_ORDER:
+        conn.execute(delete(table))
+
+
+def build_users(employees: int, rng: random.Random, now: str, password: str):
+    """
+    Retorna filas de usuarios y los ids de usuario por rol. Los usuarios demo
+    van primero para conservar sus ids y credenciales conocidas.
+    """
+    from faker import Faker
+
+    fake = Faker("es_ES")
+    fake.seed_instance(rng.random())
+
+    users = []
+    roles: dict[str, list[int]] = {"waiter": [], "cook": [], "cashier": [], "admin": []}
+
+    for user_id, demo in enumerate(DEMO_USERS, 1):
+        users.append(
+            (
+                user_id,
+                demo["name"],
+                search_key(demo["name"]),
+                demo["email"],
+                password,
+                now,
+                now,
+            )
+        )
+        for role in demo["roles"]:
+            roles[role].append(user_id)
+
+    first_id = len(users) + 1
+    for user_id in range(first_id, first_id + employees):
+        name = fake.name()
+        email = f"{_ascii_slug(name)}.{user_id}@example.com"
+        users.append((user_id, name, search_key(name), email, password, now, now))
+
+        draw = rng.random()
+        role = "waiter" if draw < 0.6 else "cook" if draw < 0.85 else "cashier"
+        roles[role].append(user_id)
+
+    return users, roles
+
+
+def build_menu(extra_items: int, rng: random.Random, now: str):
+    """Menu base de seed_menu.py mas platos generados."""
+    from faker import Faker
+
+    from seed_menu import menu_seed
+
+    fake = Faker("es_ES")
+    fake.seed_instance(rng.random())
+
+    menu = [
+        (i, item.name, item.description, float(item.price), 1, item.category, now, now)
+        for i, item in enumerate(menu_seed, 1)
+    ]
+    for i in range(len(menu) + 1, len(menu) + extra_items + 1):
+        name = f"{fake.word().capitalize()} {fake.word()} #{i}"
+        price = round(rng.uniform(3, 25) * 2) / 2
+        category = rng.choice(EXTRA_CATEGORIES)
+        menu.append((i, name, fake.sentence(nb_words=6), price, 1, category, now, now))
+    return menu
+
+
+def generate_orders(
+    orders: int,
+    months: int,
+    table_ids: list[int],
+    waiter_ids: list[int],
+    menu_prices: dict[int, float],
+    rng: random.Random,
+):
+    """
+    Genera (orden, lineas) en orden cronologico, asi los ids crecen con la
+    fecha como en produccion. Las ordenes de hoy quedan abiertas; las
+    anteriores entregadas salvo un 5% canceladas.
+    """
+    today = datetime.now(timezone.utc).date()
+    days = max(months * 30, 1)
+    start_day = today - timedelta(days=days - 1)
+    per_day, extra = divmod(orders, days)
+
+    menu_ids = list(menu_prices)
+    max_items = min(5, len(menu_ids))
+    hours = list(range(24))
+    open_statuses = [
+        OrderStatus.PENDING.name,
+        OrderStatus.IN_PROGRESS.name,
+        OrderStatus.READY.name,
+        OrderStatus.DELIVERED.name,
+    ]
+
+    order_id = 0
+    for day_index in range(days):
+        day: date = start_day + timedelta(days=day_index)
+        count = per_day + (1 if day_index < extra else 0)
+        if not count:
+            continue
+
+        prefix = day.isoformat() + " "
+        is_today = day == today
+        seconds = sorted(
+            hour * 3600 + rng.randrange(3600)
+            for hour in rng.choices(hours, weights=HOUR_WEIGHTS, k=count)
+        )
+
+        for second in seconds:
+            order_id += 1
+            created = prefix + _TIME_OF_DAY[second]
+            items = rng.sample(menu_ids, rng.randint(1, max_items))
+
+            if is_today:
+                status = rng.choice(open_statuses)
+            elif rng.random() < 0.05:
+                status = OrderStatus.CANCELED.name
+            else:
+                status = OrderStatus.DELIVERED.name
+
+            yield (
+                (
+                    order_id,
+                    rng.choice(table_ids),
+                    rng.choice(waiter_ids),
+                    round(sum(menu_prices[i] for i in items), 2),
+                    status,
+                    created,
+                    created,
+                ),
+                [
+                    (order_id, item_id, menu_prices[item_id])
+                    for item_id in sorted(items)
+                ],
+            )
+
+
+def seed(
+    employees: int = 0,
+    tables: int = 10,
+    orders: int = 0,
+    months: int = 3,
+    menu_items: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    random_seed: int = 42,
+) -> dict:
+    if engine.dialect.name != "sqlite":
+        raise ValueError("El generador escribe en el formato de SQLite")
+
+    rng = random.Random(random_seed)
+    now = _sqlite_datetime(datetime.now(timezone.utc))
+    password = hash_password(DEFAULT_PASSWORD)
+    counts: dict[str, int] = {}
+
+    users, roles = build_users(employees, rng, now, password)
+    menu = build_menu(menu_items, rng, now)
+    menu_prices = {row[0]: row[3] for row in menu}
+
+    waiters = [(n, user_id) for n, user_id in enumerate(roles["waiter"], 1)]
+    cooks = [(n, user_id) for n, user_id in enumerate(roles["cook"], 1)]
+    cashiers = [(n, user_id) for n, user_id in enumerate(roles["cashier"], 1)]
+    admins = [(user_id, now, now) for user_id in roles["admin"]]
+    user_roles = [
+        (user_id, Roles(role).name)
+        for role, user_ids in roles.items()
+        for user_id in user_ids
+    ]
+    waiter_ids = [n for n, _ in waiters]
+
+    table_rows = [
+        (i, rng.choice(waiter_ids), RestaurantTableStatus.AVAILABLE.name, now, now)
+        for i in range(1, tables + 1)
     ]
+    table_ids = [row[0] for row in table_rows]
+
+    with engine.begin() as conn:
+        # Seguro para una carga descartable y mucho mas rapido
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+
+        wipe(conn)
+
+        counts["users"] = bulk_insert(
+            conn,
+            User.__table__,
+            [
+                "id",
+                "name",
+                "name_key",
+                "email",
+                "password",
+                "created_at",
+                "updated_at",
+            ],
+            users,
+            batch_size,
+        )
+        counts["waiters"] = bulk_insert(
+            conn, Waiter.__table__, ["id", "user_id"], waiters, batch_size
+        )
+        counts["cooks"] = bulk_insert(
+            conn, Cook.__table__, ["id", "user_id"], cooks, batch_size
+        )
+        counts["cashiers"] = bulk_insert(
+            conn, Cashier.__table__, ["id", "user_id"], cashiers, batch_size
+        )
+        counts["admins"] = bulk_insert(
+            conn,
+            Admin.__table__,
+            ["id", "created_at", "updated_at"],
+            admins,
+            batch_size,
+        )
+        counts["user_roles"] = bulk_insert(
+            conn, UserRole.__table__, ["user_id", "role"], user_roles, batch_size
+        )
+        counts["tables"] = bulk_insert(
+            conn,
+            RestorantTable.__table__,
+            ["id", "waiter_id", "status", "created_at", "updated_at"],
+            table_rows,
+            batch_size,
+        )
+        counts["menu_items"] = bulk_insert(
+            conn,
+            MenuItem.__table__,
+            [
+                "id",
+                "name",
+                "description",
+                "price",
+                "available",
+                "category",
+                "created_at",
+                "updated_at",
+            ],
+            menu,
+            batch_size,
+        )
 
-    for user_data in seed_users:
-        if not get_user_by_email(user_data["email"]):
-            user_dto = UserCreateDTO(**user_data)
-            create_user(user_dto)
+        counts["orders"] = 0
+        counts["order_lines"] = 0
+        if orders and table_ids:
+            order_batch = []
+            line_batch = []
+            for order, lines in generate_orders(
+                orders, months, table_ids, waiter_ids, menu_prices, rng
+            ):
+                order_batch.append(order)
+                line_batch.extend(lines)
+                if len(order_batch) >= batch_size:
+                    counts["orders"] += _flush_orders(conn, order_batch, line_batch)
+                    counts["order_lines"] += len(line_batch)
+                    order_batch, line_batch = [], []
+            if order_batch:
+                counts["orders"] += _flush_orders(conn, order_batch, line_batch)
+                counts["order_lines"] += len(line_batch)
 
-    try:
-        alice = get_user_by_email("alice@example.com")
-        bob = get_user_by_email("bob@example.com")
-        charlie = get_user_by_email("charlie@example.com")
-        diana = get_user_by_email("diana@example.com")
+    # Las ordenes se insertan sin pasar por los servicios
+    counts["rollup_rows"] = rebuild_rollup() if counts["orders"] else 0
 
-        if alice:
-            make_user_role(alice, role=Roles.CASHIER)
-            make_user_role(alice, role=Roles.WAITER)
-            make_user_role(alice, role=Roles.COOK)
+    return counts
 
-        if bob:
-            make_user_role(bob, role=Roles.WAITER)
 
-        if charlie:
-            make_user_role(charlie, role=Roles.COOK)
+def _flush_orders(conn, order_batch: list, line_batch: list) -> int:
+    inserted = bulk_insert(
+        conn,
+        Order.__table__,
+        [
+            "id",
+            "table_id",
+            "waiter_id",
+            "total",
+            "status",
+            "created_at",
+            "updated_at",
+        ],
+        order_batch,
+        len(order_batch),
+    )
+    bulk_insert(
+        conn,
+        order_menuitem_association,
+        ["order_id", "menu_item_id", "price"],
+        line_batch,
+        len(line_batch),
+    )
+    return inserted
 
-        if diana:
-            make_user_role(diana, role=Roles.CASHIER)
 
-    except Exception as e:
-        print("Error during seed: ", e)
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generador de datos sinteticos")
+    parser.add_argument("--employees", type=int, default=0, help="Empleados generados")
+    parser.add_argument("--tables", type=int, default=10)
+    parser.add_argument("--orders", type=int, default=0)
+    parser.add_argument("--months", type=int, default=3, help="Meses de historial")
+    parser.add_argument("--menu-items", type=int, default=0, help="Platos extra")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=42, help="Semilla aleatoria")
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    seed(True)
+    args = parse_args()
+    started = time.perf_counter()
+    result = seed(
+        employees=args.employees,
+        tables=args.tables,
+        orders=args.orders,
+        months=args.months,
+        menu_items=args.menu_items,
+        batch_size=args.batch_size,
+        random_seed=args.seed,
+    )
+    print(f"Seed completado en {time.perf_counter() - started:.1f}s: {result}")
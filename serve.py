@@ -0,0 +1,144 @@
+"""
+Entrada de produccion: varios procesos uvicorn sobre un mismo socket.
+
+El proceso padre abre el socket y levanta N workers (por defecto uno por CPU).
+El supervisor de uvicorn reinicia los workers que mueren; aca se agrega:
+
+- reinicio escalonado con SIGHUP: por cada worker se levanta el reemplazo, se
+  espera a que arranque y recien ahi se termina el viejo (que drena sus
+  requests en curso), asi nunca queda el servicio con un worker menos;
+- reciclado por cantidad de requests (--max-requests) con jitter por worker
+  para que no se reinicien todos a la vez.
+
+    python serve.py --workers 4 --max-requests 10000 --max-requests-jitter 1000
+    kill -HUP <pid del padre>   # reinicio escalonado (deploy)
+    kill -TTIN / -TTOU <pid>    # agregar / quitar un worker
+
+Con mas de un worker el relay del outbox queda apagado en la API (cada
+proceso entregaria los mismos eventos, salvo --relay-in-app); correrlo aparte
+con `python worker.py --relay`.
+"""
+
+import argparse
+import logging
+import os
+import random
+import time
+
+import uvicorn
+from uvicorn.supervisors.multiprocess import Multiprocess, Process
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class RecyclingServer(uvicorn.Server):
+    """Server que suma un jitter propio a limit_max_requests al arrancar."""
+
+    def __init__(self, config: uvicorn.Config, max_requests_jitter: int = 0):
+        super().__init__(config)
+        self.max_requests_jitter = max_requests_jitter
+
+    def run(self, sockets=None):
+        if self.config.limit_max_requests and self.max_requests_jitter:
+            self.config.limit_max_requests += random.randint(
+                0, self.max_requests_jitter
+            )
+        return super().run(sockets=sockets)
+
+
+class RollingMultiprocess(Multiprocess):
+    """Supervisor con reinicio escalonado: arranca el reemplazo antes de parar."""
+
+    def __init__(self, *args, warmup: float = 5.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.warmup = warmup
+
+    def restart_all(self) -> None:
+        for idx, old in enumerate(list(self.processes)):
+            new = Process(self.config, self.target, self.sockets)
+            new.start()
+            if not new.is_alive(timeout=self.warmup + 5):
+                logger.error("Replacement worker [%s] did not start", new.pid)
+            # El ping responde antes del startup de la app: darle tiempo
+            time.sleep(self.warmup)
+
+            self.processes[idx] = new
+            old.terminate()
+            old.join()
+            logger.info("Worker [%s] replaced by [%s]", old.pid, new.pid)
+
+
+def parse_args(argv=None):
+    from app.config import HOST, PORT
+
+    parser = argparse.ArgumentParser(description="Servidor de produccion")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY") or os.cpu_count() or 1),
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=int(os.getenv("MAX_REQUESTS") or 0),
+        help="Reciclar cada worker despues de N requests (0 = nunca)",
+    )
+    parser.add_argument(
+        "--max-requests-jitter",
+        type=int,
+        default=int(os.getenv("MAX_REQUESTS_JITTER") or 0),
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=30,
+        help="Segundos para terminar requests en curso al parar un worker",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=float,
+        default=5.0,
+        help="Espera entre arrancar un reemplazo y parar el viejo en SIGHUP",
+    )
+    parser.add_argument("--keep-alive", type=int, default=5)
+    parser.add_argument(
+        "--relay-in-app",
+        action="store_true",
+        help="Mantener el relay del outbox en los workers aunque sean varios",
+    )
+    return parser.parse_args(argv)
+
+
+def main(args):
+    # Los workers heredan el entorno; load_dotenv no pisa variables existentes
+    if args.workers > 1 and not args.relay_in_app:
+        os.environ["OUTBOX_RELAY_IN_APP"] = "0"
+
+    config = uvicorn.Config(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        reload=False,
+        limit_max_requests=args.max_requests or None,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        timeout_keep_alive=args.keep_alive,
+        proxy_headers=True,
+    )
+    server = RecyclingServer(config, max_requests_jitter=args.max_requests_jitter)
+
+    if args.workers <= 1:
+        server.run()
+        return
+
+    sock = config.bind_socket()
+    RollingMultiprocess(
+        config, target=server.run, sockets=[sock], warmup=args.warmup
+    ).run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main(parse_args())
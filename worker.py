@@ -0,0 +1,53 @@
+"""
+Worker de tareas en segundo plano como proceso independiente.
+
+Util cuando la API corre con varios procesos y JOBS_WORKER_IN_APP=0. Con
+--relay tambien corre el relay del outbox (para OUTBOX_RELAY_IN_APP=0):
+
+    python worker.py
+    python worker.py --relay
+    python worker.py --once
+"""
+
+import argparse
+import logging
+
+from app.events.relay import outbox_relay
+from app.jobs.registry import load_tasks
+from app.jobs.worker import JobWorker
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Worker de tareas")
+    parser.add_argument("--once", action="store_true", help="Procesar un lote y salir")
+    parser.add_argument("--poll", type=float, help="Segundos entre consultas")
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument(
+        "--relay", action="store_true", help="Correr tambien el relay del outbox"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    options = {}
+    if args.poll is not None:
+        options["poll_seconds"] = args.poll
+    if args.batch_size is not None:
+        options["batch_size"] = args.batch_size
+    worker = JobWorker(**options)
+
+    if args.once:
+        load_tasks()
+        print(f"Procesadas {worker.run_once()} tareas")
+    else:
+        if args.relay:
+            outbox_relay.start()
+        try:
+            worker.run_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            outbox_relay.stop()